@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from rate_limiter import RequestBudget
+
+BASE_URL = "https://cricbuzz-cricket.p.rapidapi.com"
+API_HOST = "cricbuzz-cricket.p.rapidapi.com"
+
+# "4ade6f2361msh57ccf4cb0584770p18e418jsnc58ddc583a78" - not working key (284 id)
+# "99cf81f013msh29100b8d02b6b9dp161532jsnd6a92c813a77" - working key (secondary)
+API_KEY = os.environ.get("RAPIDAPI_KEY", "17c4bae87fmsh204730bfc3da945p101869jsn2a8ef0d22e5d")
+
+# Seconds to wait for each endpoint
+DEFAULT_TIMEOUTS = {
+    "live": 15,
+    "recent": 15,
+    "hscard": 10,
+    "comm": 10
+}
+
+# Transient server errors worth retrying. Never 429s - retrying those would only burn more of the quota
+RETRY_STATUSES = frozenset([500, 502, 503, 504])
+
+
+class CricbuzzClient:
+    """Shared client for all Cricbuzz API calls, backed by one pooled keep-alive session"""
+
+    def __init__(self, api_key=API_KEY, base_url=BASE_URL, timeouts=None,
+                 retries=2, backoff_factor=0.5, pool_size=4, budget=None, recorder=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+
+        # Quota shared by every call made through this client
+        self.budget = budget if budget else RequestBudget()
+
+        # Optional SnapshotRecorder that saves every new response for offline replay
+        self.recorder = recorder
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "x-rapidapi-key": api_key,
+            "x-rapidapi-host": API_HOST
+        })
+
+        # Connection errors, timeouts and RETRY_STATUSES are retried by get() rather than by urllib3,
+        # so every attempt is spent from the budget
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # ETag / Last-Modified and body digest of the last 200 response per URL, for callers
+        # that don't keep their own
+        self._validators = {}
+        self._validators_lock = threading.Lock()
+
+    def get(self, endpoint, path, conditional=False, key="all", validators=None):
+        """GET a path using the timeout configured for the endpoint (key names it for the recorder)
+
+        With conditional=True the validators from the previous response are sent
+        and response.unchanged is True on a 304 or a byte-identical body. Windows
+        sharing the client pass their own validators dict (URL -> validators): "unchanged"
+        then means unchanged since that caller's last response, not anyone's.
+        Failed attempts are retried up to retries times, each one spending a request from
+        the budget. Raises QuotaExhausted without sending anything if the budget is spent.
+        """
+        url = self.base_url + path
+        headers = {}
+        store = self._validators if validators is None else validators
+        with self._validators_lock:
+            previous = store.get(url, {})
+        if conditional:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        response = self._send(url, headers, self.timeouts.get(endpoint, 10))
+        response.unchanged = False
+
+        if response.status_code == 304:
+            response.unchanged = conditional and bool(previous)
+        elif response.status_code == 200:
+            digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            response.unchanged = conditional and previous.get("digest") == digest
+            with self._validators_lock:
+                store[url] = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "digest": digest
+                }
+            if self.recorder and not response.unchanged:
+                self.recorder.record(endpoint, key, response.content)
+
+        return response
+
+    def _send(self, url, headers, timeout):
+        """GET url, retrying connection errors, timeouts and transient server errors with backoff"""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+            self.budget.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                continue
+            self.budget.sync(response)
+            if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                return response
+            response.close()
+
+    def live_matches(self):
+        """Fetch the list of live matches"""
+        return self.get("live", "/matches/v1/live")
+
+    def recent_matches(self):
+        """Fetch the list of recent matches"""
+        return self.get("recent", "/matches/v1/recent")
+
+    def scorecard(self, match_id, conditional=False, validators=None):
+        """Fetch the full scorecard for a match"""
+        return self.get("hscard", f"/mcenter/v1/{match_id}/hscard", conditional=conditional, key=match_id,
+                        validators=validators)
+
+    def commentary(self, match_id, conditional=False, validators=None):
+        """Fetch the latest commentary for a match, including the summary of each finished over"""
+        return self.get("comm", f"/mcenter/v1/{match_id}/comm", conditional=conditional, key=match_id,
+                        validators=validators)
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,1768 @@
+"""Benchmarks for the cricket dashboard.
+
+Usage:
+    python benchmark.py refresh [--repeat N]
+    python benchmark.py soak [--refreshes N]
+    python benchmark.py http [--requests N]
+    python benchmark.py selection [--latency MS]
+    python benchmark.py cache [--latency MS]
+    python benchmark.py budget [--per-day N]
+    python benchmark.py fixtures DIR [--overs N]
+    python benchmark.py replay [--duration S]
+    python benchmark.py suite [--output FILE] [--compare FILE]
+    python benchmark.py stats [--refreshes N] [--rounds N]
+    python benchmark.py memory [--snapshots N]
+    python benchmark.py timeline [--overs N]
+    python benchmark.py series [--days N]
+    python benchmark.py monitor [--matches N]
+    python benchmark.py timer [--toggles N]
+    python benchmark.py cards [--matches N]
+    python benchmark.py matchlist [--matches N]
+    python benchmark.py search [--matches N]
+    python benchmark.py switch [--trials N]
+    python benchmark.py frames [--seconds N]
+    python benchmark.py prefetch [--hours N]
+    python benchmark.py session [--latency MS]
+    python benchmark.py startup [--repeat N]
+
+Scenarios that build Tk widgets need a display (use xvfb-run on headless boxes).
+The suite scenario runs without one and skips only the Treeview timings.
+"""
+import argparse
+import copy
+import gc
+import itertools
+import json
+import os
+import platform
+import queue
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tkinter as tk
+import tracemalloc
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tkinter import ttk
+
+import matplotlib
+import requests
+
+from api_client import CricbuzzClient
+from dashboard import CricketDashboard, load_analysis_modules
+from fetcher import FetchExecutor
+from match_diff import diff_match_list
+from match_search import SEARCH_FIELDS, MatchIndex
+from match_stats import MatchStats, rank, stats_for
+from monitor import PollScheduler
+from prefetch import PREFETCH_MATCHES, PREFETCH_PER_HOUR, PREFETCH_TTL, ScorecardPrefetcher
+from rate_limiter import QuotaExhausted, RequestBudget
+from refresh import RefreshTimer, match_state
+from render_scheduler import RenderScheduler
+from replay_client import ReplayClient, SnapshotRecorder
+from response_cache import ResponseCache
+from timeline import DeliveryTimeline, ScoreHistory, parse_commentary, parse_delivery
+
+TEAMS = [
+    (2, "India", "IND"),
+    (4, "Australia", "AUS"),
+    (9, "England", "ENG"),
+    (13, "New Zealand", "NZ")
+]
+
+
+def make_hscard_payload(match_id=100000, innings=2, overs=20, seed=0):
+    """Build a synthetic hscard response shaped like the Cricbuzz API"""
+    rng = random.Random(seed)
+    team1, team2 = TEAMS[seed % 2], TEAMS[2 + seed % 2]
+
+    score_card = []
+    for inning_no in range(innings):
+        bat_team, bowl_team = (team1, team2) if inning_no % 2 == 0 else (team2, team1)
+
+        # Split the innings' balls across the batting order
+        balls_left = overs * 6
+        batsmen = {}
+        for i in range(11):
+            balls = max(1, min(balls_left, rng.randint(5, overs * 2)))
+            balls_left = max(0, balls_left - balls)
+            runs = int(balls * rng.uniform(0.5, 1.7))
+            sixes = rng.randint(0, runs // 18)
+            fours = rng.randint(0, max(0, (runs - sixes * 6) // 8))
+            batsmen[f"bat_{i + 1}"] = {
+                "batName": f"{bat_team[2]} Batter {i + 1}",
+                "runs": runs,
+                "balls": balls,
+                "fours": fours,
+                "sixes": sixes
+            }
+
+        # Spread the overs across five or six bowlers
+        bowlers = {}
+        bowler_count = rng.randint(5, 6)
+        overs_left = overs
+        for i in range(bowler_count):
+            spell = overs_left if i == bowler_count - 1 else max(1, overs // bowler_count)
+            overs_left -= spell
+            bowlers[f"bowl_{i + 1}"] = {
+                "bowlName": f"{bowl_team[2]} Bowler {i + 1}",
+                "overs": float(spell),
+                "maidens": rng.randint(0, max(0, spell // 8)),
+                "runs": int(spell * rng.uniform(4.0, 10.0)),
+                "wickets": rng.randint(0, 3)
+            }
+
+        score_card.append({
+            "inningsId": inning_no + 1,
+            "batTeamDetails": {
+                "batTeamId": bat_team[0],
+                "batTeamName": bat_team[1],
+                "batTeamShortName": bat_team[2],
+                "batsmenData": batsmen
+            },
+            "bowlTeamDetails": {
+                "bowlTeamId": bowl_team[0],
+                "bowlTeamName": bowl_team[1],
+                "bowlTeamShortName": bowl_team[2],
+                "bowlersData": bowlers
+            },
+            "scoreDetails": {
+                "overs": float(overs),
+                "runs": sum(b["runs"] for b in batsmen.values()) + rng.randint(0, 15),
+                "wickets": min(10, sum(b["wickets"] for b in bowlers.values()))
+            }
+        })
+
+    return {
+        "matchId": match_id,
+        "matchDesc": "1st Match",
+        "matchType": "TEST" if innings > 2 else "T20" if overs <= 20 else "ODI",
+        "seriesName": "Benchmark Series",
+        "seriesId": 1,
+        "status": f"{team1[1]} won by 12 runs",
+        "venueInfo": {"ground": "Benchmark Oval", "city": "Nowhere", "country": "Nowhere"},
+        "tossInfo": f"{team1[1]} elected to bat",
+        "scoreCard": score_card
+    }
+
+
+def make_over_summaries(innings=2, overs=20, seed=0):
+    """Ball-by-ball summaries for a synthetic match: innings number -> one list of tokens per over"""
+    rng = random.Random(seed)
+    tokens = ["0", "0", "1", "1", "1", "2", "3", "4", "6", "W", "Wd", "1Lb"]
+    weights = [30, 10, 25, 10, 5, 8, 1, 8, 3, 2, 2, 1]
+    summaries = {}
+    for inning_no in range(1, innings + 1):
+        summaries[inning_no] = []
+        for _ in range(overs):
+            over = rng.choices(tokens, weights, k=6)
+            # Wides and no-balls are bowled again, so add another delivery for each
+            over += rng.choices(tokens[:9], weights[:9], k=sum(token.endswith("Wd") for token in over))
+            summaries[inning_no].append(over)
+    return summaries
+
+
+def make_commentary_payload(summaries, balls_bowled, window=12):
+    """Commentary response with over separators for the most recent finished overs, newest first"""
+    items = []
+    for inning_no, inning_overs in summaries.items():
+        score = 0
+        for over, tokens in enumerate(inning_overs[:max(0, balls_bowled) // 6], start=1):
+            runs = sum(parse_delivery(token)[0] for token in tokens)
+            score += runs
+            items.append({
+                "inningsId": inning_no,
+                "overSeparator": {
+                    "inningsId": inning_no,
+                    "overNum": over - 0.4,  # Cricbuzz writes the end of the 20th over as 19.6
+                    "o_summary": " ".join(tokens) + " ",
+                    "runs": runs,
+                    "score": score
+                }
+            })
+        balls_bowled -= len(inning_overs) * 6
+        if balls_bowled <= 0:
+            break
+    return {"commentaryList": items[::-1][:window]}
+
+
+def make_match_list_payload(count, state="In Progress", seed=0):
+    """Build a synthetic live/recent match list shaped like the Cricbuzz API"""
+    rng = random.Random(seed)
+    matches = []
+    for i in range(count):
+        team1, team2 = rng.sample(TEAMS, 2)
+        matches.append({
+            "matchInfo": {
+                "matchId": 100000 + seed * 10000 + i,
+                "matchDesc": f"{i + 1}th Match",
+                "matchFormat": rng.choice(["T20", "ODI", "TEST"]),
+                "status": f"{team1[1]} need {rng.randint(1, 120)} runs" if state == "In Progress" else f"{team1[1]} won",
+                "state": state,
+                "team1": {"teamName": team1[1]},
+                "team2": {"teamName": team2[1]},
+                "venueInfo": {"ground": "Benchmark Oval", "city": "Nowhere"}
+            },
+            "matchScore": {
+                "team1Score": {"inngs1": {"runs": rng.randint(100, 350), "wickets": rng.randint(0, 10), "overs": 50}},
+                "team2Score": {"inngs1": {"runs": rng.randint(0, 350), "wickets": rng.randint(0, 10), "overs": rng.randint(1, 50)}}
+            }
+        })
+
+    return {
+        "typeMatches": [{
+            "matchType": "International",
+            "seriesMatches": [{"seriesAdWrapper": {"seriesName": "Benchmark Series", "matches": matches}}]
+        }]
+    }
+
+
+def bowl_delivery(payload, runs=1):
+    """Add one scoring delivery to the last innings of an hscard payload, in place"""
+    inning = payload["scoreCard"][-1]
+    batsman = next(iter(inning["batTeamDetails"]["batsmenData"].values()))
+    bowler = next(iter(inning["bowlTeamDetails"]["bowlersData"].values()))
+    batsman["runs"] += runs
+    batsman["balls"] += 1
+    bowler["runs"] += runs
+    inning["scoreDetails"]["runs"] += runs
+    return payload
+
+
+def cricket_overs(balls):
+    """Balls as overs in cricket notation (3 overs and 4 balls is 3.4)"""
+    return float(f"{balls // 6}.{balls % 6}")
+
+
+def snapshot_at(payload, balls_bowled):
+    """Copy of a completed hscard payload as it stood after a number of deliveries"""
+    snapshot = copy.deepcopy(payload)
+    innings = []
+    for inning in snapshot["scoreCard"]:
+        if balls_bowled <= 0:
+            break
+        score = inning["scoreDetails"]
+        total_balls = int(score["overs"]) * 6
+        bowled = min(balls_bowled, total_balls)
+        progress = bowled / total_balls
+        balls_bowled -= total_balls
+
+        # Batters come in one after another, each facing their share of the deliveries
+        batsmen = {}
+        faced_before = 0
+        for key, batter in inning["batTeamDetails"]["batsmenData"].items():
+            faced = min(batter["balls"], bowled - faced_before)
+            faced_before += batter["balls"]
+            if faced <= 0:
+                break
+            share = faced / batter["balls"]
+            batsmen[key] = dict(batter, balls=faced, runs=int(batter["runs"] * share),
+                                fours=int(batter["fours"] * share), sixes=int(batter["sixes"] * share))
+        inning["batTeamDetails"]["batsmenData"] = batsmen
+
+        # Bowlers take overs in turn until their spells are used up; the card only lists those who have bowled
+        spells = list(inning["bowlTeamDetails"]["bowlersData"].items())
+        quotas = [int(bowler["overs"]) * 6 for _, bowler in spells]
+        balls_by = [0] * len(spells)
+        turn = 0
+        remaining = bowled
+        while remaining > 0:
+            while balls_by[turn] >= quotas[turn]:
+                turn = (turn + 1) % len(spells)
+            over = min(6, remaining, quotas[turn] - balls_by[turn])
+            balls_by[turn] += over
+            remaining -= over
+            turn = (turn + 1) % len(spells)
+
+        bowlers = {}
+        for (key, bowler), quota, balls in zip(spells, quotas, balls_by):
+            if balls:
+                share = balls / quota
+                bowlers[key] = dict(bowler, overs=cricket_overs(balls), runs=int(bowler["runs"] * share),
+                                    wickets=int(bowler["wickets"] * share), maidens=int(bowler["maidens"] * share))
+        inning["bowlTeamDetails"]["bowlersData"] = bowlers
+
+        score["overs"] = cricket_overs(bowled)
+        score["runs"] = int(score["runs"] * progress)
+        score["wickets"] = int(score["wickets"] * progress)
+        innings.append(inning)
+
+    snapshot["scoreCard"] = innings
+    if balls_bowled < 0:
+        snapshot["status"] = "In Progress"
+    return snapshot
+
+
+def write_replay_fixtures(directory, overs=50, innings=2, over_seconds=240, matches=1):
+    """Record synthetic matches, one scorecard snapshot per over, in ReplayClient's layout
+
+    Matches get IDs 100000, 100001, ... and their overs are staggered so their
+    snapshots don't all change at the same moment. Returns the recording's length.
+    """
+    clock = [0.0]
+    recorder = SnapshotRecorder(directory, clock=lambda: clock[0])
+    recorder.record("live", "all", json.dumps(make_match_list_payload(matches if matches > 1 else 8)).encode("utf-8"))
+    recorder.record("recent", "all", json.dumps(make_match_list_payload(10, state="Complete", seed=1)).encode("utf-8"))
+
+    for i in range(matches):
+        payload = make_hscard_payload(match_id=100000 + i, innings=innings, overs=overs, seed=i)
+        summaries = make_over_summaries(innings=innings, overs=overs, seed=i)
+        for over in range(1, overs * innings + 1):
+            clock[0] = (over - 1) * over_seconds + i * over_seconds / matches
+            snapshot = snapshot_at(payload, over * 6)
+            recorder.record("hscard", payload["matchId"], json.dumps(snapshot).encode("utf-8"))
+            commentary = make_commentary_payload(summaries, over * 6)
+            recorder.record("comm", payload["matchId"], json.dumps(commentary).encode("utf-8"))
+    return (overs * innings - 1) * over_seconds + (matches - 1) * over_seconds / matches
+
+
+class BenchDashboard(CricketDashboard):
+    """Dashboard that never touches the network"""
+
+    def __init__(self, root, match_id=None, api=None, cache=None, restore=False):
+        # Keep benchmark runs out of the user's cache directory
+        if cache is None:
+            cache = ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-"))
+        super().__init__(root, match_id=match_id, api=api, cache=cache, restore=restore)
+
+    def fetch_data(self):
+        pass
+
+    def start_auto_refresh(self):
+        pass
+
+
+def stub_client(stub):
+    """Client for a stub server with a budget large enough never to get in the way"""
+    return CricbuzzClient(base_url=stub.url, budget=RequestBudget(per_minute=10 ** 6, per_day=10 ** 6))
+
+
+def time_call(func, repeat):
+    """Run func repeat times and return the durations in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(name, durations):
+    """Print median and p95 for a list of durations"""
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{name:<28} median {statistics.median(ordered):8.1f} ms   p95 {p95:8.1f} ms")
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        # Peak RSS is the best we can do without /proc (kB on Linux, bytes on macOS)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class StubCricbuzzServer:
+    """Local HTTP/1.1 server that serves canned API responses and counts TCP connections"""
+
+    def __init__(self, routes, delay=0.0):
+        stub = self
+        self.routes = routes
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+            disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused connections
+
+            def setup(self):
+                # One handler instance per accepted connection
+                with stub.lock:
+                    stub.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                time.sleep(stub.delay)  # Simulated network round-trip
+                status, payload = stub.routes.get(self.path, (404, {}))
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_bench_dashboard(overs):
+    """Create a dashboard showing a synthetic match"""
+    root = tk.Tk()
+    app = BenchDashboard(root, match_id="bench")
+    app.match_data = app.process_api_data(make_hscard_payload(overs=overs))
+    app.update_info_panel()
+    app.populate_team_dropdown()
+    root.update()
+    return root, app
+
+
+def bench_refresh(args):
+    """Compare refreshing all five tabs against the lazy tab engine"""
+    root, app = start_bench_dashboard(args.overs)
+
+    def eager_refresh():
+        # Previous behaviour: every tab is redrawn on every refresh
+        app.dirty_tabs = dict.fromkeys(app.tab_builders)
+        for tab in app.tab_builders:
+            app.render_tab(tab)
+        root.update_idletasks()
+
+    def lazy_refresh():
+        app.update_dashboard()
+        root.update_idletasks()
+
+    payload = make_hscard_payload(overs=args.overs)
+
+    def delivery_refresh():
+        # A poll where only a couple of numbers changed goes through the diff engine
+        app.apply_match_data(app.process_api_data(bowl_delivery(payload)))
+        app.render.flush()
+        root.update_idletasks()
+
+    report("refresh (all tabs)", time_call(eager_refresh, args.repeat))
+    report("refresh (visible tab only)", time_call(lazy_refresh, args.repeat))
+    report("refresh (one delivery diff)", time_call(delivery_refresh, args.repeat))
+    root.destroy()
+
+
+def bench_soak(args):
+    """Refresh every tab with changing data and track memory use"""
+    root, app = start_bench_dashboard(args.overs)
+    print(f"{'refreshes':>10} {'rss (MB)':>10}")
+
+    for i in range(args.refreshes + 1):
+        if i % args.sample_every == 0:
+            print(f"{i:>10} {current_rss_mb():>10.1f}")
+
+        # New numbers every refresh, then visit each tab so all charts redraw
+        app.match_data = app.process_api_data(make_hscard_payload(overs=args.overs, seed=i))
+        app.update_dashboard()
+        for tab in app.tab_builders:
+            app.notebook.select(tab)
+            app.render_tab(tab)
+        root.update()
+
+    root.destroy()
+
+
+def bench_http(args):
+    """Compare per-call requests.get against the pooled client on a local stub server"""
+    hscard = make_hscard_payload(overs=args.overs)
+    stub = StubCricbuzzServer({
+        "/matches/v1/live": (200, {"typeMatches": []}),
+        "/matches/v1/recent": (200, {"typeMatches": []}),
+        "/mcenter/v1/100000/hscard": (200, hscard)
+    })
+
+    def fetch_cycle_unpooled():
+        for path in ("/matches/v1/live", "/matches/v1/recent", "/mcenter/v1/100000/hscard"):
+            requests.get(stub.url + path, timeout=10).json()
+
+    client = stub_client(stub)
+
+    def fetch_cycle_pooled():
+        client.live_matches().json()
+        client.recent_matches().json()
+        client.scorecard("100000").json()
+
+    for name, cycle in [("requests.get per call", fetch_cycle_unpooled),
+                        ("pooled CricbuzzClient", fetch_cycle_pooled)]:
+        stub.reset()
+        report(name, time_call(cycle, args.requests))
+        print(f"{'':<28} {stub.requests} requests over {stub.connections} connections")
+
+    client.close()
+    stub.close()
+
+
+def bench_selection(args):
+    """Time-to-first-card on the selection screen: sequential vs concurrent list fetches"""
+    stub = StubCricbuzzServer({
+        "/matches/v1/live": (200, make_match_list_payload(args.live)),
+        "/matches/v1/recent": (200, make_match_list_payload(10, state="Complete", seed=1))
+    }, delay=args.latency / 1000)
+    client = stub_client(stub)
+
+    root = tk.Tk()
+    app = BenchDashboard(root, match_id="bench", api=client)
+    app.show_match_selection_screen()
+
+    def wait_for_cards():
+        app.match_list_load_time = None
+        while app.match_list_load_time is None:
+            root.update()
+            time.sleep(0.001)
+
+    wait_for_cards()
+
+    def sequential_load():
+        # Previous behaviour: one request after the other on the Tk thread
+        live = client.live_matches().json()
+        recent = client.recent_matches().json()
+        app.populate_match_selection(live, recent)
+        root.update_idletasks()
+
+    def concurrent_load():
+        app.load_matches_data(force=True)
+        wait_for_cards()
+
+    report("first card (sequential)", time_call(sequential_load, args.repeat))
+    report("first card (concurrent)", time_call(concurrent_load, args.repeat))
+
+    root.destroy()
+    client.close()
+    stub.close()
+
+
+def count_widgets(widget):
+    """Number of Tk widgets under (and including) a widget"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def bench_cards(args):
+    """Selection screen with hundreds of matches: a card per match vs the virtualized lists"""
+    live = make_match_list_payload(args.matches)
+    recent = make_match_list_payload(args.matches, state="Complete", seed=1)
+    root = open_display()
+    if root is None:
+        print(f"{'cards':<28} skipped (needs a display - run under xvfb-run on a headless machine)")
+        return
+    root.deiconify()
+    root.geometry("1600x900")
+    app = BenchDashboard(root, match_id="bench")
+    app.load_matches_data = lambda on_loaded=None, force=False: None
+    app.show_match_selection_screen()
+    root.update()
+
+    def eager_build():
+        # Previous behaviour: a full widget tree for every match, packed into one scrolled frame
+        frame = tk.Frame(root)
+        for match in app.parse_match_list(live) + app.parse_match_list(recent):
+            card = app.create_match_card(frame)
+            app.fill_match_card(card, match)
+            card["frame"].pack(fill=tk.X, pady=5)
+        root.update_idletasks()
+        widgets = count_widgets(frame)
+        frame.destroy()
+        return widgets
+
+    def virtual_build():
+        app.populate_match_selection(live, recent)
+        root.update_idletasks()
+
+    eager_widgets = eager_build()
+    report(f"{2 * args.matches} cards built", time_call(eager_build, args.repeat))
+    report("virtualized lists", time_call(virtual_build, args.repeat))
+    virtual_widgets = count_widgets(app.live_list.canvas) + count_widgets(app.recent_list.canvas)
+    print(f"{'widgets':<28} {eager_widgets:8d} built vs {virtual_widgets} virtualized")
+
+    # Scroll the live list from top to bottom, paging everything in on the way
+    durations = []
+    steps = 0
+    while steps < args.matches and (app.live_list.count < len(app.live_list.items) or
+                                    app.live_list.canvas.yview()[1] < 1.0):
+        start = time.perf_counter()
+        app.live_list.canvas.yview_scroll(1, "pages")
+        root.update_idletasks()
+        durations.append((time.perf_counter() - start) * 1000)
+        steps += 1
+    report("scroll one page", durations)
+    print(f"{'after scrolling':<28} {app.live_list.count} of {len(app.live_list.items)} live matches revealed "
+          f"on {len(app.live_list.cards)} cards")
+    root.destroy()
+
+
+def bench_matchlist(args):
+    """Work per match list refresh on the Tk thread: parse and rebuild everything vs diff by match ID"""
+    rng = random.Random(0)
+    payload = make_match_list_payload(args.matches)
+    shown = CricketDashboard.parse_match_list(payload)
+    refreshes = []
+    for _ in range(args.refreshes):
+        # A few scores move between refreshes, as they would in five minutes of live cricket
+        payload = copy.deepcopy(payload)
+        matches = payload["typeMatches"][0]["seriesMatches"][0]["seriesAdWrapper"]["matches"]
+        for match in rng.sample(matches, args.changes):
+            match["matchScore"]["team2Score"]["inngs1"]["runs"] += rng.randint(1, 30)
+        refreshes.append(json.dumps(payload).encode())
+
+    # Parsing now happens on the worker that fetched the list
+    def parse(body):
+        return CricketDashboard.parse_match_list(json.loads(body))
+
+    parsed = [parse(body) for body in refreshes]
+    report(f"parse {args.matches} matches", time_call(lambda: parse(refreshes[0]), args.repeat))
+
+    changed = []
+    diff_durations = []
+    for matches in parsed:
+        start = time.perf_counter()
+        shown, added, updated, removed = diff_match_list(shown, matches)
+        diff_durations.append((time.perf_counter() - start) * 1000)
+        changed.append(len(added) + len(updated) + len(removed))
+    report("diff by match ID (Tk thread)", diff_durations)
+    print(f"{'cards refilled per refresh':<28} {statistics.median(changed):8.0f} of {args.matches} "
+          f"(every card was rebuilt before)")
+
+
+def bench_search(args):
+    """As-you-type match search: a scan of every match vs the prefix index"""
+    matches = (CricketDashboard.parse_match_list(make_match_list_payload(args.matches)) +
+               CricketDashboard.parse_match_list(make_match_list_payload(args.matches, state="Complete", seed=1)))
+
+    def scan(query):
+        # Substring search over the same fields without an index
+        terms = query.lower().split()
+        return [match for match in matches
+                if all(any(term in str(match.get(field, "")).lower() for field in SEARCH_FIELDS) for term in terms)]
+
+    build = time_call(lambda: MatchIndex(matches), args.repeat)
+    index = MatchIndex(matches)
+    keystrokes = [args.query[:i] for i in range(1, len(args.query) + 1)]
+    report(f"index {len(matches)} matches", build)
+    report(f"scan, {len(keystrokes)} keystrokes", time_call(lambda: [scan(query) for query in keystrokes], args.repeat))
+    report(f"index, {len(keystrokes)} keystrokes", time_call(lambda: [index.filter(matches, query) for query in keystrokes],
+                                             args.repeat))
+    found = index.filter(matches, args.query)
+    top = ", ".join(f"{match['team1']} v {match['team2']} ({match['format']})" for match in found[:3])
+    print(f"{'results':<28} {len(found):8d} for \"{args.query}\" ({len(scan(args.query))} by scan): {top}")
+
+
+def bench_switch(args):
+    """Switch matches while scorecards are still in flight: thread per fetch vs generation-tagged executor"""
+    rng = random.Random(args.seed)
+    latencies = [rng.uniform(0.05, args.max_latency) for _ in range(args.trials * args.switches)]
+    gaps = [rng.uniform(0, args.max_latency / 2) for _ in range(args.trials * args.switches)]
+
+    def fetch(match_id, latency):
+        time.sleep(latency)
+        return match_id
+
+    def run(start_fetch, drain, idle):
+        """Switch match args.switches times per trial and count what reached the screen"""
+        stale = wrong = 0
+        for trial in range(args.trials):
+            shown = [None]
+            current = [None]
+
+            def show(match_id):
+                nonlocal stale
+                if match_id != current[0]:
+                    stale += 1
+                shown[0] = match_id
+
+            for i in range(args.switches):
+                k = trial * args.switches + i
+                current[0] = 100000 + k
+                start_fetch(current[0], latencies[k], show)
+                deadline = time.perf_counter() + gaps[k]
+                while time.perf_counter() < deadline:
+                    drain()
+                    time.sleep(0.002)
+            while not idle():
+                drain()
+                time.sleep(0.002)
+            drain()
+            wrong += shown[0] != current[0]
+        return stale, wrong
+
+    # Previous behaviour: a thread per fetch, skipped while one is running, results applied blindly
+    calls = queue.Queue()
+    busy = [False]
+
+    def thread_fetch(match_id, latency, show):
+        if busy[0]:
+            return
+        busy[0] = True
+
+        def work():
+            result = fetch(match_id, latency)
+            calls.put(lambda: show(result))
+            busy[0] = False
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def drain_calls():
+        while not calls.empty():
+            calls.get()()
+
+    old_stale, old_wrong = run(thread_fetch, drain_calls, lambda: not busy[0] and calls.empty())
+
+    pool = ThreadPoolExecutor(max_workers=4)
+    fetcher = FetchExecutor(pool)
+
+    def executor_fetch(match_id, latency, show):
+        def job():
+            result = fetch(match_id, latency)
+            return lambda: show(result)
+
+        fetcher.new_generation()
+        fetcher.submit("hscard", job)
+
+    new_stale, new_wrong = run(executor_fetch, fetcher.drain,
+                               lambda: not fetcher.busy("hscard") and fetcher.results.empty())
+    pool.shutdown()
+
+    print(f"{'switches':<28} {args.trials * args.switches:8d} in {args.trials} bursts, "
+          f"fetches take up to {args.max_latency * 1000:.0f} ms")
+    print(f"{'thread per fetch':<28} {old_stale:8d} stale results shown, wrong match left up after {old_wrong} bursts")
+    print(f"{'generation-tagged executor':<28} {new_stale:8d} stale results shown, wrong match left up after "
+          f"{new_wrong} bursts ({fetcher.dropped} results dropped)")
+
+
+def bench_cache(args):
+    """Time-to-first-paint from the network vs from the on-disk response cache"""
+    scorecard = make_hscard_payload(overs=args.overs)
+    stub = StubCricbuzzServer({
+        "/matches/v1/live": (200, make_match_list_payload(args.live)),
+        "/matches/v1/recent": (200, make_match_list_payload(10, state="Complete", seed=1)),
+        "/mcenter/v1/100000/hscard": (200, scorecard)
+    }, delay=args.latency / 1000)
+    client = stub_client(stub)
+    cache = ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-"))
+
+    root = tk.Tk()
+    app = BenchDashboard(root, match_id="100000", api=client, cache=cache)
+    app.show_match_selection_screen()
+
+    def wait_for_cards():
+        app.match_list_load_time = None
+        while app.match_list_load_time is None:
+            root.update()
+            time.sleep(0.001)
+
+    def cold_list():
+        # Network round trip; this also stores the lists in the cache
+        app.load_matches_data(force=True)
+        wait_for_cards()
+
+    def warm_list():
+        # Fresh cache entries are shown without touching the network
+        app.load_matches_data()
+        root.update_idletasks()
+
+    report("match list (network)", time_call(cold_list, args.repeat))
+    report("match list (cache)", time_call(warm_list, args.repeat))
+
+    app.setup_main_dashboard()
+    root.update()
+
+    def cold_scorecard():
+        api_data = client.scorecard("100000").json()
+        cache.put("hscard", "100000", api_data)
+        app.match_data = None
+        app.apply_match_data(app.process_api_data(api_data))
+        app.render.flush()
+        root.update_idletasks()
+
+    def warm_scorecard():
+        app.match_data = None
+        app._show_cached_scorecard(cache.get("hscard", "100000"))
+        app.render.flush()
+        root.update_idletasks()
+
+    report("scorecard (network)", time_call(cold_scorecard, args.repeat))
+    report("scorecard (cache)", time_call(warm_scorecard, args.repeat))
+
+    root.destroy()
+    client.close()
+    stub.close()
+
+    # LRU eviction keeps the directory under its size cap
+    entry_size = len(json.dumps(scorecard))
+    small = ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-"), max_bytes=entry_size * 5)
+    keys = iter(range(args.repeat))
+    report("cache put (atomic write)", time_call(lambda: small.put("hscard", next(keys), scorecard), args.repeat))
+    report("cache get", time_call(lambda: small.get("hscard", args.repeat - 1), args.repeat))
+    total = sum(os.path.getsize(os.path.join(small.directory, name)) for name in os.listdir(small.directory))
+    print(f"{'cache size after eviction':<28} {total / 1024:8.1f} KB of {small.max_bytes / 1024:.1f} KB cap "
+          f"({len(os.listdir(small.directory))} entries)")
+
+
+def bench_budget(args):
+    """Simulate a day of auto-refresh polling against the request budget with a fake clock"""
+    now = [0.0]
+    budget = RequestBudget(per_minute=args.per_minute, per_day=args.per_day, clock=lambda: now[0])
+    base_interval = args.interval
+    sent = refused = 0
+    intervals = []
+
+    while now[0] < 24 * 60 * 60:
+        try:
+            budget.acquire()
+            sent += 1
+        except QuotaExhausted:
+            refused += 1
+        interval = budget.stretch_interval(base_interval)
+        intervals.append(interval)
+        now[0] += interval
+
+    fixed_polls = int(24 * 60 * 60 / base_interval)
+    print(f"{'fixed ' + str(base_interval) + 's polling':<28} {fixed_polls:6d} requests needed")
+    print(f"{'budgeted polling':<28} {sent:6d} sent, {refused} refused, budget {args.per_day}/day")
+    print(f"{'polling interval':<28} min {min(intervals):6.0f}s   median {statistics.median(intervals):6.0f}s   "
+          f"max {max(intervals):6.0f}s")
+
+
+SUITE_FIXTURES = {
+    "t20": dict(innings=2, overs=20),
+    "odi": dict(innings=2, overs=50),
+    "test": dict(innings=4, overs=90)
+}
+
+
+def summarize(durations):
+    """Median, p95 and min of a list of durations in milliseconds"""
+    ordered = sorted(durations)
+    return {
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "min_ms": round(ordered[0], 3)
+    }
+
+
+def git_commit():
+    """Short hash of the checked out commit, if this is a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def open_display():
+    """A Tk root if a display is available, otherwise None"""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+def bench_suite(args):
+    """Time parsing, chart drawing and table population per match format, as JSON"""
+    # Only the Tk-free methods are used, so skip __init__ (which needs a display)
+    load_analysis_modules()
+    dashboard = CricketDashboard.__new__(CricketDashboard)
+    root = open_display()
+    results = {}
+
+    for name, shape in SUITE_FIXTURES.items():
+        raw = json.dumps(make_hscard_payload(**shape))
+        api_data = json.loads(raw)
+        processed = dashboard.process_api_data(api_data)
+        stats = stats_for(processed)
+        timeline = DeliveryTimeline()
+        summaries = make_over_summaries(**shape)
+        timeline.extend(parse_commentary(make_commentary_payload(summaries, 6 * sum(map(len, summaries.values())),
+                                                                 window=None)))
+        result = {}
+
+        # Parsing: JSON decoding, conversion to the dashboard's format and the derived metrics
+        result["json_decode"] = summarize(time_call(lambda: json.loads(raw), args.repeat))
+        result["process_api_data"] = summarize(time_call(lambda: dashboard.process_api_data(api_data), args.repeat))
+        result["derive_stats"] = summarize(time_call(lambda: MatchStats(processed), args.repeat))
+
+        # Charts on off-screen Agg canvases: build and draw every tab's figures from scratch
+        def draw_overview():
+            dashboard.draw_overview_charts(dashboard.create_overview_chart(None), stats)
+
+        def draw_batting():
+            analysis_chart, distribution_chart = dashboard.create_batting_charts(None, None)
+            for innings in stats.innings:
+                dashboard.draw_batting_charts(analysis_chart, distribution_chart, innings, "Runs Distribution")
+
+        def draw_bowling():
+            wickets_chart, economy_chart = dashboard.create_bowling_charts(None, None)
+            for innings in stats.innings:
+                dashboard.draw_bowling_charts(wickets_chart, economy_chart, innings)
+
+        def draw_progress():
+            curve1, curve2 = timeline.curve(1), timeline.curve(2)
+            dashboard.draw_progress_chart(
+                dashboard.create_progress_chart(None), curve1.overs, curve1.scores, curve2.overs, curve2.scores,
+                stats.innings[0].team, stats.innings[1].team)
+
+        for tab, draw in [("overview", draw_overview), ("batting", draw_batting),
+                          ("bowling", draw_bowling), ("progress", draw_progress)]:
+            result[f"charts_{tab}"] = summarize(time_call(draw, args.repeat))
+
+        # Tables: building the rows, then inserting them into real Treeviews if there is a display
+        def build_rows():
+            for innings in stats.innings:
+                dashboard.batting_table_rows(innings)
+                dashboard.bowling_table_rows(innings)
+
+        result["table_rows"] = summarize(time_call(build_rows, args.repeat))
+
+        if root is not None:
+            def populate_tables():
+                for innings in stats.innings:
+                    for rows in (dashboard.batting_table_rows(innings), dashboard.bowling_table_rows(innings)):
+                        table = ttk.Treeview(root, columns=tuple(range(6)), show='headings')
+                        dashboard.sync_table_rows(table, rows, {})
+                        table.destroy()
+                root.update_idletasks()
+
+            result["treeview_populate"] = summarize(time_call(populate_tables, args.repeat))
+        else:
+            result["treeview_populate"] = None
+
+        results[name] = result
+
+    if root is not None:
+        root.destroy()
+
+    report_data = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "matplotlib": matplotlib.__version__,
+        "backend": matplotlib.get_backend(),
+        "repeat": args.repeat,
+        "display": root is not None,
+        "results": results
+    }
+
+    output = json.dumps(report_data, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    # Median change per measurement against an earlier run
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"Compared with {baseline.get('commit')} ({baseline.get('timestamp')}):")
+        for name, result in results.items():
+            for phase, stats in result.items():
+                before = baseline["results"].get(name, {}).get(phase)
+                if stats and before:
+                    change = (stats["median_ms"] / before["median_ms"] - 1) * 100 if before["median_ms"] else 0
+                    print(f"  {name + ' ' + phase:<28} {before['median_ms']:9.2f} -> {stats['median_ms']:9.2f} ms "
+                          f"({change:+.0f}%)")
+
+
+def inline_derived_metrics(data):
+    """Previous behaviour: every consumer recomputes the metrics it shows from the raw scorecard"""
+    score_card = data["scoreCard"]
+
+    # Overview charts
+    [round(inning["runs"] / float(inning["overs"]), 2) for inning in score_card]
+    for inning in score_card:
+        for batsman in inning["batsmen"]:
+            (batsman["fours"] * 4) + (batsman["sixes"] * 6)
+            batsman["runs"] - ((batsman["fours"] * 4) + (batsman["sixes"] * 6))
+
+    # Batting and bowling tabs, one refresh per innings
+    for inning in score_card:
+        [round((b["runs"] / b["balls"]) * 100, 1) if b["balls"] > 0 else 0 for b in inning["batsmen"]]
+        [round((b["runs"] / b["balls"]) * 100, 1) if b["balls"] > 0 else 0 for b in inning["batsmen"][:6]]
+        sum(b["runs"] for b in inning["batsmen"])
+        sum((b["fours"] * 4) + (b["sixes"] * 6) for b in inning["batsmen"])
+        [round(b["runs"] / float(b["overs"]), 2) if b["overs"] > 0 else 0 for b in inning["bowlers"]]
+
+    # Players tab: the list and the selected player's details
+    for team_idx in (0, 1):
+        players = {b["name"] for b in score_card[team_idx]["batsmen"]}
+        players.update(b["name"] for b in score_card[1 - team_idx]["bowlers"])
+        for player in sorted(players)[:1]:
+            batting = next((b for b in score_card[team_idx]["batsmen"] if b["name"] == player), None)
+            bowling = next((b for b in score_card[1 - team_idx]["bowlers"] if b["name"] == player), None)
+            if batting and batting["balls"] > 0:
+                round((batting["runs"] / batting["balls"]) * 100, 1)
+            if bowling and bowling["overs"] > 0:
+                round(bowling["runs"] / float(bowling["overs"]), 2)
+
+    # Detailed analysis window: metric table and radar chart
+    for team_idx in (0, 1):
+        batting, bowling = score_card[team_idx], score_card[1 - team_idx]
+        round(batting["runs"] / float(batting["overs"]), 2)
+        sum(b["fours"] for b in batting["batsmen"]) + sum(b["sixes"] for b in batting["batsmen"])
+        round(100 * batting["runs"] / sum(b["balls"] for b in batting["batsmen"]), 2)
+        round(bowling["runs"] / sum(float(b["overs"]) for b in bowling["bowlers"]), 2)
+        (100 * batting["runs"] / sum(b["balls"] for b in batting["batsmen"])) / 150
+        sum(b["fours"] + b["sixes"] for b in batting["batsmen"]) / 30
+        1 - (bowling["runs"] / sum(float(b["overs"]) for b in bowling["bowlers"])) / 10
+        sum(b["wickets"] for b in bowling["bowlers"]) / 10
+
+
+def memoized_derived_metrics(data):
+    """The same consumers reading from the stats engine, derived once per snapshot"""
+    stats = stats_for(data)
+
+    [innings.run_rate for innings in stats.innings]
+    (stats.boundary_runs, stats.non_boundary_runs, stats.extras)
+
+    for innings in stats.innings:
+        list(innings.strike_rates)
+        top = innings.strike_rates[:6]
+        [top[i] for i in rank(top)]
+        (innings.batting_runs, innings.boundary_runs)
+        [innings.economies[i] for i in rank(innings.economies, descending=False)]
+
+    for team_idx in (0, 1):
+        for player in stats.players(team_idx)[:1]:
+            batting = stats.innings[team_idx].batsman(player)
+            bowling = stats.innings[1 - team_idx].bowler(player)
+            if batting:
+                batting["strike_rate"]
+            if bowling:
+                bowling["economy"]
+
+    for team_idx in (0, 1):
+        batting, bowling = stats.innings[team_idx], stats.innings[1 - team_idx]
+        (batting.run_rate, batting.boundaries, batting.strike_rate, bowling.economy)
+        stats.radar[team_idx]
+
+
+def bench_stats(args):
+    """Per-refresh CPU spent deriving metrics: recomputed inline vs memoized per snapshot"""
+    dashboard = CricketDashboard.__new__(CricketDashboard)
+    for name, shape in SUITE_FIXTURES.items():
+        api_data = make_hscard_payload(**shape)
+
+        # Every refresh brings a new snapshot, so the memoized path derives its stats once per refresh.
+        # The inline path reads the dict layout the dashboard used before the typed scorecard
+        snapshots = [dashboard.process_api_data(api_data) for _ in range(args.refreshes)]
+        layouts = {"inline": [snapshot.to_dict() for snapshot in snapshots], "memoized": snapshots}
+
+        # The two paths take turns, and the best round of each is reported, so a busy machine
+        # slows both alike instead of whichever happened to run second
+        best = {}
+        for _ in range(args.rounds):
+            for label, derive in [("inline", inline_derived_metrics), ("memoized", memoized_derived_metrics)]:
+                start = time.process_time()
+                for snapshot in layouts[label]:
+                    derive(snapshot)
+                per_refresh = (time.process_time() - start) / args.refreshes * 1e6
+                best[label] = min(best.get(label, per_refresh), per_refresh)
+        for label, per_refresh in best.items():
+            print(f"{name + ' ' + label:<28} {per_refresh:8.1f} us CPU per refresh (best of {args.rounds})")
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns, while its result is kept alive"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_memory(args):
+    """Footprint of retained Test scorecard snapshots: nested dicts vs the slotted scorecard classes"""
+    dashboard = CricketDashboard.__new__(CricketDashboard)
+    raw = json.dumps(make_hscard_payload(**SUITE_FIXTURES["test"]))
+
+    # Each poll decodes a fresh response. The dict layout is rebuilt from JSON so its strings and
+    # floats are fresh objects too, as they were when process_api_data returned dicts
+    def dict_snapshots():
+        return [json.loads(json.dumps(dashboard.process_api_data(json.loads(raw)).to_dict()))
+                for _ in range(args.snapshots)]
+
+    def typed_snapshots():
+        return [dashboard.process_api_data(json.loads(raw)) for _ in range(args.snapshots)]
+
+    dict_size = retained_bytes(dict_snapshots)
+    typed_size = retained_bytes(typed_snapshots)
+    print(f"{'dicts':<28} {dict_size / 1024:8.1f} KiB for {args.snapshots} snapshots "
+          f"({dict_size / args.snapshots / 1024:.1f} KiB each)")
+    print(f"{'slotted classes':<28} {typed_size / 1024:8.1f} KiB for {args.snapshots} snapshots "
+          f"({typed_size / args.snapshots / 1024:.1f} KiB each)")
+    print(f"{'saving':<28} {(1 - typed_size / dict_size) * 100:8.0f} %")
+
+
+def bench_timeline(args):
+    """Per-poll cost of the delivery timeline early and late in a Test: appending new overs vs rebuilding"""
+    summaries = make_over_summaries(innings=4, overs=args.overs)
+    polls = range(1, 4 * args.overs + 1)
+
+    # One poll per over. The feed only carries the latest overs, so appending keeps the cost flat;
+    # rebuilding has to read every over played so far
+    recent = [json.dumps(make_commentary_payload(summaries, over * 6)) for over in polls]
+    history = [json.dumps(make_commentary_payload(summaries, over * 6, window=None)) for over in polls]
+
+    def run(label, payloads, incremental):
+        timeline = DeliveryTimeline()
+        durations = []
+        for raw in payloads:
+            start = time.perf_counter()
+            if not incremental:
+                timeline = DeliveryTimeline()
+            timeline.extend(parse_commentary(json.loads(raw)))
+            durations.append((time.perf_counter() - start) * 1e6)
+        tenth = max(1, len(durations) // 10)
+        print(f"{label:<28} first 10% {statistics.median(durations[:tenth]):8.1f} us   "
+              f"last 10% {statistics.median(durations[-tenth:]):8.1f} us per poll   ({len(timeline)} deliveries)")
+
+    run("append new overs", recent, incremental=True)
+    run("rebuild every poll", history, incremental=False)
+
+
+def bench_series(args):
+    """Progress chart cost from poll samples of a long Test, every sample vs LTTB-downsampled"""
+    load_analysis_modules()
+    dashboard = CricketDashboard.__new__(CricketDashboard)
+    payload = make_hscard_payload(innings=2, overs=args.overs)
+    rng = random.Random(0)
+
+    # One poll every 20 seconds for days of play (six hours a day), split across two innings
+    polls = args.days * 6 * 60 * 3
+    history = ScoreHistory()
+    for i in range(polls):
+        balls_bowled = (i + 1) * args.overs * 12 // polls
+        if balls_bowled % 6 == 0 and rng.random() < 0.5:
+            continue  # A quiet poll between overs
+        history.record(dashboard.process_api_data(snapshot_at(payload, balls_bowled)), i * 20.0)
+
+    samples = sum(len(series) for series in history.series.values())
+    print(f"{'samples kept':<28} {samples:8d} across {len(history.series)} innings")
+    chart = dashboard.create_progress_chart(None)
+    for label, max_points in [("every sample", 10 ** 6), ("LTTB downsampled", 300)]:
+        def draw():
+            curve1, curve2 = history.curve(1, max_points), history.curve(2, max_points)
+            dashboard.draw_progress_chart(chart, curve1.overs, curve1.scores, curve2.overs, curve2.scores,
+                                          "Team 1", "Team 2")
+        report(label, time_call(draw, args.repeat))
+
+
+def bench_monitor(args):
+    """Follow many recorded matches at once through the shared poll scheduler, without a display"""
+    directory = tempfile.mkdtemp(prefix="dashboard-monitor-")
+    length = write_replay_fixtures(directory, overs=args.overs, innings=args.innings, matches=args.matches)
+    client = ReplayClient(directory, speed=length / args.duration)
+    if args.per_minute:
+        client.budget = RequestBudget(per_minute=args.per_minute, per_day=10 ** 6)
+
+    scheduler = PollScheduler(client, CricketDashboard.process_api_data, interval=args.refresh,
+                              max_workers=args.workers)
+    match_ids = [str(100000 + i) for i in range(args.matches)]
+    for match_id in match_ids:
+        scheduler.follow(match_id)
+
+    # Tick like the monitor window does, timing the work done on the UI thread
+    latest = {}
+    polls = dict.fromkeys(match_ids, 0)
+    errors = 0
+    tick_durations = []
+    client.started = client.clock()
+    while client.elapsed() <= length + args.refresh * client.speed:
+        start = time.perf_counter()
+        for result in scheduler.tick():
+            polls[result.match_id] += 1
+            if result.match is not None:
+                latest[result.match_id] = result.match
+            elif result.error:
+                errors += 1
+        tick_durations.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.02)
+    scheduler.close()
+
+    # A match is up to date if its tile ended on the last over of its final innings
+    finished = sum(1 for match in latest.values()
+                   if len(match.innings) == args.innings and match.innings[-1].balls == args.overs * 6)
+    counts = sorted(polls.values())
+    print(f"{'matches followed':<28} {args.matches:8d} with {args.workers} workers, "
+          f"{args.duration:.0f}s (speed x{client.speed:.0f})")
+    print(f"{'matches shown':<28} {len(latest):8d}   up to date at the end: {finished}")
+    print(f"{'polls per match':<28} min {counts[0]}  median {statistics.median(counts):.0f}  max {counts[-1]}  "
+          f"({sum(counts)} requests, {errors} errors)")
+    report("scheduler tick (UI thread)", tick_durations)
+
+
+class FakeTk:
+    """root.after and root.after_cancel on a simulated millisecond clock"""
+
+    def __init__(self):
+        self.now = 0
+        self.jobs = {}  # Job ID -> (due, callback)
+        self._ids = itertools.count()
+
+    def after(self, ms, callback):
+        job = f"after#{next(self._ids)}"
+        self.jobs[job] = (self.now + ms, callback)
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_until(self, end):
+        """Run the callbacks due up to end, in order, then move the clock to end"""
+        while self.jobs:
+            job, (due, callback) = min(self.jobs.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.jobs[job]
+            self.now = due
+            callback()
+        self.now = end
+
+
+# Two days of a Test as (minutes, scorecard status): sessions, breaks, rain, stumps and the result
+TEST_DAYS = [
+    (120, "Day 1: Session 1"), (40, "Day 1: Lunch Break"), (120, "Day 1: Session 2"), (20, "Day 1: Tea Break"),
+    (60, "Day 1: Session 3"), (45, "Rain stops play"), (75, "Day 1: Session 3"), (960, "Day 1: Stumps"),
+    (120, "Day 2: Session 1"), (20, "Innings Break"), (100, "India need 12 runs"), (1200, "India won by 6 wickets")
+]
+
+
+def bench_timer(args):
+    """Two days of auto-refresh on a fake clock, with the user toggling it and refreshing by hand"""
+    rng = random.Random(args.seed)
+    minutes = sum(length for length, _ in TEST_DAYS)
+    ends = list(itertools.accumulate(length for length, _ in TEST_DAYS))
+
+    def status_at(ms):
+        minute = ms / 60000
+        return next((status for end, (_, status) in zip(ends, TEST_DAYS) if minute < end), TEST_DAYS[-1][1])
+
+    # The same user actions for both timers: toggling off and straight back on, and manual refreshes
+    toggles = sorted(rng.uniform(0, minutes) for _ in range(args.toggles))
+    manual = sorted(rng.uniform(0, minutes) for _ in range(args.toggles // 2))
+    actions = sorted([(t, "toggle") for t in toggles] + [(t, "refresh") for t in manual])
+    interval = args.interval
+
+    # The old chained callbacks: every toggle back on started another chain
+    tk_old = FakeTk()
+    enabled = [True]
+    old_polls = []
+
+    def callback():
+        if enabled[0]:
+            old_polls.append(tk_old.now)
+            tk_old.after(interval * 1000, callback)
+
+    tk_old.after(interval * 1000, callback)
+    for minute, action in actions:
+        tk_old.run_until(int(minute * 60000))
+        if action == "toggle":
+            enabled[0] = True
+            tk_old.after(interval * 1000, callback)
+        else:
+            old_polls.append(tk_old.now)
+    tk_old.run_until(minutes * 60000)
+
+    # RefreshTimer, with each poll answered straight away. Most polls during play find
+    # changes, none while play is stopped do
+    tk_new = FakeTk()
+    budget = RequestBudget(per_minute=10 ** 6, per_day=args.per_day, clock=lambda: tk_new.now / 1000)
+    timer = RefreshTimer(tk_new.after, tk_new.after_cancel, None, interval, budget)
+    polls = []
+    armed = []  # (clock, delay) of every timer armed
+    late = max_pending = 0
+
+    def after(ms, callback):
+        armed.append((tk_new.now, ms))
+        return FakeTk.after(tk_new, ms, callback)
+
+    def poll(by_timer=True):
+        nonlocal late
+        # A timer poll must land exactly one interval after the timer was last armed
+        if by_timer and tk_new.now != armed[-1][0] + armed[-1][1]:
+            late += 1
+        state = match_state(status_at(tk_new.now))
+        polls.append((tk_new.now, state))
+        try:
+            budget.acquire()
+            changed = state == "live" and rng.random() < args.change_rate
+            failed = False
+        except QuotaExhausted:
+            changed, failed = False, True
+        timer.state = state
+        timer.record(changed=changed, failed=failed)
+
+    timer._after = after
+    timer.poll = poll
+    timer.start()
+    for minute, action in actions:
+        tk_new.run_until(int(minute * 60000))
+        max_pending = max(max_pending, len(tk_new.jobs))
+        if action == "toggle":
+            timer.stop()
+            timer.start()
+        else:
+            poll(by_timer=False)
+        max_pending = max(max_pending, len(tk_new.jobs))
+    end = minutes * 60000
+    while tk_new.jobs and min(due for due, _ in tk_new.jobs.values()) <= end:
+        tk_new.run_until(min(due for due, _ in tk_new.jobs.values()))
+        max_pending = max(max_pending, len(tk_new.jobs))
+    tk_new.now = end
+
+    print(f"{'simulated':<28} {minutes / 60:.0f}h of a Test, {args.toggles} toggles and "
+          f"{len(manual)} manual refreshes, {interval}s interval")
+    print(f"{'chained callbacks':<28} {len(old_polls):6d} polls, up to {args.toggles + 1} timers running")
+    print(f"{'refresh timer':<28} {len(polls):6d} polls, at most {max_pending} timer pending, {late} off schedule")
+    for state in ("live", "break", "innings_break", "rain", "stumps", "complete"):
+        count = sum(1 for _, polled in polls if polled == state)
+        waits = [(b - a) / 1000 for (a, polled), (b, _) in zip(polls, polls[1:]) if polled == state]
+        text = f"{'  ' + state:<28} {count:6d} polls"
+        if waits:
+            text += f", wait to the next: median {statistics.median(waits):5.0f}s  max {max(waits):5.0f}s"
+        print(text)
+
+
+def bench_frames(args):
+    """A minute of refreshes on a fake clock: a root.after per UI change vs the frame scheduler"""
+    rng = random.Random(args.seed)
+
+    # Every 5 seconds a fetch spins the loading indicator for 300-800 ms, then a burst of
+    # snapshots lands within 20 ms (a catch-up after a slow poll) and the header flashes
+    events = []  # (ms, kind)
+    for start in range(0, args.seconds * 1000, 5000):
+        finish = start + rng.randint(300, 800)
+        events += [(t, "spin") for t in range(start, finish, 50)]
+        events += [(finish + rng.randint(0, 20), "snapshot") for _ in range(args.burst)]
+        events += [(finish + 300 * i, "flash") for i in range(6)]
+        if rng.random() < 0.2:
+            events.append((finish, "toast"))
+    events.sort()
+
+    # Before: every change ran as its own callback, and each snapshot redrew the tab
+    old_passes = len(events)
+    old_tab_renders = sum(1 for _, kind in events if kind == "snapshot")
+
+    tk_fake = FakeTk()
+    render = RenderScheduler(tk_fake.after, tk_fake.after_cancel, fps=args.fps, clock=lambda: tk_fake.now / 1000)
+    tab_renders = [0]
+
+    def render_tab():
+        tab_renders[0] += 1
+
+    updates = {
+        "spin": lambda: render.invalidate("loading", lambda: None),
+        "snapshot": lambda: (render.invalidate("info", lambda: None), render.invalidate("tab", render_tab)),
+        "flash": lambda: render.invalidate("flash", lambda: None),
+        "toast": lambda: render.invalidate("toast", lambda: None)
+    }
+    frame_gaps = []
+    last_frame = [None]
+    frame = render._frame
+
+    def timed_frame():
+        if last_frame[0] is not None:
+            frame_gaps.append(tk_fake.now - last_frame[0])
+        last_frame[0] = tk_fake.now
+        frame()
+
+    render._frame = timed_frame
+    for ms, kind in events:
+        tk_fake.run_until(ms)
+        updates[kind]()
+    tk_fake.run_until(args.seconds * 1000 + 1000)
+
+    stats = render.stats()
+    print(f"{'simulated':<28} {args.seconds}s, {len(events)} UI changes, bursts of {args.burst} snapshots")
+    print(f"{'root.after per change':<28} {old_passes:6d} UI passes, {old_tab_renders} tab renders")
+    print(f"{'frame scheduler':<28} {stats['frames']:6d} frames, {tab_renders[0]} tab renders, "
+          f"{stats['collapsed']} changes folded into queued ones")
+    print(f"{'shortest gap between frames':<28} {min(frame_gaps):6d} ms (cap {1000 / args.fps:.0f} ms at {args.fps} fps)")
+
+
+class FakePool:
+    """Worker pool whose jobs finish latency ms later on a FakeTk clock"""
+
+    def __init__(self, tk_fake, latency):
+        self.tk_fake = tk_fake
+        self.latency = latency
+
+    def submit(self, func, *args):
+        future = Future()
+        self.tk_fake.after(self.latency, lambda: future.cancelled() or func(*args))
+        return future
+
+
+def bench_prefetch(args):
+    """Hours of visits to the selection screen on a fake clock: opening matches with and without prefetching"""
+    rng = random.Random(args.seed)
+    match_ids = [100000 + i for i in range(args.live)]
+
+    # Each visit lingers on the selection screen, opens a match - usually one near the top of
+    # the live list - and watches it for a while before coming back
+    visits = []  # (linger ms, match ID, watch ms)
+    elapsed = 0
+    while elapsed < args.hours * 3600 * 1000:
+        linger = rng.randint(2, 60) * 1000
+        index = rng.randrange(args.matches) if rng.random() < 0.8 else rng.randrange(len(match_ids))
+        watch = rng.randint(1, 20) * 60 * 1000
+        visits.append((linger, match_ids[index], watch))
+        elapsed += linger + watch
+
+    def run(prefetching):
+        tk_fake = FakeTk()
+        clock = lambda: tk_fake.now / 1000
+        fetcher = FetchExecutor(FakePool(tk_fake, args.latency))
+        budget = RequestBudget(clock=clock)
+        prefetcher = ScorecardPrefetcher(tk_fake.after, tk_fake.after_cancel, fetcher, lambda match_id: match_id,
+                                         budget, matches=args.matches, per_hour=args.per_hour if prefetching else 0,
+                                         ttl=args.ttl, clock=clock)
+        waits = []
+        for linger, match_id, watch in visits:
+            prefetcher.watch(match_ids)
+            for _ in range(linger // 50):
+                tk_fake.run_until(tk_fake.now + 50)
+                fetcher.drain()
+            prefetcher.stop()
+
+            # First paint: at once from a prefetch, after a scorecard round trip otherwise
+            waits.append(0 if prefetcher.take(match_id) else args.latency)
+            tk_fake.run_until(tk_fake.now + watch)
+            fetcher.drain()
+        return waits, prefetcher
+
+    cold, _ = run(False)
+    warm, prefetcher = run(True)
+    hours = sum(linger + watch for linger, _, watch in visits) / 3600 / 1000
+    print(f"{'simulated':<28} {hours:.1f}h, {len(visits)} matches opened, top {args.matches} of {args.live} "
+          f"live matches prefetched, {args.latency} ms scorecard round trip")
+    print(f"{'no prefetch':<28} first paint mean {statistics.mean(cold):6.0f} ms, "
+          f"{cold.count(0)} of {len(cold)} opened at once")
+    print(f"{'prefetch':<28} first paint mean {statistics.mean(warm):6.0f} ms, "
+          f"{warm.count(0)} of {len(warm)} opened at once")
+    print(f"{'prefetch requests':<28} {prefetcher.requests:8d} ({prefetcher.requests / hours:.1f}/h, "
+          f"quota {args.per_hour}/h, {prefetcher.skipped} passes held back)")
+
+
+def bench_session(args):
+    """Time-to-first-meaningful-paint on startup: fetching the match vs reopening the last session"""
+    scorecard = make_hscard_payload(overs=args.overs)
+    live = CricketDashboard.parse_match_list(make_match_list_payload(args.live))
+    recent = CricketDashboard.parse_match_list(make_match_list_payload(args.live, state="Complete", seed=1))
+    cache = ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-"))
+    cache.put("session", "last", {"match_id": 100000, "scorecard": scorecard, "live": live, "recent": recent})
+
+    stub = StubCricbuzzServer({"/mcenter/v1/100000/hscard": (200, scorecard)}, delay=args.latency / 1000)
+    client = stub_client(stub)
+
+    # The Tk-free part of each startup: fetching the scorecard and processing it, vs reading the
+    # session back and processing its scorecard
+    def fetch_scorecard():
+        CricketDashboard.process_api_data(client.scorecard("100000").json())
+
+    def read_session():
+        CricketDashboard.process_api_data(cache.get("session", "last")["payload"]["scorecard"])
+
+    report("fetch + process (network)", time_call(fetch_scorecard, args.repeat))
+    report("session read + process", time_call(read_session, args.repeat))
+
+    root = open_display()
+    if root is None:
+        print(f"{'first paint':<28} skipped (needs a display - run under xvfb-run on a headless machine)")
+        client.close()
+        stub.close()
+        return
+    root.destroy()
+
+    def first_paint(start):
+        root = tk.Tk()
+        app = start(root)
+        while app.first_paint_time is None:
+            root.update()
+            time.sleep(0.001)
+        app.stop()
+        root.destroy()
+        return app.first_paint_time * 1000
+
+    # Before: nothing to show until the scorecard has come back from the network
+    network = [first_paint(lambda root: CricketDashboard(
+        root, match_id="100000", api=client, cache=ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-"))))
+        for _ in range(args.repeat)]
+    restored = [first_paint(lambda root: BenchDashboard(root, cache=cache, restore=True))
+                for _ in range(args.repeat)]
+    report("first paint (network)", network)
+    report("first paint (last session)", restored)
+    client.close()
+    stub.close()
+
+
+# Modules the selection screen should not wait for
+DEFERRED_MODULES = ("numpy", "matplotlib", "PIL", "charts", "match_stats", "timeline")
+
+
+def import_times(code):
+    """Cumulative import time (ms) of each module a fresh interpreter imports to run code, from -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package", indented by nesting
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def bench_startup(args):
+    """Import cost before the selection screen, measured in fresh interpreters with -X importtime"""
+    to_selection = "import dashboard"
+    everything = "import dashboard; dashboard.load_analysis_modules()"
+
+    def run(code):
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    # Before: the chart stack was imported with dashboard.py, ahead of the selection screen
+    report("interpreter + all imports", time_call(lambda: run(everything), args.repeat))
+    report("interpreter + startup", time_call(lambda: run(to_selection), args.repeat))
+
+    startup = import_times(to_selection)
+    full = import_times(everything)
+    deferred = [name for name in DEFERRED_MODULES if name in startup]
+    print(f"{'import dashboard':<28} {startup['dashboard']:8.1f} ms "
+          f"(deferred modules loaded: {', '.join(deferred) if deferred else 'none'})")
+    for name in DEFERRED_MODULES:
+        if name in full:
+            print(f"{'  deferred: ' + name:<28} {full[name]:8.1f} ms")
+
+
+def bench_fixtures(args):
+    """Write a synthetic match recording for python dashboard.py --replay"""
+    length = write_replay_fixtures(args.directory, overs=args.overs, innings=args.innings,
+                                   over_seconds=args.over_seconds, matches=args.matches)
+    print(f"Wrote {args.overs * args.innings * args.matches} scorecard snapshots covering {length / 60:.0f} minutes "
+          f"to {args.directory}")
+    if args.matches > 1:
+        print(f"Replay with: python dashboard.py --replay {args.directory} --monitor "
+              f"--speed {length / 60:.0f} --refresh 1")
+    else:
+        print(f"Replay with: python dashboard.py --replay {args.directory} --match-id 100000 "
+              f"--speed {length / 60:.0f} --refresh 1")
+
+
+def bench_replay(args):
+    """Play a whole recorded match through the real refresh pipeline in a short time"""
+    directory = tempfile.mkdtemp(prefix="dashboard-replay-")
+    length = write_replay_fixtures(directory, overs=args.overs, innings=args.innings)
+    client = ReplayClient(directory, speed=length / args.duration)
+
+    root = tk.Tk()
+    app = CricketDashboard(root, match_id="100000", api=client,
+                           cache=ResponseCache(tempfile.mkdtemp(prefix="dashboard-bench-")),
+                           refresh_interval=args.refresh)
+
+    # Count every snapshot the fetch worker hands to the UI; the render scheduler times the frames
+    durations = []
+    apply_match_data = app.apply_match_data
+
+    def timed_apply(processed_data, overs=()):
+        start = time.perf_counter()
+        apply_match_data(processed_data, overs)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    app.apply_match_data = timed_apply
+
+    # Drive the Tk loop until the recording has played out
+    client.started = client.clock()
+    while client.elapsed() <= length + args.refresh * client.speed:
+        root.update()
+        time.sleep(0.005)
+
+    print(f"{'snapshots rendered':<28} {len(durations):8d} of {args.overs * args.innings} "
+          f"in {args.duration:.0f}s (speed x{client.speed:.0f})")
+    report("snapshot diff", durations)
+    report("UI frame", list(app.render.frame_times))
+    stats = app.render.stats()
+    print(f"{'frames':<28} {stats['frames']:8d} ran {stats['updates']} updates, "
+          f"{stats['collapsed']} more folded into ones already queued")
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cricket dashboard benchmarks")
+    subparsers = parser.add_subparsers(dest="scenario", required=True)
+
+    refresh_parser = subparsers.add_parser("refresh", help="dashboard refresh latency")
+    refresh_parser.add_argument("--repeat", type=int, default=20)
+    refresh_parser.add_argument("--overs", type=int, default=50)
+    refresh_parser.set_defaults(func=bench_refresh)
+
+    soak_parser = subparsers.add_parser("soak", help="memory use over many refreshes")
+    soak_parser.add_argument("--refreshes", type=int, default=1000)
+    soak_parser.add_argument("--sample-every", type=int, default=100)
+    soak_parser.add_argument("--overs", type=int, default=50)
+    soak_parser.set_defaults(func=bench_soak)
+
+    http_parser = subparsers.add_parser("http", help="connection reuse against a local stub server")
+    http_parser.add_argument("--requests", type=int, default=50)
+    http_parser.add_argument("--overs", type=int, default=50)
+    http_parser.set_defaults(func=bench_http)
+
+    selection_parser = subparsers.add_parser("selection", help="time-to-first-card on the selection screen")
+    selection_parser.add_argument("--repeat", type=int, default=10)
+    selection_parser.add_argument("--latency", type=float, default=250, help="simulated round-trip in ms")
+    selection_parser.add_argument("--live", type=int, default=8, help="number of live matches")
+    selection_parser.set_defaults(func=bench_selection)
+
+    cache_parser = subparsers.add_parser("cache", help="first paint from the network vs the disk cache")
+    cache_parser.add_argument("--repeat", type=int, default=10)
+    cache_parser.add_argument("--latency", type=float, default=250, help="simulated round-trip in ms")
+    cache_parser.add_argument("--live", type=int, default=8, help="number of live matches")
+    cache_parser.add_argument("--overs", type=int, default=50)
+    cache_parser.set_defaults(func=bench_cache)
+
+    budget_parser = subparsers.add_parser("budget", help="a simulated day of polling under the request budget")
+    budget_parser.add_argument("--per-day", type=int, default=500)
+    budget_parser.add_argument("--per-minute", type=int, default=30)
+    budget_parser.add_argument("--interval", type=int, default=60, help="base refresh interval in seconds")
+    budget_parser.set_defaults(func=bench_budget)
+
+    fixtures_parser = subparsers.add_parser("fixtures", help="write a synthetic match recording for --replay")
+    fixtures_parser.add_argument("directory")
+    fixtures_parser.add_argument("--overs", type=int, default=50)
+    fixtures_parser.add_argument("--innings", type=int, default=2)
+    fixtures_parser.add_argument("--over-seconds", type=float, default=240, help="time between snapshots")
+    fixtures_parser.add_argument("--matches", type=int, default=1, help="simultaneous matches to record")
+    fixtures_parser.set_defaults(func=bench_fixtures)
+
+    replay_parser = subparsers.add_parser("replay", help="a recorded match played through the refresh pipeline")
+    replay_parser.add_argument("--duration", type=float, default=60, help="seconds to play the match in")
+    replay_parser.add_argument("--overs", type=int, default=50)
+    replay_parser.add_argument("--innings", type=int, default=2)
+    replay_parser.add_argument("--refresh", type=float, default=0.5, help="auto-refresh interval in seconds")
+    replay_parser.set_defaults(func=bench_replay)
+
+    suite_parser = subparsers.add_parser("suite", help="headless parse/chart/table timings as JSON")
+    suite_parser.add_argument("--repeat", type=int, default=10)
+    suite_parser.add_argument("--output", metavar="FILE", help="write the JSON results to FILE")
+    suite_parser.add_argument("--compare", metavar="FILE", help="print changes against an earlier results file")
+    suite_parser.set_defaults(func=bench_suite)
+
+    stats_parser = subparsers.add_parser("stats", help="derived-metric CPU per refresh, inline vs memoized")
+    stats_parser.add_argument("--refreshes", type=int, default=2000)
+    stats_parser.add_argument("--rounds", type=int, default=5)
+    stats_parser.set_defaults(func=bench_stats)
+
+    memory_parser = subparsers.add_parser("memory", help="retained size of Test scorecards, dicts vs slotted classes")
+    memory_parser.add_argument("--snapshots", type=int, default=10)
+    memory_parser.set_defaults(func=bench_memory)
+
+    timeline_parser = subparsers.add_parser("timeline", help="per-poll cost of the delivery timeline over a Test")
+    timeline_parser.add_argument("--overs", type=int, default=90, help="overs per innings")
+    timeline_parser.set_defaults(func=bench_timeline)
+
+    series_parser = subparsers.add_parser("series", help="progress chart from poll samples, raw vs LTTB")
+    series_parser.add_argument("--days", type=int, default=5)
+    series_parser.add_argument("--overs", type=int, default=450, help="overs per innings")
+    series_parser.add_argument("--repeat", type=int, default=5)
+    series_parser.set_defaults(func=bench_series)
+
+    monitor_parser = subparsers.add_parser("monitor", help="many recorded matches through the shared poll scheduler")
+    monitor_parser.add_argument("--matches", type=int, default=20)
+    monitor_parser.add_argument("--workers", type=int, default=4)
+    monitor_parser.add_argument("--duration", type=float, default=30, help="seconds to play the matches in")
+    monitor_parser.add_argument("--overs", type=int, default=20)
+    monitor_parser.add_argument("--innings", type=int, default=2)
+    monitor_parser.add_argument("--refresh", type=float, default=0.5, help="poll interval per match in seconds")
+    monitor_parser.add_argument("--per-minute", type=int, help="limit requests per minute, as a real plan would")
+    monitor_parser.set_defaults(func=bench_monitor)
+
+    cards_parser = subparsers.add_parser("cards", help="selection screen with hundreds of matches, eager vs virtualized")
+    cards_parser.add_argument("--matches", type=int, default=500, help="live matches, and as many recent ones")
+    cards_parser.add_argument("--repeat", type=int, default=5)
+    cards_parser.set_defaults(func=bench_cards)
+
+    matchlist_parser = subparsers.add_parser("matchlist", help="match list refresh: parse off-thread, diff by match ID")
+    matchlist_parser.add_argument("--matches", type=int, default=500)
+    matchlist_parser.add_argument("--changes", type=int, default=10, help="scores that move between refreshes")
+    matchlist_parser.add_argument("--refreshes", type=int, default=50)
+    matchlist_parser.add_argument("--repeat", type=int, default=20)
+    matchlist_parser.set_defaults(func=bench_matchlist)
+
+    search_parser = subparsers.add_parser("search", help="as-you-type match search, scan vs prefix index")
+    search_parser.add_argument("--matches", type=int, default=500, help="live matches, and as many recent ones")
+    search_parser.add_argument("--query", default="india odi")
+    search_parser.add_argument("--repeat", type=int, default=20)
+    search_parser.set_defaults(func=bench_search)
+
+    switch_parser = subparsers.add_parser("switch", help="switching matches with fetches in flight, stale results shown")
+    switch_parser.add_argument("--trials", type=int, default=10)
+    switch_parser.add_argument("--switches", type=int, default=5, help="match switches per burst")
+    switch_parser.add_argument("--max-latency", type=float, default=0.4, help="slowest scorecard fetch in seconds")
+    switch_parser.add_argument("--seed", type=int, default=0)
+    switch_parser.set_defaults(func=bench_switch)
+
+    frames_parser = subparsers.add_parser("frames", help="UI changes batched into frames on a fake clock")
+    frames_parser.add_argument("--seconds", type=int, default=60)
+    frames_parser.add_argument("--burst", type=int, default=3, help="snapshots arriving together after a slow poll")
+    frames_parser.add_argument("--fps", type=int, default=30)
+    frames_parser.add_argument("--seed", type=int, default=0)
+    frames_parser.set_defaults(func=bench_frames)
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="opening matches with scorecards prefetched, on a fake clock")
+    prefetch_parser.add_argument("--hours", type=float, default=8)
+    prefetch_parser.add_argument("--live", type=int, default=8, help="number of live matches")
+    prefetch_parser.add_argument("--matches", type=int, default=PREFETCH_MATCHES, help="top live matches prefetched")
+    prefetch_parser.add_argument("--per-hour", type=int, default=PREFETCH_PER_HOUR, help="prefetch request quota")
+    prefetch_parser.add_argument("--ttl", type=float, default=PREFETCH_TTL, help="seconds a prefetch is kept")
+    prefetch_parser.add_argument("--latency", type=int, default=400, help="scorecard round trip in ms")
+    prefetch_parser.add_argument("--seed", type=int, default=0)
+    prefetch_parser.set_defaults(func=bench_prefetch)
+
+    session_parser = subparsers.add_parser("session", help="first meaningful paint on startup, network vs last session")
+    session_parser.add_argument("--repeat", type=int, default=10)
+    session_parser.add_argument("--latency", type=float, default=250, help="simulated round-trip in ms")
+    session_parser.add_argument("--live", type=int, default=20, help="number of live matches in the saved list")
+    session_parser.add_argument("--overs", type=int, default=50)
+    session_parser.set_defaults(func=bench_session)
+
+    startup_parser = subparsers.add_parser("startup", help="imports before the selection screen, via -X importtime")
+    startup_parser.add_argument("--repeat", type=int, default=10)
+    startup_parser.set_defaults(func=bench_startup)
+
+    timer_parser = subparsers.add_parser("timer", help="two days of auto-refresh on a fake clock, adaptive vs chained")
+    timer_parser.add_argument("--toggles", type=int, default=40, help="times auto-refresh is switched off and on")
+    timer_parser.add_argument("--interval", type=int, default=60)
+    timer_parser.add_argument("--per-day", type=int, default=10 ** 6)
+    timer_parser.add_argument("--change-rate", type=float, default=0.9, help="share of live polls that find changes")
+    timer_parser.add_argument("--seed", type=int, default=0)
+    timer_parser.set_defaults(func=bench_timer)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Vertical space between two cards
+CARD_GAP = 10
+
+
+def visible_rows(top, height, row_height, count):
+    """[first, last) indices of the rows at least partly inside a viewport of height starting at top"""
+    first = max(0, int(top // row_height))
+    last = min(count, int((top + height) // row_height) + 1)
+    return first, max(first, last)
+
+
+class VirtualCardList:
+    """A scrolling list of fixed-height cards that only has widgets for the rows in view
+
+    build_card(parent) makes an empty card (a dict of its widgets, the outer one under
+    "frame") and fill_card(card, item) shows an item on it. Cards are recycled as the
+    list scrolls, so a list of hundreds of items never holds more cards than fit on
+    screen. Items are revealed a page at a time, and the next page is added whenever
+    the list is scrolled to its end.
+    """
+
+    def __init__(self, parent, build_card, fill_card, row_height=175, page_size=20,
+                 empty_text="Nothing to show", bg=None, fg=None):
+        self.build_card = build_card
+        self.fill_card = fill_card
+        self.row_height = row_height
+        self.page_size = page_size
+        self.empty_text = empty_text
+
+        self.items = None        # None until the first set_items()
+        self.limit = page_size   # Items revealed so far
+        self.cards = []          # Card pool - row i is shown on cards[i % len(cards)]
+        self._windows = []       # Canvas window holding each card
+        self._shown = []         # Item each card is showing, so cards are only refilled when it changes
+
+        self.canvas = tk.Canvas(parent, bg=bg)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+
+        # "No matches" when empty, "Showing 20 of 500" below the last revealed row otherwise
+        self._message = self.canvas.create_text(0, 0, anchor="n", text="", font=("Arial", 12), fill=fg)
+
+    @property
+    def count(self):
+        """Number of rows revealed"""
+        return min(self.limit, len(self.items or ()))
+
+    def set_items(self, items, reset=True):
+        """Show a new list of items, back at the top and first page unless reset is False"""
+        self.items = list(items)
+        if reset:
+            self.limit = self.page_size
+            self.canvas.yview_moveto(0)
+        self._layout()
+
+    def _layout(self):
+        """Size the scroll region for the revealed rows and place the message"""
+        width = self.canvas.winfo_width()
+        count = self.count
+        height = count * self.row_height
+        if self.items is not None and not self.items:
+            text = self.empty_text
+        elif count < len(self.items or ()):
+            text = f"Showing {count} of {len(self.items)} - scroll down for more"
+        else:
+            text = ""
+        self.canvas.itemconfigure(self._message, text=text)
+        self.canvas.coords(self._message, width / 2, height + CARD_GAP)
+        self.canvas.configure(scrollregion=(0, 0, width, height + (2 * self.row_height // 5 if text else 0)))
+        self.render()
+
+    def _on_scroll(self, first, last):
+        """Follow the view with the scrollbar and the cards, paging in more rows at the end"""
+        self.scrollbar.set(first, last)
+        self.render()
+        if float(last) >= 1.0 and self.count < len(self.items or ()):
+            self.limit += self.page_size
+            self._layout()
+
+    def render(self):
+        """Place and fill the cards for the rows in view"""
+        first, last = visible_rows(self.canvas.canvasy(0), self.canvas.winfo_height(), self.row_height, self.count)
+
+        # The pool only ever grows, to as many cards as the viewport has ever needed
+        while len(self.cards) < last - first:
+            card = self.build_card(self.canvas)
+            self.cards.append(card)
+            self._windows.append(self.canvas.create_window(0, 0, anchor="nw", window=card["frame"], state="hidden"))
+            self._shown.append(None)
+
+        width = self.canvas.winfo_width()
+        in_view = {}
+        for index in range(first, last):
+            in_view[index % len(self.cards)] = index
+        for slot, window in enumerate(self._windows):
+            index = in_view.get(slot)
+            if index is None:
+                self.canvas.itemconfigure(window, state="hidden")
+                continue
+            item = self.items[index]
+            if self._shown[slot] is not item:
+                self.fill_card(self.cards[slot], item)
+                self._shown[slot] = item
+            self.canvas.coords(window, 0, index * self.row_height)
+            self.canvas.itemconfigure(window, state="normal", width=width, height=self.row_height - CARD_GAP)
@@ -0,0 +1,161 @@
+import tkinter as tk
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class ChartPanel:
+    """A Matplotlib figure and Tk canvas that are created once and updated in place
+
+    With parent=None the figure gets an off-screen Agg canvas instead, so charts
+    can be built and rendered without a display.
+    """
+
+    def __init__(self, parent, figsize, nrows=1, ncols=1, subplot_kw=None, left=None, **pack_options):
+        # Figures are created without pyplot so they are never held by its figure manager
+        self.figure = Figure(figsize=figsize)
+        self.axes = list(self.figure.subplots(nrows, ncols, subplot_kw=subplot_kw, squeeze=False).flat)
+        self.left = left
+
+        if parent is None:
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            self.canvas = FigureCanvasTkAgg(self.figure, parent)
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, **pack_options)
+
+        # Artists kept between updates
+        self._bars = {}
+        self._bar_labels = {}
+        self._tick_labels = {}
+        self._lines = {}
+        self._overlays = {}
+        self._drawn_data = {}
+        self._needs_layout = True
+        self._dirty = True
+
+    def _unchanged(self, key, data):
+        """Remember the data drawn for a key and report whether it is the same as last time"""
+        if self._drawn_data.get(key) == data:
+            return True
+        self._drawn_data[key] = data
+        self._dirty = True
+        return False
+
+    def set_labels(self, index, title=None, xlabel=None, ylabel=None, **title_options):
+        """Set axes title and labels, re-running the layout only if they changed"""
+        ax = self.axes[index]
+        if title is not None and ax.get_title() != title:
+            ax.set_title(title, **title_options)
+            self._needs_layout = self._dirty = True
+        if xlabel is not None and ax.get_xlabel() != xlabel:
+            ax.set_xlabel(xlabel)
+            self._needs_layout = self._dirty = True
+        if ylabel is not None and ax.get_ylabel() != ylabel:
+            ax.set_ylabel(ylabel)
+            self._needs_layout = self._dirty = True
+
+    def bar(self, index, labels, values, color, alpha=0.7, horizontal=False,
+            value_labels=False, offset=0.1, fmt="{}"):
+        """Draw a bar chart, reusing the existing bars when the count is unchanged"""
+        if self._unchanged(("bar", index), (list(labels), list(values), color, alpha, fmt)):
+            return
+
+        ax = self.axes[index]
+        positions = list(range(len(values)))
+        container = self._bars.get(index)
+
+        if container is None or len(container) != len(values):
+            # Bar count changed - replace the bars and their value labels
+            if container is not None:
+                container.remove()
+            for text in self._bar_labels.pop(index, []):
+                text.remove()
+            draw = ax.barh if horizontal else ax.bar
+            container = draw(positions, values, color=color, alpha=alpha)
+            self._bars[index] = container
+            self._needs_layout = True
+        else:
+            # Same bars - just move their ends and recolour them
+            colors = color if isinstance(color, (list, tuple)) else [color]
+            for i, (patch, value) in enumerate(zip(container, values)):
+                if horizontal:
+                    patch.set_width(value)
+                else:
+                    patch.set_height(value)
+                patch.set_facecolor(colors[i % len(colors)])
+                patch.set_alpha(alpha)
+
+        # Category labels on the bar axis
+        labels = [str(label) for label in labels]
+        if self._tick_labels.get(index) != labels:
+            if horizontal:
+                ax.set_yticks(positions)
+                ax.set_yticklabels(labels)
+            else:
+                ax.set_xticks(positions)
+                ax.set_xticklabels(labels)
+            self._tick_labels[index] = labels
+            self._needs_layout = True
+
+        # Values at the end of each bar
+        if value_labels:
+            texts = self._bar_labels.setdefault(index, [])
+            while len(texts) < len(values):
+                texts.append(ax.text(0, 0, "", ha="left" if horizontal else "center",
+                                     va="center" if horizontal else "bottom"))
+            for position, value, text in zip(positions, values, texts):
+                text.set_text(fmt.format(value))
+                text.set_position((value + offset, position) if horizontal else (position, value + offset))
+
+        ax.relim()
+        ax.autoscale_view()
+
+    def pie(self, index, sizes, labels, colors, explode, title):
+        """Redraw a pie chart on the existing axes"""
+        if self._unchanged(("pie", index), (list(sizes), list(labels), title)):
+            return
+
+        ax = self.axes[index]
+        ax.clear()
+        if sum(sizes) > 0:
+            ax.pie(sizes, explode=explode, labels=labels, colors=colors,
+                   autopct='%1.1f%%', shadow=True, startangle=90)
+        ax.axis('equal')
+        ax.set_title(title)
+
+    def line(self, index, key, x, y, **style):
+        """Draw a line, updating its data if it already exists"""
+        ax = self.axes[index]
+        line = self._lines.get((index, key))
+        if self._unchanged(("line", index, key), (list(x), list(y), style.get("label"))) and line is not None:
+            return line
+
+        if line is None:
+            line, = ax.plot(x, y, **style)
+            self._lines[(index, key)] = line
+        else:
+            line.set_data(x, y)
+            if "label" in style:
+                line.set_label(style["label"])
+        ax.relim()
+        ax.autoscale_view()
+        return line
+
+    def overlay(self, index, key, artists):
+        """Replace a group of decorations (fills, annotations) drawn on an axes"""
+        for artist in self._overlays.pop((index, key), []):
+            artist.remove()
+        self._overlays[(index, key)] = list(artists)
+        self._dirty = True
+
+    def draw(self):
+        """Schedule a redraw of the canvas if anything changed since the last one"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        if self._needs_layout:
+            self.figure.tight_layout()
+            if self.left is not None:
+                self.figure.subplots_adjust(left=self.left)
+            self._needs_layout = False
+        self.canvas.draw_idle()
@@ -0,0 +1 @@
+# Puts the repository root on sys.path so the tests can import the dashboard modules
@@ -1,17 +1,68 @@
+import argparse
+import tempfile
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
 import requests
 import json
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-from PIL import Image, ImageTk
 import io
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from api_client import CricbuzzClient
+from card_list import VirtualCardList
+from fetcher import FetchExecutor
+from match_diff import MatchChanges, diff_match_data, diff_match_list
+from match_search import MatchIndex
+from monitor import PollScheduler, live_match_ids
+from prefetch import ScorecardPrefetcher
+from response_cache import ResponseCache
+from rate_limiter import QuotaExhausted
+from render_scheduler import RenderScheduler
+from refresh import RefreshTimer, match_state
+from replay_client import ReplayClient, SnapshotRecorder
+from scorecard import BatterLine, BowlerLine, Innings, Match, MatchHeader, Team, intern_name, overs_to_balls
+
+
+def load_analysis_modules():
+    """Import the chart, statistics and timeline modules (and numpy and matplotlib behind them)
+
+    They take a second or more to import on a slow machine and the selection screen
+    needs none of them, so they are loaded in the background while a match is picked,
+    and for certain when the dashboard is built. Safe to call from any thread, and
+    as often as needed.
+    """
+    global np, ChartPanel, rank, stats_for, DeliveryTimeline, ScoreHistory, parse_commentary
+    import numpy as np
+    from charts import ChartPanel
+    from match_stats import rank, stats_for
+    from timeline import DeliveryTimeline, ScoreHistory, parse_commentary
+
 
 class CricketDashboard:
-    def __init__(self, root):
+    # Match list states shown under Live Matches
+    LIVE_STATES = ("In Progress", "Live", "Innings Break", "Tea", "Lunch", "Drinks", "Stumps", "Rain")
+    
+    # Pause in typing before the match search runs
+    SEARCH_DELAY_MS = 150
+    
+    # How often finished background work is handed to the UI
+    UI_QUEUE_MS = 50
+    
+    # Seconds a saved session is reopened for at startup
+    SESSION_MAX_AGE = 2 * 24 * 60 * 60
+    
+    # Pause after the selection screen is built before the chart modules start loading behind it
+    WARM_UP_DELAY_MS = 200
+    
+    # Status when a match list is refused with a 429
+    RATE_LIMIT_MESSAGE = ("API rate limit reached (429). Matches couldn't be loaded - try again later, "
+                          "or run with --replay DIR.")
+    
+    def __init__(self, root, match_id=None, api=None, cache=None, refresh_interval=60, restore=False,
+                 persist_session=False):
+        self.started = time.perf_counter()  # First meaningful paint is timed from here
+        self.first_paint_time = None
         self.root = root
         self.root.title("Cricket Match Dashboard")
         self.root.geometry("1600x900")
@@ -20,19 +71,63 @@ class CricketDashboard:
         # Initialize data
         self.match_data = None
         self.cached_data = None
+        self.cached_match_id = None
+        self.timeline = None  # Ball-by-ball record of the current match
+        self.score_history = None  # Scores sampled from each poll, for when there's no commentary
         self.teams = []
         self.selected_team = tk.StringVar()
         self.selected_view = tk.StringVar(value="Overview")
         self.match_selection_done_var = tk.BooleanVar(value=False)
         self.selected_match_id = "117962"  # Default match ID
         
+        # Shared HTTP client for every API call and the workers that run them. A client passed
+        # in may be shared with other windows, so only one created here is closed on exit
+        self.api = api if api else CricbuzzClient()
+        self.owns_api = api is None
+        self.validators = {}  # ETags of this window's own responses, so other windows' polls don't mask changes
+        self.io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api")
+        
+        # UI updates from results, animations and toasts are batched into frames of at most 30 per second
+        self.render = RenderScheduler(self.root.after, self.root.after_cancel, fps=30)
+        self.toast_queue = []  # Toast messages; the first is on screen, the rest wait their turn
+        
+        # Worker results reach the Tk thread through one queue, drained every UI_QUEUE_MS. Fetches are
+        # tagged with a generation that changes with the match, so results for a previous match are dropped
+        self.fetcher = FetchExecutor(self.io_pool)
+        self.ui_queue_job = None
+        self._drain_ui_queue()
+        
+        # Responses persisted across restarts so the dashboard can render before the network answers
+        self.response_cache = cache if cache else ResponseCache()
+        self.match_list_changes = 0
+        
+        # Scorecards of the top live matches, fetched while the selection screen is up
+        self.prefetcher = ScorecardPrefetcher(self.root.after, self.root.after_cancel, self.fetcher,
+                                              self._prefetch_scorecard, self.api.budget)
+        
+        # Parsed match lists for the selection screen and their search indexes
+        self.live_matches = []
+        self.recent_matches = []
+        self.live_index = MatchIndex([])
+        self.recent_index = MatchIndex([])
+        self.search_var = None
+        self.search_job = None
+        
         # Threading control
-        self.is_fetching = False
         self.auto_refresh = tk.BooleanVar(value=True)
-        self.auto_refresh_interval = 60  # seconds
+        self.auto_refresh_interval = refresh_interval  # seconds
         self.failed_attempts = 0
         self.max_retry_attempts = 3
         
+        # The one timer behind auto-refresh; it adapts the interval to the match state
+        self.refresh_timer = RefreshTimer(self.root.after, self.root.after_cancel, self.fetch_data,
+                                          refresh_interval, self.api.budget)
+        
+        # Lazy tab rendering: only the visible tab is updated, the others wait until shown.
+        # Maps each out-of-date tab to its pending MatchChanges (None means redraw everything)
+        self.dirty_tabs = {}
+        self.tab_updaters = {}
+        
         # Define colors for theme
         self.colors = {
             "primary": "#113955",
@@ -47,8 +142,17 @@ class CricketDashboard:
             "error": "#e74c3c"
         }
         
-        # Show match selection screen to get match ID
-        self.match_id = self.get_match_id()
+        # Reopen the last session's match if asked to, else show match selection screen to get
+        # match ID unless one was given. Only the main window saves its session on close; drill-down
+        # windows leave it alone
+        self.persist_session = persist_session
+        self.session = self.load_session() if restore and not match_id else None
+        if self.session:
+            self.match_id = self.session["match_id"]
+            self.live_matches = self.session["live"]
+            self.recent_matches = self.session["recent"]
+        else:
+            self.match_id = match_id if match_id else self.get_match_id()
         
         # Create main dashboard after match is selected
         self.setup_main_dashboard()
@@ -63,95 +167,229 @@ class CricketDashboard:
         
         # Create a special mainloop just for the selection screen
         self.root.wait_variable(self.match_selection_done_var)
+        self.started = time.perf_counter()  # Time the first paint from the choice, not the time spent choosing
         
         # Return the selected match ID
         return self.selected_match_id
     
     def setup_main_dashboard(self):
         """Setup the main dashboard after match selection"""
+        # A search still waiting for typing to pause would filter lists that are about to go
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+            
         # Clear any existing widgets from the selection screen
         for widget in self.root.winfo_children():
             widget.destroy()
+        
+        # Charts and statistics from here on; usually already imported while the match was picked
+        load_analysis_modules()
+        self.timeline = DeliveryTimeline()
+        self.score_history = ScoreHistory()
             
         # Create main frames
         self.create_header_frame()
         self.create_sidebar()
         self.create_main_content()
         
-        # Fetch data
-        self.fetch_data()
+        # Render the last session or a prefetched scorecard straight away and refresh it, or else
+        # the last saved one, only hitting the API if that is stale
+        self.prefetcher.stop()
+        prefetched = self.prefetcher.take(self.match_id)
+        if self.session:
+            self._show_session(self.session)
+            self.fetch_data()
+        elif prefetched:
+            self._show_prefetched_scorecard(*prefetched)
+            self._record_first_paint("prefetched")
+            self.fetch_data()
+        else:
+            entry = self.response_cache.get("hscard", self.match_id)
+            if entry and self._show_cached_scorecard(entry):
+                self._record_first_paint("cached")
+            if not entry or not entry["fresh"]:
+                self.fetch_data()
         
         # Start auto-refresh
         self.start_auto_refresh()
     
-    def load_matches_data(self):
-        """Load match data from the API or sample JSON file"""
-        try:
-            # Start loading animation
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="Loading match data...")
-            
-            # Make API call to fetch live matches
-            url = "https://cricbuzz-cricket.p.rapidapi.com/matches/v1/live"
-            headers = {
-                # "x-rapidapi-key": "4ade6f2361msh57ccf4cb0584770p18e418jsnc58ddc583a78", #not working key(284 id)
-                "x-rapidapi-key": "17c4bae87fmsh204730bfc3da945p101869jsn2a8ef0d22e5d", #working key
-                # "x-rapidapi-key": "99cf81f013msh29100b8d02b6b9dp161532jsnd6a92c813a77", #working key (secondary)
-                "x-rapidapi-host": "cricbuzz-cricket.p.rapidapi.com"
-            }
-            url_recent = "https://cricbuzz-cricket.p.rapidapi.com/matches/v1/recent"
-            headers_recent = {
-                "x-rapidapi-key": "17c4bae87fmsh204730bfc3da945p101869jsn2a8ef0d22e5d",
-                "x-rapidapi-host": "cricbuzz-cricket.p.rapidapi.com"
-            }
-            try:
-                response = requests.get(url, headers=headers, timeout=15)
-                response_recent = requests.get(url_recent, headers=headers_recent, timeout=15)
-                if response.status_code == 200:
-                    matches_data = response.json()
-                    matches_data_recent = response_recent.json()
-                    self.populate_match_selection(matches_data, matches_data_recent)
-                                        
-                    if hasattr(self, 'status_label'):
-                        self.status_label.config(text=f"Live matches loaded - {datetime.now().strftime('%H:%M:%S')}")
-                elif response.status_code == 429:
-                                        
+    def load_matches_data(self, on_loaded=None, force=False):
+        """Fetch the live and recent match lists concurrently in the background"""
+        # Start loading animation
+        if hasattr(self, 'status_label'):
+            self.status_label.config(text="Loading match data...")
+        
+        # Show the cached lists while the network catches up; skip it entirely if they are fresh
+        if not force:
+            live_entry = self.response_cache.get("live", "all")
+            recent_entry = self.response_cache.get("recent", "all")
+            if live_entry and recent_entry:
+                self.populate_match_selection(live_entry["payload"], recent_entry["payload"])
+                if hasattr(self, 'status_label'):
+                    saved_at = datetime.fromtimestamp(live_entry["stored_at"]).strftime('%H:%M:%S')
+                    self.status_label.config(text=f"Showing matches saved at {saved_at} - refreshing...")
+                if live_entry["fresh"] and recent_entry["fresh"]:
                     if hasattr(self, 'status_label'):
-                        self.status_label.config(text=f"API rate limit reached (429). Using sample data instead.")
-                    
-                    # Show a more informative message
-                    if hasattr(self, 'root') and self.root.winfo_exists():
-                        messagebox.showinfo(
-                            "API Rate Limit", 
-                            "You've reached the RapidAPI rate limit for the Cricbuzz API.\n\n"
-                            "The application will use sample data for demonstration purposes.\n\n"
-                            "Rate limits typically reset after 24 hours."
-                        )
+                        self.status_label.config(text=f"Showing matches saved at {saved_at}")
+                    if on_loaded:
+                        on_loaded()
+                    return
+        
+        # Both requests run at once on the worker pool, so startup waits for the slower one only.
+        # The workers parse the lists too, leaving the Tk thread just the changed cards to update
+        started = time.perf_counter()
+        live_future = self.io_pool.submit(self._fetch_match_list, self.api.live_matches, "live")
+        recent_future = self.io_pool.submit(self._fetch_match_list, self.api.recent_matches, "recent")
+        
+        # Hand the results to the Tk thread once both lists have arrived
+        pending = [2]
+        pending_lock = threading.Lock()
+        
+        def on_done(future):
+            with pending_lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            self.fetcher.post(lambda: self._show_loaded_matches(live_future, recent_future, started, on_loaded))
+        
+        live_future.add_done_callback(on_done)
+        recent_future.add_done_callback(on_done)
+    
+    def _fetch_match_list(self, fetch, endpoint):
+        """Fetch, save, parse and index a match list (runs on a worker); returns (response, matches, index)"""
+        response = fetch()
+        if response.status_code != 200:
+            return response, None, None
+        payload = response.json()
+        self.response_cache.put(endpoint, "all", payload)
+        matches = self.parse_match_list(payload)
+        return response, matches, MatchIndex(matches)
+    
+    def _show_loaded_matches(self, live_future, recent_future, started, on_loaded=None):
+        """Populate the selection screen with fetched match lists (runs on main thread)"""
+        # The user may have picked a match while the lists were loading
+        if not hasattr(self, 'live_list') or not self.live_list.canvas.winfo_exists():
+            return
+        
+        # Each list stands on its own: one that failed is left as it was, the other is still shown
+        live_matches, live_index, live_error = self._match_list_result(live_future)
+        recent_matches, recent_index, recent_error = self._match_list_result(recent_future)
+        errors = {name: error for name, error in (("Live", live_error), ("Recent", recent_error)) if error}
+        
+        try:
+            if live_matches is not None or recent_matches is not None:
+                self.show_match_lists(live_matches, recent_matches, live_index, recent_index)
+                
+                # Time-to-first-card: from request start until the cards are laid out
+                self.root.update_idletasks()
+                self.match_list_load_time = time.perf_counter() - started
+            
+            if not errors:
+                if hasattr(self, 'status_label'):
+                    self.status_label.config(text=f"Live matches loaded in {self.match_list_load_time:.2f}s - {datetime.now().strftime('%H:%M:%S')} - {self.api.budget.remaining()} API calls left today")
+            else:
+                # One message if both lists failed the same way, else each list's own
+                messages = set(errors.values())
+                if len(messages) == 1 and len(errors) == 2:
+                    text = messages.pop()
                 else:
-                                       
-                    if hasattr(self, 'status_label'):
-                        self.status_label.config(text=f"API error ({response.status_code}). Using sample data.")
-            except requests.RequestException as e:                
+                    text = " ".join(f"{name} matches: {error}" for name, error in errors.items())
                 if hasattr(self, 'status_label'):
-                    self.status_label.config(text=f"Network error: {str(e)}. Using sample data.")
+                    self.status_label.config(text=text)
+            
+            if self.RATE_LIMIT_MESSAGE in errors.values():
+                # Show a more informative message
+                if hasattr(self, 'root') and self.root.winfo_exists():
+                    messagebox.showinfo(
+                        "API Rate Limit", 
+                        "You've reached the RapidAPI rate limit for the Cricbuzz API.\n\n"
+                        "The match lists couldn't be loaded. To try the dashboard offline, run it with\n"
+                        "--replay and a directory of recorded responses.\n\n"
+                        "Rate limits typically reset after 24 hours."
+                    )
                 
         except Exception as e:
                       
             if hasattr(self, 'status_label'):
-                self.status_label.config(text=f"Error: {str(e)}. Using sample data.")
+                self.status_label.config(text=f"Error: {str(e)}. Matches couldn't be loaded.")
             print(f"Error loading matches: {str(e)}")
+        
+        if on_loaded:
+            on_loaded()
+    
+    def _match_list_result(self, future):
+        """(matches, index, None) for a fetched match list, or (None, None, error message) if it failed"""
+        try:
+            response, matches, index = future.result()
+        except QuotaExhausted as e:
+            # Nothing was sent, so this isn't a network problem - the lists load once the budget refills
+            return None, None, f"{str(e)}. Matches can't be loaded until then."
+        except requests.RequestException as e:
+            return None, None, f"Network error: {str(e)}. Matches couldn't be loaded - run with --replay DIR to work offline."
+        except Exception as e:
+            # A malformed list must not take the other one with it
+            return None, None, f"Error: {str(e)}. Matches couldn't be loaded."
+        
+        if response.status_code == 429:
+            return None, None, self.RATE_LIMIT_MESSAGE
+        if response.status_code != 200:
+            return None, None, f"API error ({response.status_code}). Matches couldn't be loaded."
+        return matches, index, None
     
     def populate_match_selection(self, matches_data, matches_data_recent):
         """Populate the match selection screen with data from the API"""
-        
-        for widget in self.live_matches_frame.winfo_children():
-            widget.destroy()
-        for widget in self.recent_matches_frame.winfo_children():
-            widget.destroy()
-            
-        # Process match data for each category
-        live_matches = []
-        recent_matches = []
+        self.show_match_lists(self.parse_match_list(matches_data), self.parse_match_list(matches_data_recent))
+    
+    def show_match_lists(self, live_matches, recent_matches, live_index=None, recent_index=None):
+        """Show parsed match lists, refilling only the cards of matches that changed (None keeps a list)"""
+        self.match_list_changes = 0  # Matches added, updated or removed by this refresh
+        
+        if live_matches is not None:
+            # Live matches first, in play before breaks
+            live_matches = [match for match in live_matches if match["state"] in self.LIVE_STATES]
+            live_matches.sort(key=lambda x: 0 if x["state"] == "In Progress" else 1)
+            self.live_matches, added, updated, removed = diff_match_list(self.live_matches, live_matches)
+            self.live_index = live_index if live_index is not None else MatchIndex(live_matches)
+            self.match_list_changes += len(added) + len(updated) + len(removed)
+        
+        if recent_matches is not None:
+            self.recent_matches, added, updated, removed = diff_match_list(self.recent_matches, recent_matches)
+            self.recent_index = recent_index if recent_index is not None else MatchIndex(recent_matches)
+            self.match_list_changes += len(added) + len(updated) + len(removed)
+        
+        # Keep the current search applied, and the lists where they were scrolled to
+        self.apply_match_filter(reset=False)
+        
+        # Keep the scorecards of the matches in play at the top of the list ready to open
+        self.prefetcher.watch(match["id"] for match in self.live_matches if match["state"] == "In Progress")
+    
+    def on_search_changed(self, *args):
+        """Filter the match lists once typing pauses"""
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(self.SEARCH_DELAY_MS, self.apply_match_filter)
+    
+    def apply_match_filter(self, reset=True):
+        """Show the matches that answer the search box, best matches first"""
+        self.search_job = None
+        query = self.search_var.get() if self.search_var else ""
+        live_matches = self.live_index.filter(self.live_matches, query)
+        recent_matches = self.recent_index.filter(self.recent_matches, query)
+        self.live_list.set_items(live_matches, reset=reset)
+        self.recent_list.set_items(recent_matches, reset=reset)
+        
+        if reset and hasattr(self, 'status_label'):
+            if query.strip():
+                self.status_label.config(text=f"{len(live_matches)} live and {len(recent_matches)} recent "
+                                              f"matches for \"{query.strip()}\"")
+            else:
+                self.status_label.config(text=f"{len(live_matches)} live and {len(recent_matches)} recent matches")
+    
+    @staticmethod
+    def parse_match_list(matches_data):
+        """Flatten a live or recent match list response into one dict per match"""
+        matches = []
         
         # Extract matches from different types
         for match_type in matches_data.get("typeMatches", []):
@@ -201,97 +439,12 @@ class CricketDashboard:
                             match_data["team1_score"] = "No score"
                             match_data["team2_score"] = "No score"
                         
-                        # Categorize matches as live or recent
-                        if status in ["In Progress", "Live", "Innings Break", "Tea", "Lunch", "Drinks", "Stumps", "Rain"]:
-                            live_matches.append(match_data)
-        
-        # Process recent matches
-        for match_type in matches_data_recent.get("typeMatches", []):
-            type_name = match_type.get("matchType", "")
-            
-            for series_match in match_type.get("seriesMatches", []):
-                if "seriesAdWrapper" in series_match:
-                    series_data = series_match["seriesAdWrapper"]
-                    series_name = series_data.get("seriesName", "")
-                    
-                    for match in series_data.get("matches", []):
-                        match_info = match.get("matchInfo", {})
-                        status = match_info.get("state", "")
-                        
-                        match_data = {
-                            "id": match_info.get("matchId", ""),
-                            "series": series_name,
-                            "description": match_info.get("matchDesc", ""),
-                            "format": match_info.get("matchFormat", ""),
-                            "status": match_info.get("status", ""),
-                            "state": status,
-                            "team1": match_info.get("team1", {}).get("teamName", ""),
-                            "team2": match_info.get("team2", {}).get("teamName", ""),
-                            "venue": match_info.get("venueInfo", {}).get("ground", ""),
-                            "city": match_info.get("venueInfo", {}).get("city", ""),
-                            "type": type_name
-                        }
-                        
-                        # Get score data if available
-                        if "matchScore" in match:
-                            score_data = match["matchScore"]
-                            
-                            team1_score = score_data.get("team1Score", {})
-                            if team1_score and "inngs1" in team1_score:
-                                innings1 = team1_score["inngs1"]
-                                match_data["team1_score"] = f"{innings1.get('runs', 0)}/{innings1.get('wickets', 0)} ({innings1.get('overs', 0)} ov)"
-                            else:
-                                match_data["team1_score"] = "Yet to bat"
-                                
-                            team2_score = score_data.get("team2Score", {})
-                            if team2_score and "inngs1" in team2_score:
-                                innings2 = team2_score["inngs1"]
-                                match_data["team2_score"] = f"{innings2.get('runs', 0)}/{innings2.get('wickets', 0)} ({innings2.get('overs', 0)} ov)"
-                            else:
-                                match_data["team2_score"] = "Yet to bat"
-                        else:
-                            match_data["team1_score"] = "No score"
-                            match_data["team2_score"] = "No score"
-                        
-                        # Categorize matches as live or recent
-                        recent_matches.append(match_data)        
-                                  
-        # Sort matches - live by state, recent by recency
-        live_matches.sort(key=lambda x: 0 if x["state"] == "In Progress" else 1)
-        
-        # Create match cards for live matches
-        if live_matches:
-            for match in live_matches:
-                self.create_match_card(self.live_matches_frame, match)
-        else:
-            no_matches_label = tk.Label(
-                self.live_matches_frame,
-                text="No live matches available",
-                font=("Arial", 12),
-                bg=self.colors["bg_light"],
-                fg=self.colors["text"],
-                pady=20
-            )
-            no_matches_label.pack()
+                        matches.append(match_data)
         
-        # Create match cards for recent matches
-        if recent_matches:
-            # Show max 10 recent matches
-            for match in recent_matches[:10]:
-                self.create_match_card(self.recent_matches_frame, match)
-        else:
-            no_matches_label = tk.Label(
-                self.recent_matches_frame,
-                text="No recent matches available",
-                font=("Arial", 12),
-                bg=self.colors["bg_light"],
-                fg=self.colors["text"],
-                pady=20
-            )
-            no_matches_label.pack()
+        return matches
     
-    def create_match_card(self, parent_frame, match_data):
-        """Create a card for a match in the selection screen"""
+    def create_match_card(self, parent_frame):
+        """Create an empty card for the selection screen's match lists (filled by fill_match_card)"""
         # Create card frame
         card_frame = tk.Frame(
             parent_frame, 
@@ -301,7 +454,6 @@ class CricketDashboard:
             pady=10,
             padx=10  # Added horizontal padding
         )
-        card_frame.pack(fill=tk.X, pady=5)
         
         # Top row with series name and format
         top_row = tk.Frame(card_frame, bg="white")
@@ -309,7 +461,6 @@ class CricketDashboard:
         
         series_label = tk.Label(
             top_row,
-            text=match_data["series"],
             font=("Arial", 9),
             bg="white",
             fg="#666666"
@@ -318,7 +469,6 @@ class CricketDashboard:
         
         format_label = tk.Label(
             top_row,
-            text=match_data["format"],
             font=("Arial", 9, "bold"),
             bg="white",
             fg=self.colors["accent"]
@@ -331,74 +481,46 @@ class CricketDashboard:
         teams_frame.columnconfigure(0, weight=3)  # Team name column - takes more space
         teams_frame.columnconfigure(1, weight=2)  # Score column - fixed width
         
-        # Team 1
-        team1_name = tk.Label(
-            teams_frame,
-            text=match_data["team1"],
-            font=("Arial", 11, "bold"),
-            bg="white",
-            anchor="w",
-            justify=tk.LEFT
-        )
-        team1_name.grid(row=0, column=0, sticky="w", pady=2)
-        
-        team1_score = tk.Label(
-            teams_frame,
-            text=match_data.get("team1_score", ""),
-            font=("Arial", 11),
-            bg="white",
-            anchor="e",
-            width=30,  # Fixed width to prevent truncation
-            justify=tk.RIGHT
-        )
-        team1_score.grid(row=0, column=1, sticky="e", pady=2)
-        
-        # Team 2
-        team2_name = tk.Label(
-            teams_frame,
-            text=match_data["team2"],
-            font=("Arial", 11, "bold"),
-            bg="white",
-            anchor="w",
-            justify=tk.LEFT
-        )
-        team2_name.grid(row=1, column=0, sticky="w", pady=2)
-        
-        team2_score = tk.Label(
-            teams_frame,
-            text=match_data.get("team2_score", ""),
-            font=("Arial", 11),
-            bg="white",
-            anchor="e",
-            width=30,  # Fixed width to prevent truncation
-            justify=tk.RIGHT
-        )
-        team2_score.grid(row=1, column=1, sticky="e", pady=2)
+        team_labels = []
+        for row in range(2):
+            team_name = tk.Label(
+                teams_frame,
+                font=("Arial", 11, "bold"),
+                bg="white",
+                anchor="w",
+                justify=tk.LEFT
+            )
+            team_name.grid(row=row, column=0, sticky="w", pady=2)
+            
+            team_score = tk.Label(
+                teams_frame,
+                font=("Arial", 11),
+                bg="white",
+                anchor="e",
+                width=30,  # Fixed width to prevent truncation
+                justify=tk.RIGHT
+            )
+            team_score.grid(row=row, column=1, sticky="e", pady=2)
+            team_labels.append((team_name, team_score))
         
-        # Match status
+        # Match status and venue
         status_frame = tk.Frame(card_frame, bg="white", pady=5)
         status_frame.pack(fill=tk.X)
         
         status_label = tk.Label(
             status_frame,
-            text=match_data["status"],
             font=("Arial", 10),
-            bg="white",
-            fg="#2c3e50" if match_data["state"] != "In Progress" else "#e74c3c"
+            bg="white"
         )
         status_label.pack(side=tk.LEFT)
         
-        # Venue info
-        if match_data.get("venue"):
-            venue_text = f"{match_data['venue']}, {match_data['city']}" if match_data.get("city") else match_data["venue"]
-            venue_label = tk.Label(
-                status_frame,
-                text=venue_text,
-                font=("Arial", 9),
-                bg="white",
-                fg="#666666"
-            )
-            venue_label.pack(side=tk.RIGHT)
+        venue_label = tk.Label(
+            status_frame,
+            font=("Arial", 9),
+            bg="white",
+            fg="#666666"
+        )
+        venue_label.pack(side=tk.RIGHT)
         
         # Button to select match
         select_button = tk.Button(
@@ -408,10 +530,32 @@ class CricketDashboard:
             fg="white",
             font=("Arial", 10),
             padx=10,
-            pady=5,
-            command=lambda id=match_data["id"]: self.load_match_from_selection(id)
+            pady=5
         )
         select_button.pack(pady=(5, 0))
+        
+        return {"frame": card_frame, "series": series_label, "format": format_label, "teams": team_labels,
+                "status": status_label, "venue": venue_label, "select": select_button}
+    
+    def fill_match_card(self, card, match_data):
+        """Show a match on a card, which may have been showing another one"""
+        card["series"].config(text=match_data["series"])
+        card["format"].config(text=match_data["format"])
+        for (team_name, team_score), team in zip(card["teams"], ("team1", "team2")):
+            team_name.config(text=match_data[team])
+            team_score.config(text=match_data.get(f"{team}_score", ""))
+        card["status"].config(
+            text=match_data["status"],
+            fg="#2c3e50" if match_data["state"] != "In Progress" else "#e74c3c"
+        )
+        
+        # Venue info
+        if match_data.get("venue"):
+            venue_text = f"{match_data['venue']}, {match_data['city']}" if match_data.get("city") else match_data["venue"]
+        else:
+            venue_text = ""
+        card["venue"].config(text=venue_text)
+        card["select"].config(command=lambda id=match_data["id"]: self.load_match_from_selection(id))
     
     def load_match_from_selection(self, match_id):
         """Load the selected match and close the selection screen"""
@@ -504,6 +648,24 @@ class CricketDashboard:
         )
         load_button.pack(side=tk.RIGHT)
         
+        # Search box that filters both match lists as you type
+        search_box = ttk.LabelFrame(direct_access_frame, text="Search Matches")
+        search_box.pack(fill=tk.X, pady=5)
+        
+        search_content = tk.Frame(search_box, bg=self.colors["bg_light"], padx=10, pady=10)
+        search_content.pack(fill=tk.X)
+        
+        tk.Label(
+            search_content,
+            text="Team, series, venue or format:",
+            font=("Arial", 12, "bold"),
+            bg=self.colors["bg_light"]
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self.on_search_changed)
+        tk.Entry(search_content, textvariable=self.search_var, font=("Arial", 12)).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
         # Main content frame with two columns
         content_frame = tk.Frame(self.selection_frame, bg=self.colors["bg_light"], padx=20, pady=10)
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -524,36 +686,10 @@ class CricketDashboard:
             fg=self.colors["text_light"]
         ).pack(anchor="w")
         
-        # Create scrollable area for live matches
-        live_canvas = tk.Canvas(live_frame, bg=self.colors["bg_light"])
-        live_scrollbar = ttk.Scrollbar(live_frame, orient="vertical", command=live_canvas.yview)
-        
-        self.live_matches_frame = tk.Frame(live_canvas, bg=self.colors["bg_light"])
-        
-        # Make sure the live matches frame has a fixed width equal to the canvas
-        def configure_live_frame(event):
-            # Update scrollregion to include all items
-            live_canvas.configure(scrollregion=live_canvas.bbox("all"))
-            # Set the frame width to match the canvas width minus padding
-            canvas_width = event.width
-            live_canvas.itemconfig(live_frame_id, width=canvas_width)
-            
-        self.live_matches_frame.bind("<Configure>", configure_live_frame)
-        
-        # Create the window with the frame - store the window ID for later use
-        live_frame_id = live_canvas.create_window((0, 0), window=self.live_matches_frame, anchor="nw", width=live_canvas.winfo_width())
-        
-        # Configure the canvas to expand and fill
-        live_canvas.configure(yscrollcommand=live_scrollbar.set)
-        live_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        live_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
-        
-        # Configure canvas to update width when resized
-        def on_live_canvas_configure(event):
-            canvas_width = event.width
-            live_canvas.itemconfig(live_frame_id, width=canvas_width)
-            
-        live_canvas.bind('<Configure>', on_live_canvas_configure)
+        # Scrollable list of live matches, with cards only for the rows in view
+        self.live_list = VirtualCardList(live_frame, self.create_match_card, self.fill_match_card,
+                                         empty_text="No live matches available",
+                                         bg=self.colors["bg_light"], fg=self.colors["text"])
         
         # Right column - Recent Matches
         recent_frame = tk.Frame(content_frame, bg=self.colors["bg_light"], relief=tk.RIDGE, bd=1)
@@ -571,36 +707,10 @@ class CricketDashboard:
             fg=self.colors["text_light"]
         ).pack(anchor="w")
         
-        # Create scrollable area for recent matches
-        recent_canvas = tk.Canvas(recent_frame, bg=self.colors["bg_light"])
-        recent_scrollbar = ttk.Scrollbar(recent_frame, orient="vertical", command=recent_canvas.yview)
-        
-        self.recent_matches_frame = tk.Frame(recent_canvas, bg=self.colors["bg_light"])
-        
-        # Make sure the recent matches frame has a fixed width equal to the canvas
-        def configure_recent_frame(event):
-            # Update scrollregion to include all items
-            recent_canvas.configure(scrollregion=recent_canvas.bbox("all"))
-            # Set the frame width to match the canvas width minus padding
-            canvas_width = event.width
-            recent_canvas.itemconfig(frame_id, width=canvas_width)
-            
-        self.recent_matches_frame.bind("<Configure>", configure_recent_frame)
-        
-        # Create the window with the frame - store the window ID for later use
-        frame_id = recent_canvas.create_window((0, 0), window=self.recent_matches_frame, anchor="nw", width=recent_canvas.winfo_width())
-        
-        # Configure the canvas to expand and fill
-        recent_canvas.configure(yscrollcommand=recent_scrollbar.set)
-        recent_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        recent_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
-        
-        # Configure canvas to update width when resized
-        def on_recent_canvas_configure(event):
-            canvas_width = event.width
-            recent_canvas.itemconfig(frame_id, width=canvas_width)
-            
-        recent_canvas.bind('<Configure>', on_recent_canvas_configure)
+        # Scrollable list of recent matches, paged in as the list is scrolled to the end
+        self.recent_list = VirtualCardList(recent_frame, self.create_match_card, self.fill_match_card,
+                                           empty_text="No recent matches available",
+                                           bg=self.colors["bg_light"], fg=self.colors["text"])
         
         # Manual entry section
         manual_frame = tk.Frame(self.selection_frame, bg=self.colors["bg_light"], pady=15)
@@ -632,59 +742,99 @@ class CricketDashboard:
         # Load match data
         self.load_matches_data()
         
+        # Import the chart stack in the background while the user picks a match
+        self.root.after(self.WARM_UP_DELAY_MS, lambda: threading.Thread(
+            target=load_analysis_modules, name="warm-up", daemon=True).start())
+        
         # Schedule periodic refresh (every 5 minutes)
         self.match_list_refresh_job = self.root.after(300000, self.schedule_match_list_refresh)
     
     def on_close(self):
         """Handle window close event"""
-        # Cancel any pending animations or timers
-        if hasattr(self, 'loading_animation_id') and self.loading_animation_id:
-            self.root.after_cancel(self.loading_animation_id)
+        if self.persist_session:
+            self.save_session()
+        self.stop()
+        
+        # Close the window
+        self.root.destroy()
+    
+    def stop(self):
+        """Cancel every timer and release the workers, leaving the window to whoever owns it"""
+        # Cancel any pending animations, flashes and toast removals
+        self.render.close()
+        self.loading_animation_id = None
             
         # Cancel match list refresh timer if it exists
         if hasattr(self, 'match_list_refresh_job') and self.match_list_refresh_job:
             self.root.after_cancel(self.match_list_refresh_job)
             self.match_list_refresh_job = None
-            
-        # Close the window
-        self.root.destroy()
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+            
+        self.refresh_timer.stop()
+        self.prefetcher.stop()
+        if self.ui_queue_job:
+            self.root.after_cancel(self.ui_queue_job)
+            self.ui_queue_job = None
+            
+        # Release pooled HTTP connections and worker threads
+        self.io_pool.shutdown(wait=False)
+        if self.owns_api:
+            self.api.close()
+    
+    def save_session(self):
+        """Save the open match, its latest scorecard and the match lists for the next start"""
+        entry = self.response_cache.get("hscard", self.match_id)
+        if entry is None:
+            return
+        self.response_cache.put("session", "last", {
+            "match_id": self.match_id,
+            "scorecard": entry["payload"],
+            "live": self.live_matches,
+            "recent": self.recent_matches
+        })
+    
+    def load_session(self):
+        """The session saved by the last run (with its stored_at), or None if there isn't a recent one"""
+        entry = self.response_cache.get("session", "last")
+        if entry is None or entry["age"] > self.SESSION_MAX_AGE:
+            return None
+        session = entry["payload"]
+        session["stored_at"] = entry["stored_at"]
+        return session
     
     def update_match_list(self, show_loading=True):
         """Fetch and update the available matches"""
         # Show loading indicator if requested
         if show_loading and hasattr(self, 'status_label'):
             self.status_label.config(text="Refreshing live matches...")
-            self.root.update()
-            
-        # Clear previous content
-        if hasattr(self, 'live_matches_frame'):
-            for widget in self.live_matches_frame.winfo_children():
-                widget.destroy()
         
-        if hasattr(self, 'recent_matches_frame'):
-            for widget in self.recent_matches_frame.winfo_children():
-                widget.destroy()
-        
-        # Reload match data - this will fetch from API or use fallback
-        self.load_matches_data()
-        
-        # Visual feedback after refresh
-        if show_loading and hasattr(self, 'status_label'):
-            self.status_label.config(text=f"Matches refreshed at {datetime.now().strftime('%H:%M:%S')}")
-            
-            # Create blinking effect for user feedback
-            def blink_status(count=0):
-                if count < 4:  # Blink 2 times
-                    if count % 2 == 0:
-                        self.status_label.config(fg=self.colors["accent"])
+        # Visual feedback once the refreshed lists are shown
+        def on_refreshed():
+            if show_loading and hasattr(self, 'status_label'):
+                self.status_label.config(text=f"Matches refreshed at {datetime.now().strftime('%H:%M:%S')} "
+                                              f"({self.match_list_changes} changed)")
+                
+                # Create blinking effect for user feedback
+                def blink_status(count=0):
+                    if count < 4:  # Blink 2 times
+                        if count % 2 == 0:
+                            self.status_label.config(fg=self.colors["accent"])
+                        else:
+                            self.status_label.config(fg=self.colors["text"])
+                        self.root.after(250, lambda: blink_status(count + 1))
                     else:
                         self.status_label.config(fg=self.colors["text"])
-                    self.root.after(250, lambda: blink_status(count + 1))
-                else:
-                    self.status_label.config(fg=self.colors["text"])
-            
-            # Start blinking effect
-            blink_status()
+                
+                # Start blinking effect
+                blink_status()
+            elif hasattr(self, 'status_label'):
+                self.status_label.config(text=f"Match list auto-refreshed at {datetime.now().strftime('%H:%M:%S')} "
+                                              f"({self.match_list_changes} changed)")
+        
+        # Reload match data in the background - only the cards of changed matches are updated
+        self.load_matches_data(on_loaded=on_refreshed, force=True)
     
     def schedule_match_list_refresh(self):
         """Schedule periodic refresh of the match list"""
@@ -692,10 +842,6 @@ class CricketDashboard:
         if hasattr(self, 'selection_frame') and self.selection_frame.winfo_ismapped():
             self.update_match_list(show_loading=False)
             
-            # Update status
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text=f"Match list auto-refreshed at {datetime.now().strftime('%H:%M:%S')}")
-            
             # Schedule the next refresh after 5 minutes (300000 ms)
             self.match_list_refresh_job = self.root.after(300000, self.schedule_match_list_refresh)
     
@@ -741,36 +887,62 @@ class CricketDashboard:
         )
         status_label.pack(side=tk.RIGHT, padx=5)
         
+        # Remaining API quota
+        self.budget_var = tk.StringVar()
+        budget_label = tk.Label(
+            controls_frame,
+            textvariable=self.budget_var,
+            bg="#113955",
+            fg="white"
+        )
+        budget_label.pack(side=tk.RIGHT, padx=5)
+        self.update_budget_status()
+        
         # Add last updated time
         self.last_updated_var = tk.StringVar(value="Last updated: Never")
-        last_updated_label = tk.Label(
+        self.last_updated_label = tk.Label(
             controls_frame,
             textvariable=self.last_updated_var,
             bg="#113955",
             fg="white"
         )
-        last_updated_label.pack(side=tk.RIGHT, padx=5)
+        self.last_updated_label.pack(side=tk.RIGHT, padx=5)
         
         # Initialize loading animation
+        self.loading = False
         self.loading_animation_id = None
         self.loading_angle = 0
         
+    def update_budget_status(self):
+        """Show how many API calls are left in today's budget"""
+        text = f"API budget: {self.api.budget.remaining()}/{self.api.budget.day.capacity}"
+        
+        # Tell the user when polling has been slowed down for the match state or to save quota
+        interval = self.refresh_timer.interval()
+        if interval is None:
+            text += " (match over, auto-refresh stopped)"
+        elif interval > self.auto_refresh_interval:
+            text += f" (refresh every {interval:.0f}s)"
+        self.budget_var.set(text)
+    
     def start_loading_animation(self):
         """Start the loading animation"""
-        # Cancel any existing animation
-        if self.loading_animation_id:
-            self.root.after_cancel(self.loading_animation_id)
-            
         # Reset loading indicator to green
         self.loading_indicator.itemconfig("loading", fill="#2ecc71")
         
-        # Start animation
-        self._animate_loading()
+        # Start animation, replacing any that is still running
+        if self.loading_animation_id:
+            self.render.cancel(self.loading_animation_id)
+        self.loading = True
+        self.render.invalidate("loading", self._animate_loading)
         
     def _animate_loading(self):
         """Animate the loading indicator"""
-        # Update angle
-        self.loading_angle = (self.loading_angle + 10) % 360
+        if not self.loading:
+            return
+        
+        # Update angle, turning at the same speed however the frames fall
+        self.loading_angle = int(time.perf_counter() * 200) % 360
         
         # Draw arc
         self.loading_indicator.delete("arc")
@@ -783,14 +955,16 @@ class CricketDashboard:
             tags="arc"
         )
         
-        # Schedule next animation frame
-        self.loading_animation_id = self.root.after(50, self._animate_loading)
+        # Schedule next animation frame, drawn with whatever else that frame updates
+        self.loading_animation_id = self.render.invalidate_after(50, "loading", self._animate_loading)
         
     def stop_loading_animation(self, success=True):
         """Stop the loading animation"""
         # Cancel animation
+        self.loading = False
+        self.render.discard("loading")
         if self.loading_animation_id:
-            self.root.after_cancel(self.loading_animation_id)
+            self.render.cancel(self.loading_animation_id)
             self.loading_animation_id = None
             
         # Update indicator color based on success
@@ -866,7 +1040,7 @@ class CricketDashboard:
             state="readonly"
         )
         self.view_dropdown.pack(fill=tk.X, padx=10, pady=(0, 10))
-        self.view_dropdown.bind("<<ComboboxSelected>>", self.update_dashboard)
+        self.view_dropdown.bind("<<ComboboxSelected>>", self.on_view_selected)
         
         # Additional controls
         refresh_frame = ttk.LabelFrame(sidebar_frame, text="Data Controls", padding=10)
@@ -962,6 +1136,25 @@ class CricketDashboard:
         self.progress_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.progress_tab, text="Match Progress")
         
+        # Map each tab to its builder and sidebar view name
+        self.tab_builders = {
+            self.overview_tab: self.create_overview_tab,
+            self.batting_tab: self.create_batting_tab,
+            self.bowling_tab: self.create_bowling_tab,
+            self.players_tab: self.create_players_tab,
+            self.progress_tab: self.create_progress_tab
+        }
+        self.view_tabs = {
+            "Overview": self.overview_tab,
+            "Batting Analysis": self.batting_tab,
+            "Bowling Analysis": self.bowling_tab,
+            "Player Stats": self.players_tab,
+            "Match Progress": self.progress_tab
+        }
+        
+        # Build dirty tabs when the user switches to them
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        
         # Footer with notes
         footer = tk.Frame(self.main_frame, bg="#f0f0f0", height=30)
         footer.pack(fill=tk.X, side=tk.BOTTOM)
@@ -975,36 +1168,44 @@ class CricketDashboard:
         note_label.pack(side=tk.RIGHT, padx=20, pady=5)
     
     def fetch_data(self):
-        """Fetch data from the API using a separate thread"""
-        if self.is_fetching:
-            return  # Prevent multiple concurrent fetches
+        """Fetch the current match's scorecard on the worker pool"""
+        # Only poll conditionally when the cache holds this match's data, and only ask for the
+        # commentary conditionally when the timeline already holds this match's overs
+        conditional = self.cached_data is not None and self.cached_match_id == self.match_id
+        commentary_conditional = str(self.timeline.match_id) == str(self.match_id) and len(self.timeline) > 0
+        if not self.fetcher.submit("hscard", self._fetch_scorecard, self.match_id, conditional,
+                                   commentary_conditional):
+            return  # Prevent multiple concurrent fetches of the same match
             
-        self.is_fetching = True
         self.status_var.set("Status: Fetching data...")
         self.start_loading_animation()
-        
-        # Start a new thread for the API call
-        fetch_thread = threading.Thread(target=self._fetch_data_thread)
-        fetch_thread.daemon = True  # Make sure thread doesn't prevent app from closing
-        fetch_thread.start()
     
-    def _fetch_data_thread(self):
-        """Background thread function for fetching data"""
+    def _drain_ui_queue(self):
+        """Run the UI updates of finished background work (runs on main thread)"""
+        try:
+            self.fetcher.drain()
+        finally:
+            # One failed update must not stop the rest from reaching the UI
+            self.ui_queue_job = self.root.after(self.UI_QUEUE_MS, self._drain_ui_queue)
+    
+    def _fetch_scorecard(self, match_id, conditional, commentary_conditional):
+        """Fetch and process a scorecard (runs on a worker); returns the UI update to run on the main thread
+
+        The worker leaves the dashboard's state alone: the update it returns carries the
+        result, and only changes cached_data and failed_attempts if its generation is
+        still current when the UI runs it.
+        """
         try:
             # Make the API call with the user-provided match ID
-            url = f"https://cricbuzz-cricket.p.rapidapi.com/mcenter/v1/{self.match_id}/hscard"
-            headers = {
-                # "x-rapidapi-key": "4ade6f2361msh57ccf4cb0584770p18e418jsnc58ddc583a78", #not working key(284 id)
-                "x-rapidapi-key": "17c4bae87fmsh204730bfc3da945p101869jsn2a8ef0d22e5d", #working key
-                # "x-rapidapi-key": "99cf81f013msh29100b8d02b6b9dp161532jsnd6a92c813a77", #working key (secondary)
-                "x-rapidapi-host": "cricbuzz-cricket.p.rapidapi.com"
-            }
-            response = requests.get(url, headers=headers, timeout=10)  # Add timeout
-            
-            if response.status_code == 429:
+            response = self.api.scorecard(match_id, conditional=conditional, validators=self.validators)
+            
+            if response.unchanged:
+                # 304 or identical body - skip parsing and re-rendering entirely
+                return self._update_ui_unchanged
+            elif response.status_code == 429:
                 # Handle rate limit exceeded
                 error_msg = "API rate limit exceeded (429). Try again later."
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.fetcher.post(lambda: messagebox.showinfo(
                     "API Rate Limit", 
                     "You've reached the RapidAPI rate limit for the Cricbuzz API.\n\n"
                     "The application will use cached data if available.\n\n"
@@ -1019,45 +1220,135 @@ class CricketDashboard:
             # Process the API response
             processed_data = self.process_api_data(api_data)
             
-            # Cache the successfully fetched data
-            self.cached_data = processed_data
-            self.failed_attempts = 0  # Reset failed attempts counter
+            # Save the response on disk, under its own match ID; the UI update caches it in memory
+            self.response_cache.put("hscard", match_id, api_data)
             
-            # Schedule UI updates to run on the main thread
-            self.root.after(0, lambda: self._update_ui_with_data(processed_data))
+            # The scorecard moved on, so there may be newly finished overs in the commentary
+            overs = self._fetch_commentary(match_id, commentary_conditional)
             
-        except Exception as e:
-            # Increment failed attempts
-            self.failed_attempts += 1
+            return lambda: self._update_ui_with_data(match_id, processed_data, overs)
             
-            # Use cached data if available
-            if self.cached_data and self.failed_attempts <= self.max_retry_attempts:
-                # Schedule UI update with cached data
-                self.root.after(0, lambda: self._update_ui_with_cached_data(str(e)))
-            else:
-                # Handle errors on the main thread if no cache or too many failures
-                self.root.after(0, lambda: self._handle_fetch_error(str(e)))
-        finally:
-            # Reset fetching flag
-            self.is_fetching = False
+        except QuotaExhausted as e:
+            # Nothing was sent - keep showing the current data until the budget refills
+            message = str(e)  # e is unbound once the except block ends
+            return lambda: self._update_ui_budget_exhausted(message)
+        except Exception as e:
+            message = str(e)  # e is unbound once the except block ends
+            return lambda: self._update_ui_fetch_failed(match_id, message)
     
-    def _update_ui_with_cached_data(self, error_message):
-        """Update UI with cached data when live fetch fails"""
-        if not self.cached_data:
+    def _fetch_commentary(self, match_id, conditional):
+        """Completed overs from the commentary feed, or an empty list if unchanged or it can't be fetched"""
+        try:
+            response = self.api.commentary(match_id, conditional=conditional, validators=self.validators)
+            if response.unchanged or response.status_code != 200:
+                return []
+            return parse_commentary(response.json())
+        except (requests.RequestException, ValueError) as e:
+            # The scorecard is still worth showing without the progress tab's new overs
+            print(f"Failed to fetch commentary: {str(e)}")
+            return []
+    
+    def load_cached_scorecard(self, match_id):
+        """Return processed data for a match from the memory cache, falling back to the disk cache"""
+        if self.cached_data is not None and self.cached_match_id == match_id:
+            return self.cached_data
+        
+        entry = self.response_cache.get("hscard", match_id)
+        if entry is None:
+            return None
+        
+        try:
+            self.cached_data = self.process_api_data(entry["payload"])
+        except Exception as e:
+            print(f"Ignoring unreadable cached scorecard: {str(e)}")
+            return None
+        self.cached_match_id = match_id
+        return self.cached_data
+    
+    def _prefetch_scorecard(self, match_id):
+        """Fetch, save and process a scorecard before it is opened (runs on a worker)
+
+        Returns (processed data, the response's validators), or None if unavailable. The
+        validators only join the window's own when the scorecard is shown, so the first
+        poll after opening the match asks whether exactly that scorecard has changed.
+        """
+        validators = {}
+        response = self.api.scorecard(match_id, validators=validators)
+        if response.status_code != 200:
+            return None
+        api_data = response.json()
+        self.response_cache.put("hscard", match_id, api_data)
+        return self.process_api_data(api_data), validators
+    
+    def _show_prefetched_scorecard(self, prefetched, age):
+        """Render a scorecard prefetched from the selection screen (runs on main thread)"""
+        processed_data, validators = prefetched
+        self.validators.update(validators)
+        self.cached_data = processed_data
+        self.cached_match_id = self.match_id
+        self.apply_match_data(processed_data)
+        self.last_updated_var.set(f"Last updated: {age:.0f}s ago (prefetched)")
+        self.status_var.set("Status: Showing prefetched data")
+    
+    def _show_session(self, session):
+        """Render the scorecard left up by the last run, marked stale until the first fetch lands"""
+        if not self._show_cached_scorecard({"payload": session["scorecard"], "stored_at": session["stored_at"]}):
+            return
+        saved_at = datetime.fromtimestamp(session["stored_at"]).strftime("%d %b %H:%M:%S")
+        self.last_updated_var.set(f"Last updated: {saved_at} (stale - last session)")
+        self._record_first_paint("last session")
+        self.status_var.set(f"Status: Showing last session ({self.first_paint_time * 1000:.0f} ms) - refreshing...")
+    
+    def _record_first_paint(self, source):
+        """Time from opening the dashboard until the first scorecard is on screen (once per dashboard)"""
+        if self.first_paint_time is not None:
+            return
+        self.render.flush()
+        self.root.update_idletasks()
+        self.first_paint_time = time.perf_counter() - self.started
+        print(f"First meaningful paint after {self.first_paint_time * 1000:.0f} ms ({source})")
+    
+    def _show_cached_scorecard(self, entry):
+        """Render a scorecard saved by a previous session (runs on main thread); returns whether it could"""
+        try:
+            self.cached_data = self.process_api_data(entry["payload"])
+        except Exception as e:
+            print(f"Ignoring unreadable cached scorecard: {str(e)}")
+            return False
+        self.cached_match_id = self.match_id
+        self.apply_match_data(self.cached_data)
+        
+        saved_at = datetime.fromtimestamp(entry["stored_at"]).strftime("%H:%M:%S")
+        self.last_updated_var.set(f"Last updated: {saved_at} (cached)")
+        self.status_var.set("Status: Showing cached data")
+        return True
+    
+    def _update_ui_fetch_failed(self, match_id, error_message):
+        """Count a failed fetch and fall back to the match's cached data (runs on main thread)"""
+        self.failed_attempts += 1
+        
+        # Use cached data if available
+        cached_data = None
+        if self.failed_attempts <= self.max_retry_attempts:
+            cached_data = self.load_cached_scorecard(match_id)
+        if cached_data is None:
+            # Handle errors if no cache or too many failures
             self._handle_fetch_error(error_message)
             return
-            
+        self._update_ui_with_cached_data(error_message, cached_data)
+    
+    def _update_ui_with_cached_data(self, error_message, cached_data):
+        """Update UI with cached data when live fetch fails"""
         # Update UI with cached data
-        self.match_data = self.cached_data
-        self.update_info_panel()
-        self.populate_team_dropdown()
-        self.update_dashboard()
+        self.apply_match_data(cached_data)
         
         # Update status to show using cached data
         from datetime import datetime
         current_time = datetime.now().strftime("%H:%M:%S")
         self.last_updated_var.set(f"Last updated: Using cached data")
         self.status_var.set(f"Status: Network error ({self.failed_attempts}/{self.max_retry_attempts})")
+        self.refresh_timer.record(failed=True)
+        self.update_budget_status()
         
         # Stop loading animation with warning
         self.stop_loading_animation(success=None)  # None means warning (yellow)
@@ -1065,20 +1356,23 @@ class CricketDashboard:
         # Show toast notification about using cached data
         self.show_toast_notification(f"Network error: {error_message}\nUsing cached data.")
     
-    def _update_ui_with_data(self, processed_data):
+    def _update_ui_with_data(self, match_id, processed_data, overs=()):
         """Update UI with fetched data (runs on main thread)"""
-        self.match_data = processed_data
+        # Cache the successfully fetched data in memory
+        self.cached_data = processed_data
+        self.cached_match_id = match_id
+        self.failed_attempts = 0  # Reset failed attempts counter
         
-        # Update UI
-        self.update_info_panel()
-        self.populate_team_dropdown()
-        self.update_dashboard()
+        self.apply_match_data(processed_data, overs)
         
         # Update status and last updated time
         from datetime import datetime
         current_time = datetime.now().strftime("%H:%M:%S")
         self.last_updated_var.set(f"Last updated: {current_time}")
         self.status_var.set("Status: Data loaded")
+        self.refresh_timer.record(changed=True)
+        self.update_budget_status()
+        self._record_first_paint("network")
         
         # Stop loading animation with success
         self.stop_loading_animation(success=True)
@@ -1086,9 +1380,56 @@ class CricketDashboard:
         # Flash the last updated time to draw attention
         self._flash_last_updated()
     
+    def apply_match_data(self, processed_data, overs=()):
+        """Show new match data and overs, redrawing only what changed since the current data"""
+        changes = diff_match_data(self.match_data, processed_data)
+        self.match_data = processed_data
+        self.refresh_timer.state = match_state(processed_data.header.status)
+        
+        # Only overs newer than the last one stored are appended to the timeline, and every
+        # innings' score is sampled in case the commentary feed isn't available
+        match_id = processed_data.header.match_id
+        if self.timeline.match_id != match_id:
+            self.timeline = DeliveryTimeline(match_id)
+            self.score_history = ScoreHistory(match_id)
+        changes.progress = self.timeline.extend(overs) > 0
+        changes.progress = self.score_history.record(processed_data, time.time()) or changes.progress
+        
+        # Redrawn in the next frame, so snapshots arriving together are drawn once
+        if changes.full or changes.header:
+            self.render.invalidate("info", self.update_info_panel)
+        if changes.full or changes.teams:
+            self.render.invalidate("teams", self.populate_team_dropdown)
+        if changes:
+            self.update_dashboard(changes=changes, deferred=True)
+    
+    def _update_ui_unchanged(self):
+        """Record a poll that found no changes (runs on main thread)"""
+        self.failed_attempts = 0
+        current_time = datetime.now().strftime("%H:%M:%S")
+        self.last_updated_var.set(f"Last checked: {current_time}")
+        self.status_var.set("Status: No changes")
+        self.refresh_timer.record(changed=False)
+        self.update_budget_status()
+        
+        # Stop loading animation with success
+        self.stop_loading_animation(success=True)
+    
+    def _update_ui_budget_exhausted(self, message):
+        """Record a poll skipped because the request budget is spent (runs on main thread)"""
+        self.status_var.set("Status: Waiting for API budget")
+        self.refresh_timer.schedule()  # The budget stretches the interval until it refills
+        self.update_budget_status()
+        
+        # Stop loading animation with warning
+        self.stop_loading_animation(success=None)
+        self.show_toast_notification(message)
+    
     def _handle_fetch_error(self, error_message):
         """Handle fetch errors (runs on main thread)"""
         self.status_var.set("Status: Error fetching data")
+        self.refresh_timer.record(failed=True)
+        self.update_budget_status()
         messagebox.showerror("Error", f"Failed to fetch match data: {error_message}")
         
         # Stop loading animation with error
@@ -1103,43 +1444,19 @@ class CricketDashboard:
         if count % 2 == 0:
             color = "#2ecc71"  # Green
         else:
-            color = "#3498db"  # Default header color
+            color = "#113955"  # Default header color
             
-        # Get the last updated label and change its background
-        for widget in self.root.winfo_children():
-            if isinstance(widget, tk.Frame) and widget.winfo_y() == 0:  # Header frame
-                for child in widget.winfo_children():
-                    if isinstance(child, tk.Frame):  # Controls frame
-                        for control in child.winfo_children():
-                            if isinstance(control, tk.Label) and "updated" in control.cget("text"):
-                                control.config(bg=color)
-                                break
+        # Change the last updated label's background
+        self.last_updated_label.config(bg=color)
         
-        # Schedule next flash
-        self.root.after(300, lambda: self._flash_last_updated(count + 1))
+        # Schedule next flash, applied with the rest of that frame's updates
+        self.render.invalidate_after(300, "flash", lambda: self._flash_last_updated(count + 1))
     
     def start_auto_refresh(self):
         """Start auto-refresh timer"""
         if self.auto_refresh.get():
-            # Schedule the next refresh
-            self.root.after(self.auto_refresh_interval * 1000, self.auto_refresh_callback)
-    
-    def auto_refresh_callback(self):
-        """Auto refresh callback function"""
-        if self.auto_refresh.get():
-            # Fetch new data if auto-refresh is still enabled
-            if not self.is_fetching:
-                # Adjust refresh interval based on failures
-                if self.failed_attempts > 0:
-                    # Double the interval temporarily (up to 5 minutes max)
-                    backoff_interval = min(self.auto_refresh_interval * (2 ** self.failed_attempts), 300)
-                    self.root.after(backoff_interval * 1000, self.auto_refresh_callback)
-                    return
-                
-                self.fetch_data()
-            
-            # Schedule the next refresh
-            self.root.after(self.auto_refresh_interval * 1000, self.auto_refresh_callback)
+            # Arming the timer replaces any poll already scheduled, so this never doubles up
+            self.refresh_timer.start()
     
     def toggle_auto_refresh(self):
         """Toggle auto-refresh on/off"""
@@ -1148,155 +1465,97 @@ class CricketDashboard:
             self.start_auto_refresh()
             self.status_var.set(f"Status: Auto-refresh enabled ({self.auto_refresh_interval}s)")
         else:
+            self.refresh_timer.stop()
             self.status_var.set("Status: Auto-refresh disabled")
+        self.update_budget_status()
     
-    def process_api_data(self, api_data):
-        """Process the API data to match our expected format"""
-        processed_data = {
-                "matchHeader": {
-                "matchId": api_data.get("matchId", 0),
-                "matchDescription": api_data.get("matchDesc", ""),
-                "matchFormat": api_data.get("matchType", ""),
-                "matchType": api_data.get("matchType", ""),
-                    "complete": True,
-                    "domestic": False,
-                "teams": [],
-                "seriesName": api_data.get("seriesName", ""),
-                "seriesId": api_data.get("seriesId", 0),
-                "status": api_data.get("status", ""),
-                    "venue": {
-                    "id": 0,
-                    "name": api_data.get("venueInfo", {}).get("ground", ""),
-                    "location": api_data.get("venueInfo", {}).get("city", ""),
-                    "country": api_data.get("venueInfo", {}).get("country", ""),
-                },
-                "matchDate": api_data.get("matchHeader", {}).get("matchDate", ""),
-                    "tossResults": {
-                    "tossWinnerId": 0,
-                    "tossWinnerName": api_data.get("tossInfo", "").split(" elected to ")[0] if "elected to" in api_data.get("tossInfo", "") else "",
-                    "decision": api_data.get("tossInfo", "").split(" elected to ")[1] if "elected to" in api_data.get("tossInfo", "") else "",
-                },
-            },
-            "scoreCard": []
-        }
-        
-        # Extract teams
-        if "scoreCard" in api_data and len(api_data["scoreCard"]) > 0:
-            teams = []
-            for inning in api_data.get("scoreCard", []):
-                bat_team = {
-                    "id": inning.get("batTeamDetails", {}).get("batTeamId", 0),
-                    "name": inning.get("batTeamDetails", {}).get("batTeamName", ""),
-                    "sName": inning.get("batTeamDetails", {}).get("batTeamShortName", ""),
-                    "imgUrl": "",
-                }
-                bowl_team = {
-                    "id": inning.get("bowlTeamDetails", {}).get("bowlTeamId", 0),
-                    "name": inning.get("bowlTeamDetails", {}).get("bowlTeamName", ""),
-                    "sName": inning.get("bowlTeamDetails", {}).get("bowlTeamShortName", ""),
-                    "imgUrl": "",
-                }
-                
-                # Add teams if not already added
-                if bat_team["id"] not in [t.get("id") for t in teams]:
-                    teams.append(bat_team)
-                if bowl_team["id"] not in [t.get("id") for t in teams]:
-                    teams.append(bowl_team)
-            
-            processed_data["matchHeader"]["teams"] = teams
+    @staticmethod
+    def process_api_data(api_data):
+        """Process the API data into a Match snapshot"""
+        venue_info = api_data.get("venueInfo", {})
+        toss_info = api_data.get("tossInfo", "")
+        toss_winner, toss_decision = toss_info.split(" elected to ", 1) if " elected to " in toss_info else ("", "")
+        
+        # Extract teams (every side that batted or bowled, in order of appearance)
+        teams = {}
+        for inning in api_data.get("scoreCard", []):
+            for details, prefix in ((inning.get("batTeamDetails", {}), "batTeam"),
+                                    (inning.get("bowlTeamDetails", {}), "bowlTeam")):
+                team_id = details.get(prefix + "Id", 0)
+                if team_id not in teams:
+                    teams[team_id] = Team(team_id, intern_name(details.get(prefix + "Name", "")),
+                                          intern_name(details.get(prefix + "ShortName", "")))
+        
+        header = MatchHeader(
+            match_id=api_data.get("matchId", 0),
+            description=api_data.get("matchDesc", ""),
+            match_type=api_data.get("matchType", ""),
+            series_name=api_data.get("seriesName", ""),
+            series_id=api_data.get("seriesId", 0),
+            status=api_data.get("status", ""),
+            match_date=api_data.get("matchHeader", {}).get("matchDate", ""),
+            venue=venue_info.get("ground", ""),
+            city=venue_info.get("city", ""),
+            country=venue_info.get("country", ""),
+            toss_winner=toss_winner,
+            toss_decision=toss_decision,
+            teams=tuple(teams.values())
+        )
         
         # Process innings
+        innings = []
         for inning in api_data.get("scoreCard", []):
             bat_team_details = inning.get("batTeamDetails", {})
             bowl_team_details = inning.get("bowlTeamDetails", {})
+            score_details = inning.get("scoreDetails", {})
             
-            # Process batsmen
-            batsmen = []
-            for key, batsman in bat_team_details.get("batsmenData", {}).items():
-                batsmen.append({
-                    "name": batsman.get("batName", ""),
-                    "runs": batsman.get("runs", 0),
-                    "balls": batsman.get("balls", 0),
-                    "fours": batsman.get("fours", 0),
-                    "sixes": batsman.get("sixes", 0)
-                })
-            
-            # Process bowlers
-            bowlers = []
-            for key, bowler in bowl_team_details.get("bowlersData", {}).items():
-                overs = bowler.get("overs", 0)
-                # Convert overs format (e.g. 4.2 means 4 overs and 2 balls)
-                overs_decimal = float(overs) if isinstance(overs, (int, float)) else float(overs.replace("*", "")) if isinstance(overs, str) else 0
-                
-                bowlers.append({
-                    "name": bowler.get("bowlName", ""),
-                    "overs": overs_decimal,
-                    "maidens": bowler.get("maidens", 0),
-                    "runs": bowler.get("runs", 0),
-                    "wickets": bowler.get("wickets", 0)
-                })
-            
-            # Add innings to scorecard
-            inning_data = {
-                "inningsId": inning.get("inningsId", 0),
-                "teamId": bat_team_details.get("batTeamId", 0),
-                "team": bat_team_details.get("batTeamName", ""),
-                "overs": inning.get("scoreDetails", {}).get("overs", 0),
-                "runs": inning.get("scoreDetails", {}).get("runs", 0),
-                "wickets": inning.get("scoreDetails", {}).get("wickets", 0),
-                "batsmen": batsmen,
-                "bowlers": bowlers
-            }
-            
-            processed_data["scoreCard"].append(inning_data)
-        
-        # Add match progress data
-        processed_data["matchProgress"] = {
-            "overByOver": []
-        }
+            batsmen = tuple(
+                BatterLine(intern_name(batsman.get("batName", "")), batsman.get("runs", 0), batsman.get("balls", 0),
+                           batsman.get("fours", 0), batsman.get("sixes", 0))
+                for batsman in bat_team_details.get("batsmenData", {}).values()
+            )
+            
+            # Overs are kept as a ball count (4.2 overs is 26 balls)
+            bowlers = tuple(
+                BowlerLine(intern_name(bowler.get("bowlName", "")), overs_to_balls(bowler.get("overs", 0)),
+                           bowler.get("maidens", 0), bowler.get("runs", 0), bowler.get("wickets", 0))
+                for bowler in bowl_team_details.get("bowlersData", {}).values()
+            )
+            
+            innings.append(Innings(
+                innings_id=inning.get("inningsId", 0),
+                team_id=bat_team_details.get("batTeamId", 0),
+                team=intern_name(bat_team_details.get("batTeamName", "")),
+                balls=overs_to_balls(score_details.get("overs", 0)),
+                runs=score_details.get("runs", 0),
+                wickets=score_details.get("wickets", 0),
+                batsmen=batsmen,
+                bowlers=bowlers
+            ))
         
-        # If there are two innings, create over-by-over progress
-        if len(processed_data["scoreCard"]) >= 2:
-            team1_score = processed_data["scoreCard"][0]["runs"]
-            team2_score = processed_data["scoreCard"][1]["runs"]
-            max_overs = max(processed_data["scoreCard"][0].get("overs", 0), 
-                          processed_data["scoreCard"][1].get("overs", 0))
-            
-            # Create simulated over-by-over progress
-            # In a real app, you would extract this from the commentary or detailed data
-            overs_list = [5, 10, 15, 20, 25, 30, 35, 40, 45, 50]
-            for over in overs_list:
-                if over <= max_overs:
-                    ratio = min(over / max_overs, 1.0)
-                    processed_data["matchProgress"]["overByOver"].append({
-                        "over": over,
-                        "team1Score": int(team1_score * ratio),
-                        "team2Score": int(team2_score * ratio) if over <= processed_data["scoreCard"][1].get("overs", 0) else None
-                    })
-        
-        return processed_data
+        return Match(header, tuple(innings))
     
     def update_info_panel(self):
         """Update the info panel with match details"""
         if self.match_data:
-            header = self.match_data["matchHeader"]
+            header = self.match_data.header
             
             # Set match title with all relevant information in a single line
-            series = header["seriesName"]
-            match_desc = header["matchDescription"]
-            team1 = header["teams"][0]["name"]
-            team2 = header["teams"][1]["name"]
+            series = header.series_name
+            match_desc = header.description
+            team1 = header.teams[0].name
+            team2 = header.teams[1].name
             self.match_title_var.set(f"{series}: {team1} vs {team2} ({match_desc})")
             
             # Set status with more details
-            self.status_display_var.set(f"Status: {header['status']}")
+            self.status_display_var.set(f"Status: {header.status}")
             
             # We've removed venue, date and toss information as requested
     
     def populate_team_dropdown(self):
         """Populate the team dropdown with teams from the match"""
         if self.match_data:
-            teams = [team["name"] for team in self.match_data["matchHeader"]["teams"]]
+            teams = [team.name for team in self.match_data.header.teams]
             teams.append("Both Teams")  # Add option to view both teams
             
             self.teams = teams
@@ -1306,41 +1565,97 @@ class CricketDashboard:
             if teams:
                 self.selected_team.set(teams[0])
     
-    def update_dashboard(self, event=None):
-        """Update the dashboard based on selected team and view"""
-        selected_team = self.selected_team.get()
-        selected_view = self.selected_view.get()
+    def update_dashboard(self, event=None, changes=None, deferred=False):
+        """Mark all tabs dirty and render only the visible one (in the next frame if deferred)"""
+        # Queue the changes for every tab - each tab decides what it needs to redraw
+        for tab in self.tab_builders:
+            if changes is None:
+                self.dirty_tabs[tab] = None
+            elif tab not in self.dirty_tabs:
+                self.dirty_tabs[tab] = MatchChanges().merge(changes)
+            elif self.dirty_tabs[tab] is not None:
+                self.dirty_tabs[tab].merge(changes)
+        
+        if deferred:
+            self.render.invalidate("tab", self.render_selected_tab)
+        else:
+            self.render_selected_tab()
+    
+    def render_selected_tab(self):
+        """Show the tab for the selected view and render it if it is out of date"""
+        # Select the correct tab based on the view
+        selected_tab = self.view_tabs.get(self.selected_view.get())
+        if selected_tab is not None:
+            self.notebook.select(selected_tab)
         
-        # Clear previous content
-        for widget in self.overview_tab.winfo_children():
-            widget.destroy()
-        for widget in self.batting_tab.winfo_children():
-            widget.destroy()
-        for widget in self.bowling_tab.winfo_children():
-            widget.destroy()
-        for widget in self.players_tab.winfo_children():
-            widget.destroy()
-        for widget in self.progress_tab.winfo_children():
-            widget.destroy()
+        # Hidden tabs are rendered later from on_tab_changed
+        self.render_tab(self.get_current_tab())
+    
+    def get_current_tab(self):
+        """Return the tab frame currently shown in the notebook"""
+        current = self.notebook.select()
+        return self.notebook.nametowidget(current) if current else None
+    
+    def render_tab(self, tab):
+        """Refresh a tab if its content is out of date"""
+        if tab not in self.dirty_tabs or not self.match_data:
+            return
         
-        # Create content for all tabs to ensure data is loaded
-        self.create_overview_tab()
-        self.create_batting_tab()
-        self.create_bowling_tab()
-        self.create_players_tab()
-        self.create_progress_tab()
+        changes = self.dirty_tabs.pop(tab)
         
-        # Select the correct tab based on the view
-        if selected_view == "Overview":
-            self.notebook.select(self.overview_tab)
-        elif selected_view == "Batting Analysis":
-            self.notebook.select(self.batting_tab)
-        elif selected_view == "Bowling Analysis":
-            self.notebook.select(self.bowling_tab)
-        elif selected_view == "Player Stats":
-            self.notebook.select(self.players_tab)
-        elif selected_view == "Match Progress":
-            self.notebook.select(self.progress_tab)
+        # Widgets and charts are built once, later renders update them in place
+        if tab not in self.tab_updaters:
+            self.tab_builders[tab]()
+            changes = None
+        
+        self.tab_updaters[tab](changes)
+    
+    def sync_table_rows(self, table, rows, shown_rows):
+        """Make a Treeview show rows of (key, values), touching only rows that changed"""
+        wanted = {key for key, values in rows}
+        
+        # Drop rows that are no longer present
+        stale = [key for key in shown_rows if key not in wanted]
+        if stale:
+            table.delete(*stale)
+            for key in stale:
+                del shown_rows[key]
+        
+        for index, (key, values) in enumerate(rows):
+            if key not in shown_rows:
+                table.insert('', index, iid=key, values=values)
+            else:
+                if shown_rows[key] != values:
+                    table.item(key, values=values)
+                if table.index(key) != index:
+                    table.move(key, '', index)
+            shown_rows[key] = values
+    
+    def unique_row_keys(self, names):
+        """Turn player names into unique Treeview row keys"""
+        seen = {}
+        keys = []
+        for name in names:
+            seen[name] = seen.get(name, 0) + 1
+            keys.append(name if seen[name] == 1 else f"{name} ({seen[name]})")
+        return keys
+    
+    def on_tab_changed(self, event=None):
+        """Render the newly shown tab and keep the view dropdown in sync"""
+        tab = self.get_current_tab()
+        for view, view_tab in self.view_tabs.items():
+            if view_tab is tab:
+                self.selected_view.set(view)
+                break
+        
+        self.render_tab(tab)
+    
+    def on_view_selected(self, event=None):
+        """Switch to the tab chosen in the view dropdown"""
+        selected_tab = self.view_tabs.get(self.selected_view.get())
+        if selected_tab is not None:
+            self.notebook.select(selected_tab)
+            self.render_tab(selected_tab)
     
     def create_overview_tab(self):
         """Create content for the overview tab"""
@@ -1348,73 +1663,8 @@ class CricketDashboard:
         graphs_frame = ttk.LabelFrame(self.overview_tab, text="Match Statistics", padding=15)
         graphs_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
-        # Create a figure with 2x2 subplots for equal sizing
-        fig = plt.figure(figsize=(10, 8))
-        
-        # First graph: Team Comparison (top-left)
-        ax1 = fig.add_subplot(2, 2, 1)
-        teams = [inning["team"] for inning in self.match_data["scoreCard"]]
-        scores = [inning["runs"] for inning in self.match_data["scoreCard"]]
-        
-        ax1.bar(teams, scores, color=['#3498db', '#e74c3c'], alpha=0.7)
-        ax1.set_ylabel('Runs')
-        ax1.set_title('Team Scores')
-        
-        # Second graph: Wickets comparison (top-right)
-        ax2 = fig.add_subplot(2, 2, 2)
-        wickets = [inning["wickets"] for inning in self.match_data["scoreCard"]]
-        
-        ax2.bar(teams, wickets, color=['#9b59b6', '#f39c12'], alpha=0.7)
-        ax2.set_ylabel('Wickets')
-        ax2.set_title('Team Wickets')
-        
-        # Third graph: Run distribution pie chart (bottom-left)
-        ax3 = fig.add_subplot(2, 2, 3)
-        
-        # Get run distribution for both teams combined
-        boundaries = 0
-        singles_doubles = 0
-        extras = 0
-        
-        for inning in self.match_data["scoreCard"]:
-            for batsman in inning["batsmen"]:
-                # Count boundaries (4s and 6s)
-                boundaries += (batsman["fours"] * 4) + (batsman["sixes"] * 6)
-                # Estimate singles and doubles (total runs - boundaries)
-                singles_doubles += batsman["runs"] - ((batsman["fours"] * 4) + (batsman["sixes"] * 6))
-            
-            # Estimate extras as 5% of total runs for demo purposes
-            extras += round(inning["runs"] * 0.05)
-        
-        labels = ['Boundaries', 'Singles & Doubles', 'Extras']
-        sizes = [boundaries, singles_doubles, extras]
-        colors = ['#2ecc71', '#3498db', '#e74c3c']
-        explode = (0.1, 0, 0)
-        
-        ax3.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%', shadow=True, startangle=90)
-        ax3.axis('equal')
-        ax3.set_title('Run Distribution')
-        
-        # Fourth graph: Run rate comparison (bottom-right)
-        ax4 = fig.add_subplot(2, 2, 4)
-        overs = [float(inning["overs"]) for inning in self.match_data["scoreCard"]]
-        run_rates = [round(inning["runs"] / float(inning["overs"]), 2) for inning in self.match_data["scoreCard"]]
-        
-        ax4.bar(teams, run_rates, color=['#1abc9c', '#d35400'], alpha=0.7)
-        ax4.set_ylabel('Run Rate')
-        ax4.set_title('Team Run Rates')
-        
-        # Add values on top of bars
-        for i, v in enumerate(run_rates):
-            ax4.text(i, v + 0.1, str(v), ha='center')
-        
-        # Adjust layout
-        plt.tight_layout()
-        
-        # Create canvas to display the figure
-        canvas = FigureCanvasTkAgg(fig, graphs_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # A figure with 2x2 subplots for equal sizing, created once and reused
+        chart = self.create_overview_chart(graphs_frame)
         
         # Match summary text area
         summary_frame = ttk.LabelFrame(self.overview_tab, text="Match Summary", padding=10)
@@ -1423,29 +1673,70 @@ class CricketDashboard:
         summary_text = scrolledtext.ScrolledText(summary_frame, height=5, wrap=tk.WORD)
         summary_text.pack(fill=tk.BOTH, expand=True)
         
-        # Create a summary from the match data
-        header = self.match_data["matchHeader"]
-        innings1 = self.match_data["scoreCard"][0]
-        innings2 = self.match_data["scoreCard"][1]
-        
-        summary = f"""
-{header["teams"][0]["name"]} vs {header["teams"][1]["name"]} - {header["matchDescription"]}
-Venue: {header["venue"]["name"]}, {header["venue"].get("location", "")}
-Date: {header["matchDate"]}
+        def update_overview(changes=None):
+            # Nothing on this tab depends on the progress data alone
+            if changes is not None and not changes.scorecard_changed():
+                return
+            
+            self.draw_overview_charts(chart, stats_for(self.match_data))
+            
+            # Create a summary from the match data
+            header = self.match_data.header
+            innings1 = self.match_data.innings[0]
+            innings2 = self.match_data.innings[1]
+            
+            summary = f"""
+{header.teams[0].name} vs {header.teams[1].name} - {header.description}
+Venue: {header.venue}, {header.city}
+Date: {header.match_date}
 
-{innings1["team"]} scored {innings1["runs"]}/{innings1["wickets"]} in {innings1["overs"]} overs.
-Top scorer: {innings1["batsmen"][0]["name"]} ({innings1["batsmen"][0]["runs"]} runs off {innings1["batsmen"][0]["balls"]} balls)
-Best bowler: {innings2["bowlers"][0]["name"]} ({innings2["bowlers"][0]["wickets"]}/{innings2["bowlers"][0]["runs"]})
+{innings1.team} scored {innings1.runs}/{innings1.wickets} in {innings1.overs} overs.
+Top scorer: {innings1.batsmen[0].name} ({innings1.batsmen[0].runs} runs off {innings1.batsmen[0].balls} balls)
+Best bowler: {innings2.bowlers[0].name} ({innings2.bowlers[0].wickets}/{innings2.bowlers[0].runs})
 
-{innings2["team"]} scored {innings2["runs"]}/{innings2["wickets"]} in {innings2["overs"]} overs.
-Top scorer: {innings2["batsmen"][0]["name"]} ({innings2["batsmen"][0]["runs"]} runs off {innings2["batsmen"][0]["balls"]} balls)
-Best bowler: {innings1["bowlers"][0]["name"]} ({innings1["bowlers"][0]["wickets"]}/{innings1["bowlers"][0]["runs"]})
+{innings2.team} scored {innings2.runs}/{innings2.wickets} in {innings2.overs} overs.
+Top scorer: {innings2.batsmen[0].name} ({innings2.batsmen[0].runs} runs off {innings2.batsmen[0].balls} balls)
+Best bowler: {innings1.bowlers[0].name} ({innings1.bowlers[0].wickets}/{innings1.bowlers[0].runs})
 
-Result: {header["status"]}
-        """
+Result: {header.status}
+            """
+            
+            summary_text.config(state=tk.NORMAL)
+            summary_text.delete("1.0", tk.END)
+            summary_text.insert(tk.END, summary)
+            summary_text.config(state=tk.DISABLED)
+        
+        self.tab_updaters[self.overview_tab] = update_overview
+    
+    def create_overview_chart(self, parent):
+        """Create the 2x2 team comparison figure (parent=None renders off-screen)"""
+        chart = ChartPanel(parent, figsize=(10, 8), nrows=2, ncols=2)
+        chart.set_labels(0, title='Team Scores', ylabel='Runs')
+        chart.set_labels(1, title='Team Wickets', ylabel='Wickets')
+        chart.set_labels(3, title='Team Run Rates', ylabel='Run Rate')
+        return chart
+    
+    def draw_overview_charts(self, chart, stats):
+        """Draw team scores, wickets, run distribution and run rates"""
+        teams = [innings.team for innings in stats.innings]
+        
+        # First graph: Team Comparison (top-left)
+        chart.bar(0, teams, [innings.runs for innings in stats.innings], color=['#3498db', '#e74c3c'])
+        
+        # Second graph: Wickets comparison (top-right)
+        chart.bar(1, teams, [innings.wickets for innings in stats.innings], color=['#9b59b6', '#f39c12'])
+        
+        # Third graph: Run distribution pie chart (bottom-left)
+        chart.pie(2, [stats.boundary_runs, stats.non_boundary_runs, stats.extras],
+                  labels=['Boundaries', 'Singles & Doubles', 'Extras'],
+                  colors=['#2ecc71', '#3498db', '#e74c3c'],
+                  explode=(0.1, 0, 0), title='Run Distribution')
+        
+        # Fourth graph: Run rate comparison (bottom-right) with values on top of bars
+        run_rates = [innings.run_rate for innings in stats.innings]
+        chart.bar(3, teams, run_rates, color=['#1abc9c', '#d35400'], value_labels=True, offset=0.1)
         
-        summary_text.insert(tk.END, summary)
-        summary_text.config(state=tk.DISABLED)
+        chart.draw()
     
     def create_batting_tab(self):
         """Create content for the batting analysis tab"""
@@ -1485,59 +1776,15 @@ Result: {header["status"]}
         graphs_frame = tk.Frame(self.batting_tab)
         graphs_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Left graph: Runs scored by batsmen
+        # Left graph: selected analysis for the top batsmen
         runs_frame = ttk.LabelFrame(graphs_frame, text="Runs by Batsmen")
         runs_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 3))
         
-        fig1, ax1 = plt.subplots(figsize=(4, 4))
-                
-        # Get data for the first innings - FIXING THE ERROR HERE
-        innings = self.match_data["scoreCard"][0]
-        batsmen = innings["batsmen"][:6]  # Show top 6 batsmen
-        
-        names = [batsman["name"] for batsman in batsmen]
-        runs = [batsman["runs"] for batsman in batsmen]
-        
-        # Create horizontal bar chart
-        bars = ax1.barh(names, runs, color='#3498db', alpha=0.7)
-        ax1.set_xlabel('Runs')
-        ax1.set_title('Top Batsmen Performance')
-        
-        # Add values at the end of bars
-        for bar in bars:
-            width = bar.get_width()
-            ax1.text(width + 1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                     ha='left', va='center')
-        plt.tight_layout()
-        fig1.subplots_adjust(left=0.25)
-        canvas1 = FigureCanvasTkAgg(fig1, runs_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Right graph: Strike rates
-        strike_frame = ttk.LabelFrame(graphs_frame, text="Batsmen Strike Rates")
-        strike_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(3, 0))
-        
-        fig2, ax2 = plt.subplots(figsize=(4, 4))
-        
-        # Calculate strike rates
-        strike_rates = [round((batsman["runs"] / batsman["balls"]) * 100, 1) for batsman in batsmen]
-        
-        # Create horizontal bar chart with different color
-        bars = ax2.barh(names, strike_rates, color='#e74c3c', alpha=0.7)
-        ax2.set_xlabel('Strike Rate')
-        ax2.set_title('Batsmen Strike Rates')
-        
-        # Add values at the end of bars
-        for bar in bars:
-            width = bar.get_width()
-            ax2.text(width + 1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                     ha='left', va='center')
-        plt.tight_layout()
-        fig1.subplots_adjust(left=0.25)
-        canvas2 = FigureCanvasTkAgg(fig2, strike_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Right graph: runs from boundaries vs non-boundaries
+        distribution_frame = ttk.LabelFrame(graphs_frame, text="Run Distribution")
+        distribution_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(3, 0))
+        
+        analysis_chart, distribution_chart = self.create_batting_charts(runs_frame, distribution_frame)
         
         # Bottom frame for batting scorecard
         scorecard_frame = ttk.LabelFrame(self.batting_tab, text="Batting Scorecard", padding=5)
@@ -1555,171 +1802,90 @@ Result: {header["status"]}
             else:
                 batting_table.column(col, width=80, anchor='center')
         
-        # Insert data
-        for batsman in innings["batsmen"]:
-            strike_rate = round((batsman["runs"] / batsman["balls"]) * 100, 1) if batsman["balls"] > 0 else 0
-            batting_table.insert('', 'end', values=(
-                batsman["name"],
-                batsman["runs"],
-                batsman["balls"],
-                batsman["fours"],
-                batsman["sixes"],
-                strike_rate
-            ))
-        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(scorecard_frame, orient=tk.VERTICAL, command=batting_table.yview)
         batting_table.configure(yscroll=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         batting_table.pack(fill=tk.BOTH, expand=True)
         
-        # Update function for changing innings or analysis type
+        # Values currently shown in each table row, keyed by row id
+        batting_rows = {}
+        
+        # Update function for new data or changing innings or analysis type
         def update_batting_analysis(*args):
-            innings_idx = 0 if innings_var.get() == "Innings 1" else 1
-            analysis_type = analysis_var.get()
+            innings_options = [f"Innings {i + 1}" for i in range(len(self.match_data.innings))]
+            innings_dropdown["values"] = innings_options
+            if innings_var.get() not in innings_options:
+                innings_var.set(innings_options[0])  # Re-enters through the trace
+                return
             
-            # Clear previous graphs
-            for widget in runs_frame.winfo_children():
-                widget.destroy()
-            for widget in strike_frame.winfo_children():
-                widget.destroy()
+            innings_idx = innings_options.index(innings_var.get())
+            analysis_type = analysis_var.get()
             
             # Update data
-            innings = self.match_data["scoreCard"][innings_idx]
-            batsmen = innings["batsmen"][:6]  # Show top 6 batsmen
-            names = [batsman["name"] for batsman in batsmen]
-            
-            # Update batting table
-            batting_table.delete(*batting_table.get_children())
-            for batsman in innings["batsmen"]:
-                strike_rate = round((batsman["runs"] / batsman["balls"]) * 100, 1) if batsman["balls"] > 0 else 0
-                batting_table.insert('', 'end', values=(
-                    batsman["name"],
-                    batsman["runs"],
-                    batsman["balls"],
-                    batsman["fours"],
-                    batsman["sixes"],
-                    strike_rate
-                ))
-            
-            # Update first graph based on analysis type
-            fig1, ax1 = plt.subplots(figsize=(5, 4))
-            
-            if analysis_type == "Runs Distribution":
-                # Sort data by runs (descending)
-                sorted_indices = sorted(range(len(names)), key=lambda i: runs[i], reverse=True)
-                sorted_names = [names[i] for i in sorted_indices]
-                sorted_runs = [runs[i] for i in sorted_indices]
-                
-                # Create horizontal bar chart
-                bars = ax1.barh(sorted_names, sorted_runs, color='#3498db', alpha=0.7)
-                ax1.set_xlabel('Runs')
-                ax1.set_title('Runs by Batsmen')
-                
-                # Add values at the end of bars
-                for bar in bars:
-                    width = bar.get_width()
-                    ax1.text(width + 0.5, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                            ha='left', va='center')
-                
-                # Ensure y-labels are fully visible
-                plt.tight_layout()
-                fig1.subplots_adjust(left=0.25)  # Add more padding on left for names
-            
-            elif analysis_type == "Balls Faced":
-                # Sort data by balls faced (descending)
-                sorted_indices = sorted(range(len(names)), key=lambda i: balls[i], reverse=True)
-                sorted_names = [names[i] for i in sorted_indices]
-                sorted_balls = [balls[i] for i in sorted_indices]
-                
-                # Create horizontal bar chart
-                bars = ax1.barh(sorted_names, sorted_balls, color='#9b59b6', alpha=0.7)
-                ax1.set_xlabel('Balls Faced')
-                ax1.set_title('Balls Faced by Batsmen')
-                
-                # Add values at the end of bars
-                for bar in bars:
-                    width = bar.get_width()
-                    ax1.text(width + 0.5, bar.get_y() + bar.get_height()/2, f'{int(width)}', 
-                            ha='left', va='center')
-                            
-                # Ensure y-labels are fully visible
-                plt.tight_layout()
-                fig1.subplots_adjust(left=0.25)  # Add more padding on left for names
-            
-            elif analysis_type == "Strike Rate":
-                # Sort data by strike rate (descending)
-                strike_rates = [round((batsman["runs"] / batsman["balls"]) * 100, 1) for batsman in batsmen]
-                sorted_indices = sorted(range(len(names)), key=lambda i: strike_rates[i], reverse=True)
-                sorted_names = [names[i] for i in sorted_indices]
-                sorted_strike_rates = [strike_rates[i] for i in sorted_indices]
-                
-                # Create horizontal bar chart
-                bars = ax1.barh(sorted_names, sorted_strike_rates, color='#e74c3c', alpha=0.7)
-                ax1.set_xlabel('Strike Rate')
-                ax1.set_title('Batsmen Strike Rates')
-                
-                # Add values at the end of bars
-                for bar in bars:
-                    width = bar.get_width()
-                    ax1.text(width + 0.5, bar.get_y() + bar.get_height()/2, f'{width}', 
-                            ha='left', va='center')
-                
-                # Ensure y-labels are fully visible
-                plt.tight_layout()
-                fig1.subplots_adjust(left=0.25)  # Add more padding on left for names
-                
-            elif analysis_type == "Boundary %":
-                # Calculate and sort by boundary percentage
-                boundary_pcts = [round(((batsman["fours"] * 4 + batsman["sixes"] * 6) / batsman["runs"]) * 100, 1) 
-                                if batsman["runs"] > 0 else 0 for batsman in batsmen]
-                sorted_indices = sorted(range(len(names)), key=lambda i: boundary_pcts[i], reverse=True)
-                sorted_names = [names[i] for i in sorted_indices]
-                sorted_boundary_pcts = [boundary_pcts[i] for i in sorted_indices]
-                
-                # Create horizontal bar chart
-                bars = ax1.barh(sorted_names, sorted_boundary_pcts, color='#9b59b6', alpha=0.7)
-                ax1.set_xlabel('Boundary %')
-                ax1.set_title('Percentage of Runs from Boundaries')
-                
-                # Add values at the end of bars
-                for bar in bars:
-                    width = bar.get_width()
-                    ax1.text(width + 0.5, bar.get_y() + bar.get_height()/2, f'{width}', 
-                            ha='left', va='center')
-                
-                # Ensure y-labels are fully visible
-                plt.tight_layout()
-                fig1.subplots_adjust(left=0.25)  # Add more padding on left for names
-            
-            canvas1 = FigureCanvasTkAgg(fig1, runs_frame)
-            canvas1.draw()
-            canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Update second graph
-            fig2, ax2 = plt.subplots(figsize=(5, 4))
+            innings = stats_for(self.match_data).innings[innings_idx]
             
-            # Pie chart showing runs from boundaries vs non-boundaries
-            total_runs = sum(batsman["runs"] for batsman in innings["batsmen"])
-            boundary_runs = sum((batsman["fours"] * 4) + (batsman["sixes"] * 6) for batsman in innings["batsmen"])
-            non_boundary_runs = total_runs - boundary_runs
+            # Update batting table - only rows whose numbers changed are touched
+            self.sync_table_rows(batting_table, self.batting_table_rows(innings), batting_rows)
             
-            labels = ['Boundary Runs', 'Non-Boundary Runs']
-            sizes = [boundary_runs, non_boundary_runs]
-            colors = ['#e74c3c', '#3498db']
-            explode = (0.1, 0)
-            
-            ax2.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%', shadow=True, startangle=90)
-            ax2.axis('equal')
-            ax2.set_title('Run Distribution')
-            
-            canvas2 = FigureCanvasTkAgg(fig2, strike_frame)
-            canvas2.draw()
-            canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Charts for the selected analysis type
+            self.draw_batting_charts(analysis_chart, distribution_chart, innings, analysis_type)
         
         # Bind dropdowns to update function
         innings_var.trace('w', update_batting_analysis)
         analysis_var.trace('w', update_batting_analysis)
+        
+        def update_batting_tab(changes=None):
+            # Skip the refresh if the innings on screen didn't change
+            shown_idx = innings_dropdown.current()
+            if changes is None or changes.batting_changed(shown_idx):
+                update_batting_analysis()
+        
+        self.tab_updaters[self.batting_tab] = update_batting_tab
+    
+    def create_batting_charts(self, analysis_parent, distribution_parent):
+        """Create the batting analysis and run distribution figures"""
+        # Add more padding on left for names
+        analysis_chart = ChartPanel(analysis_parent, figsize=(5, 4), left=0.25)
+        distribution_chart = ChartPanel(distribution_parent, figsize=(5, 4))
+        return analysis_chart, distribution_chart
+    
+    def batting_table_rows(self, innings):
+        """Batting scorecard rows as (row key, values) for sync_table_rows"""
+        names = innings.batsman_names
+        columns = zip(names, innings.bat_runs, innings.bat_balls, innings.bat_fours, innings.bat_sixes,
+                      innings.strike_rates)
+        return list(zip(self.unique_row_keys(names), columns))
+    
+    def draw_batting_charts(self, analysis_chart, distribution_chart, innings, analysis_type):
+        """Draw the selected analysis for the top batsmen and the boundary run split"""
+        # Chart settings per analysis type: column, colour, axis label, title, value format
+        analysis_styles = {
+            "Runs Distribution": ("runs", '#3498db', 'Runs', 'Runs by Batsmen', "{:.0f}"),
+            "Balls Faced": ("balls", '#9b59b6', 'Balls Faced', 'Balls Faced by Batsmen', "{:.0f}"),
+            "Strike Rate": ("strike_rate", '#e74c3c', 'Strike Rate', 'Batsmen Strike Rates', "{}"),
+            "Boundary %": ("boundary_pct", '#9b59b6', 'Boundary %', 'Percentage of Runs from Boundaries', "{}")
+        }
+        field, color, xlabel, title, fmt = analysis_styles[analysis_type]
+        
+        # Top 6 batsmen in batting order, sorted by value (descending)
+        values = innings.batting_columns[field][:6]
+        order = rank(values)
+        sorted_names = [innings.batsman_names[i] for i in order]
+        sorted_values = [values[i] for i in order]
+        
+        # Horizontal bar chart with values at the end of bars
+        analysis_chart.bar(0, sorted_names, sorted_values, color=color, horizontal=True,
+                           value_labels=True, offset=0.5, fmt=fmt)
+        analysis_chart.set_labels(0, title=title, xlabel=xlabel)
+        analysis_chart.draw()
+        
+        # Pie chart showing runs from boundaries vs non-boundaries
+        distribution_chart.pie(0, [innings.boundary_runs, innings.non_boundary_runs],
+                               labels=['Boundary Runs', 'Non-Boundary Runs'],
+                               colors=['#e74c3c', '#3498db'],
+                               explode=(0.1, 0), title='Run Distribution')
+        distribution_chart.draw()
     
     def create_bowling_tab(self):
         """Create content for the bowling analysis tab"""
@@ -1749,71 +1915,11 @@ Result: {header["status"]}
         wickets_frame = ttk.LabelFrame(graphs_frame, text="Wickets by Bowlers")
         wickets_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 3))
         
-        fig1, ax1 = plt.subplots(figsize=(5, 4))
-        
-        # Get data for the second innings (bowling figures for first team)
-        innings = self.match_data["scoreCard"][1]  # Second innings
-        bowlers = innings["bowlers"]
-        
-        names = [bowler["name"] for bowler in bowlers]
-        wickets = [bowler["wickets"] for bowler in bowlers]
-        
-        # Sort data by wickets (descending)
-        sorted_indices = sorted(range(len(names)), key=lambda i: wickets[i], reverse=True)
-        sorted_names = [names[i] for i in sorted_indices]
-        sorted_wickets = [wickets[i] for i in sorted_indices]
-        
-        # Create horizontal bar chart
-        bars = ax1.barh(sorted_names, sorted_wickets, color='#3498db', alpha=0.7)
-        ax1.set_xlabel('Wickets')
-        ax1.set_title('Wickets by Bowlers')
-        
-        # Add values at the end of bars
-        for bar in bars:
-            width = bar.get_width()
-            ax1.text(width + 0.1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                    ha='left', va='center')
-        
-        # Ensure y-labels are fully visible
-        plt.tight_layout()
-        fig1.subplots_adjust(left=0.25)  # Add more padding on left for names
-        
-        canvas1 = FigureCanvasTkAgg(fig1, wickets_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
         # Right graph: Economy rates
         economy_frame = ttk.LabelFrame(graphs_frame, text="Economy Rates")
         economy_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(3, 0))
         
-        fig2, ax2 = plt.subplots(figsize=(5, 4))
-        
-        # Calculate economy rates
-        economy = [round(bowler["runs"] / float(bowler["overs"]), 2) for bowler in bowlers]
-        
-        # Sort data by economy (ascending - lower is better)
-        sorted_indices = sorted(range(len(names)), key=lambda i: economy[i])
-        sorted_names = [names[i] for i in sorted_indices]
-        sorted_economy = [economy[i] for i in sorted_indices]
-        
-        # Create horizontal bar chart
-        bars = ax2.barh(sorted_names, sorted_economy, color='#e74c3c', alpha=0.7)
-        ax2.set_xlabel('Economy Rate')
-        ax2.set_title('Economy Rates')
-        
-        # Add values at the end of bars
-        for bar in bars:
-            width = bar.get_width()
-            ax2.text(width + 0.1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                    ha='left', va='center')
-        
-        # Ensure y-labels are fully visible
-        plt.tight_layout()
-        fig2.subplots_adjust(left=0.25)  # Add more padding on left for names
-        
-        canvas2 = FigureCanvasTkAgg(fig2, economy_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        wickets_chart, economy_chart = self.create_bowling_charts(wickets_frame, economy_frame)
         
         # Bottom frame for bowling scorecard
         scorecard_frame = ttk.LabelFrame(self.bowling_tab, text="Bowling Scorecard", padding=10)
@@ -1831,90 +1937,81 @@ Result: {header["status"]}
             else:
                 bowling_table.column(col, width=80, anchor='center')
         
-        # Insert data
-        for bowler in innings["bowlers"]:
-            economy = round(bowler["runs"] / float(bowler["overs"]), 2)
-            bowling_table.insert('', 'end', values=(
-                bowler["name"],
-                bowler["overs"],
-                bowler["maidens"],
-                bowler["runs"],
-                bowler["wickets"],
-                economy
-            ))
-        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(scorecard_frame, orient=tk.VERTICAL, command=bowling_table.yview)
         bowling_table.configure(yscroll=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         bowling_table.pack(fill=tk.BOTH, expand=True)
         
-        # Update function for changing innings
+        # Values currently shown in each table row, keyed by row id
+        bowling_rows = {}
+        
+        def bowling_innings_index():
+            # Reverse logic for bowling: a team bowls in the other team's innings
+            innings_idx = max(innings_dropdown.current(), 0) ^ 1
+            if innings_idx >= len(self.match_data.innings):
+                innings_idx ^= 1
+            return innings_idx
+        
+        # Update function for new data or changing innings
         def update_bowling_analysis(*args):
-            innings_idx = 0 if innings_var.get() == "Innings 2" else 1  # Reverse logic for bowling
-            
-            # Clear previous graphs
-            for widget in wickets_frame.winfo_children():
-                widget.destroy()
-            for widget in economy_frame.winfo_children():
-                widget.destroy()
+            innings_count = len(self.match_data.innings)
+            innings_options = [f"Innings {i + 1}" for i in range(innings_count)]
+            innings_dropdown["values"] = innings_options
+            if innings_var.get() not in innings_options:
+                innings_var.set(innings_options[0])  # Re-enters through the trace
+                return
             
             # Update data
-            innings = self.match_data["scoreCard"][innings_idx]
-            bowlers = innings["bowlers"]
-            names = [bowler["name"] for bowler in bowlers]
-            
-            # Update bowling table
-            bowling_table.delete(*bowling_table.get_children())
-            for bowler in innings["bowlers"]:
-                economy = round(bowler["runs"] / float(bowler["overs"]), 2)
-                bowling_table.insert('', 'end', values=(
-                    bowler["name"],
-                    bowler["overs"],
-                    bowler["maidens"],
-                    bowler["runs"],
-                    bowler["wickets"],
-                    economy
-                ))
-            
-            # Update wickets graph
-            fig1, ax1 = plt.subplots(figsize=(4, 4))
-            wickets = [bowler["wickets"] for bowler in bowlers]
+            innings = stats_for(self.match_data).innings[bowling_innings_index()]
             
-            bars = ax1.barh(names, wickets, color='#3498db', alpha=0.7)
-            ax1.set_xlabel('Wickets')
-            ax1.set_title('Wickets by Bowlers')
+            # Update bowling table - only rows whose numbers changed are touched
+            self.sync_table_rows(bowling_table, self.bowling_table_rows(innings), bowling_rows)
             
-            # Add values at the end of bars
-            for bar in bars:
-                width = bar.get_width()
-                ax1.text(width + 0.1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                         ha='left', va='center')
-            
-            canvas1 = FigureCanvasTkAgg(fig1, wickets_frame)
-            canvas1.draw()
-            canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Update economy graph
-            fig2, ax2 = plt.subplots(figsize=(4, 4))
-            economy_rates = [round(bowler["runs"] / float(bowler["overs"]), 2) for bowler in bowlers]
-            
-            bars = ax2.barh(names, economy_rates, color='#e74c3c', alpha=0.7)
-            ax2.set_xlabel('Economy Rate')
-            ax2.set_title('Bowler Economy Rates')
-            
-            # Add values at the end of bars
-            for bar in bars:
-                width = bar.get_width()
-                ax2.text(width + 0.1, bar.get_y() + bar.get_height()/2, f'{width}', 
-                         ha='left', va='center')
-            
-            canvas2 = FigureCanvasTkAgg(fig2, economy_frame)
-            canvas2.draw()
-            canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Wickets and economy charts
+            self.draw_bowling_charts(wickets_chart, economy_chart, innings)
         
         # Bind dropdown to update function
         innings_var.trace('w', update_bowling_analysis)
+        
+        def update_bowling_tab(changes=None):
+            # Skip the refresh if the bowling card on screen didn't change
+            if changes is None or changes.bowling_changed(bowling_innings_index()):
+                update_bowling_analysis()
+        
+        self.tab_updaters[self.bowling_tab] = update_bowling_tab
+    
+    def create_bowling_charts(self, wickets_parent, economy_parent):
+        """Create the wickets and economy figures"""
+        wickets_chart = ChartPanel(wickets_parent, figsize=(5, 4), left=0.25)
+        wickets_chart.set_labels(0, title='Wickets by Bowlers', xlabel='Wickets')
+        
+        economy_chart = ChartPanel(economy_parent, figsize=(5, 4), left=0.25)
+        economy_chart.set_labels(0, title='Economy Rates', xlabel='Economy Rate')
+        return wickets_chart, economy_chart
+    
+    def bowling_table_rows(self, innings):
+        """Bowling scorecard rows as (row key, values) for sync_table_rows"""
+        names = innings.bowler_names
+        columns = zip(names, innings.bowl_overs, innings.bowl_maidens, innings.bowl_runs, innings.bowl_wickets,
+                      innings.economies)
+        return list(zip(self.unique_row_keys(names), columns))
+    
+    def draw_bowling_charts(self, wickets_chart, economy_chart, innings):
+        """Draw bowlers sorted by wickets and by economy"""
+        names = innings.bowler_names
+        
+        # Sort data by wickets (descending)
+        order = rank(innings.bowl_wickets)
+        wickets_chart.bar(0, [names[i] for i in order], [innings.bowl_wickets[i] for i in order],
+                          color='#3498db', horizontal=True, value_labels=True, offset=0.1)
+        wickets_chart.draw()
+        
+        # Sort data by economy (ascending - lower is better)
+        order = rank(innings.economies, descending=False)
+        economy_chart.bar(0, [names[i] for i in order], [innings.economies[i] for i in order],
+                          color='#e74c3c', horizontal=True, value_labels=True, offset=0.1)
+        economy_chart.draw()
     
     def create_players_tab(self):
         """Create content for player stats tab"""
@@ -1926,11 +2023,10 @@ Result: {header["status"]}
         team_label = tk.Label(team_frame, text="Select Team:")
         team_label.pack(side=tk.LEFT, padx=(0, 10))
         
-        team_var = tk.StringVar(value=self.match_data["matchHeader"]["teams"][0]["name"])
+        team_var = tk.StringVar()
         team_dropdown = ttk.Combobox(
             team_frame,
             textvariable=team_var,
-            values=[team["name"] for team in self.match_data["matchHeader"]["teams"]],
             state="readonly",
             width=15
         )
@@ -1945,7 +2041,7 @@ Result: {header["status"]}
         player_list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         # Create listbox for players
-        players_listbox = tk.Listbox(player_list_frame, height=15, selectmode=tk.SINGLE)
+        players_listbox = tk.Listbox(player_list_frame, height=15, selectmode=tk.SINGLE, exportselection=False)
         players_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Add scrollbar
@@ -2038,34 +2134,26 @@ Result: {header["status"]}
         graph_frame = ttk.LabelFrame(player_details_frame, text="Performance", padding=10)
         graph_frame.pack(fill=tk.BOTH, expand=True)
         
+        performance_chart = ChartPanel(graph_frame, figsize=(6, 3))
+        performance_chart.set_labels(0, title='Runs Breakdown')
+        
         # Helper function to populate player details
-        def show_player_details(event):
+        def show_player_details(event=None):
             selection = players_listbox.curselection()
             if not selection:
                 return
-                
+            
             idx = selection[0]
             player_name = players_listbox.get(idx)
             
             # Find player in match data
             selected_team = team_var.get()
-            team_idx = 0 if selected_team == self.match_data["matchHeader"]["teams"][0]["name"] else 1
-            innings_idx = team_idx  # For batting
-            bowling_idx = 1 - team_idx  # For bowling (opposite team's innings)
-            
-            # Find batting stats
-            batting_data = None
-            for batsman in self.match_data["scoreCard"][innings_idx]["batsmen"]:
-                if batsman["name"] == player_name:
-                    batting_data = batsman
-                    break
-            
-            # Find bowling stats
-            bowling_data = None
-            for bowler in self.match_data["scoreCard"][bowling_idx]["bowlers"]:
-                if bowler["name"] == player_name:
-                    bowling_data = bowler
-                    break
+            team_idx = 0 if selected_team == self.match_data.header.teams[0].name else 1
+            stats = stats_for(self.match_data)
+            
+            # Batting stats from the team's innings, bowling stats from the opposite team's innings
+            batting_data = stats.innings[team_idx].batsman(player_name)
+            bowling_data = stats.innings[1 - team_idx].bowler(player_name)
             
             # Update player details
             name_var.set(player_name)
@@ -2078,8 +2166,7 @@ Result: {header["status"]}
             if batting_data:
                 runs_var.set(f"Runs: {batting_data['runs']}")
                 balls_var.set(f"Balls: {batting_data['balls']}")
-                sr = round((batting_data['runs'] / batting_data['balls']) * 100, 1) if batting_data['balls'] > 0 else 0
-                sr_var.set(f"Strike Rate: {sr}")
+                sr_var.set(f"Strike Rate: {batting_data['strike_rate']}")
                 boundaries_var.set(f"4s: {batting_data['fours']}, 6s: {batting_data['sixes']}")
             else:
                 runs_var.set("Runs: --")
@@ -2091,8 +2178,7 @@ Result: {header["status"]}
             if bowling_data:
                 overs_var.set(f"Overs: {bowling_data['overs']}")
                 wickets_var.set(f"Wickets: {bowling_data['wickets']}")
-                eco = round(bowling_data['runs'] / float(bowling_data['overs']), 2)
-                eco_var.set(f"Economy: {eco}")
+                eco_var.set(f"Economy: {bowling_data['economy']}")
                 maidens_var.set(f"Maidens: {bowling_data['maidens']}")
             else:
                 overs_var.set("Overs: --")
@@ -2100,31 +2186,18 @@ Result: {header["status"]}
                 eco_var.set("Economy: --")
                 maidens_var.set("Maidens: --")
             
-            # Update performance graph
-            for widget in graph_frame.winfo_children():
-                widget.destroy()
-            
+            # Update performance graph - simple bar chart showing runs composition
             if batting_data:
-                fig, ax = plt.subplots(figsize=(6, 3))
-                
-                # Simple bar chart showing runs composition
-                categories = ['1s & 2s', '4s', '6s']
                 values = [
-                    batting_data["runs"] - (batting_data["fours"] * 4) - (batting_data["sixes"] * 6),
+                    batting_data["runs"] - batting_data["boundary_runs"],
                     batting_data["fours"] * 4,
                     batting_data["sixes"] * 6
                 ]
-                
-                colors = ['#3498db', '#2ecc71', '#e74c3c']
-                ax.bar(categories, values, color=colors, alpha=0.7)
-                ax.set_title('Runs Breakdown')
-                
-                for i, v in enumerate(values):
-                    ax.text(i, v + 1, str(v), ha='center')
-                
-                canvas = FigureCanvasTkAgg(fig, graph_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            else:
+                values = [0, 0, 0]
+            performance_chart.bar(0, ['1s & 2s', '4s', '6s'], values,
+                                  color=['#3498db', '#2ecc71', '#e74c3c'], value_labels=True, offset=1)
+            performance_chart.draw()
         
         # Bind selection event
         players_listbox.bind('<<ListboxSelect>>', show_player_details)
@@ -2132,33 +2205,42 @@ Result: {header["status"]}
         # Function to update player list for selected team
         def update_player_list(*args):
             selected_team = team_var.get()
-            players_listbox.delete(0, tk.END)
             
             # Find team index
-            team_idx = 0 if selected_team == self.match_data["matchHeader"]["teams"][0]["name"] else 1
-            innings_idx = team_idx
-            
-            # Get all players (combine batsmen and bowlers)
-            players = set()
+            team_idx = 0 if selected_team == self.match_data.header.teams[0].name else 1
             
-            # Add batsmen
-            for batsman in self.match_data["scoreCard"][innings_idx]["batsmen"]:
-                players.add(batsman["name"])
+            # All players who batted or bowled for the team
+            players = stats_for(self.match_data).players(team_idx)
             
-            # Add bowlers (from opposite team's innings)
-            bowling_idx = 1 - team_idx  # Opposite team's innings
-            for bowler in self.match_data["scoreCard"][bowling_idx]["bowlers"]:
-                players.add(bowler["name"])
+            # Keep the selected player highlighted across refreshes
+            selection = players_listbox.curselection()
+            selected_player = players_listbox.get(selection[0]) if selection else None
             
             # Add players to listbox
-            for player in sorted(players):
+            players_listbox.delete(0, tk.END)
+            for player in players:
                 players_listbox.insert(tk.END, player)
-        
-        # Initial update
-        update_player_list()
+                if player == selected_player:
+                    players_listbox.selection_set(tk.END)
+            
+            show_player_details()
         
         # Bind team dropdown to update function
         team_var.trace('w', update_player_list)
+        
+        def update_players_tab(changes=None):
+            if changes is not None and not (changes.full or changes.teams or changes.structure
+                                            or changes.batsmen or changes.bowlers):
+                return
+            
+            teams = [team.name for team in self.match_data.header.teams]
+            team_dropdown["values"] = teams
+            if team_var.get() not in teams:
+                team_var.set(teams[0])  # Refreshes the list through the trace
+            else:
+                update_player_list()
+        
+        self.tab_updaters[self.players_tab] = update_players_tab
     
     def create_progress_tab(self):
         """Create content for the match progress tab"""
@@ -2166,53 +2248,7 @@ Result: {header["status"]}
         graph_frame = ttk.LabelFrame(self.progress_tab, text="Match Progress", padding=10)
         graph_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create a larger figure for better visibility
-        fig, ax = plt.subplots(figsize=(12, 7))
-        
-        # Get progress data
-        progress_data = self.match_data["matchProgress"]["overByOver"]
-        overs = [entry["over"] for entry in progress_data]
-        team1_scores = [entry["team1Score"] for entry in progress_data]
-        team2_scores = [entry["team2Score"] for entry in progress_data]
-        
-        team1_name = self.match_data["scoreCard"][0]["team"]
-        team2_name = self.match_data["scoreCard"][1]["team"]
-        
-        # Plot with improved styling
-        ax.plot(overs, team1_scores, marker='o', markersize=6, linestyle='-', linewidth=3, 
-                label=team1_name, color='#113955')  # Using the primary color
-        ax.plot(overs, team2_scores, marker='s', markersize=6, linestyle='-', linewidth=3, 
-                label=team2_name, color='#8c1c13')  # Using the secondary color
-        
-        # Add background shading
-        ax.fill_between(overs, team1_scores, alpha=0.1, color='#113955')
-        ax.fill_between(overs, team2_scores, alpha=0.1, color='#8c1c13')
-        
-        # Improve axis labels and title
-        ax.set_xlabel('Overs', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Score', fontsize=12, fontweight='bold')
-        ax.set_title('Run Progress Throughout the Match', fontsize=14, fontweight='bold', pad=15)
-        
-        # Add grid for better readability
-        ax.grid(True, linestyle='--', alpha=0.7)
-        
-        # Improve legend
-        ax.legend(fontsize=11, frameon=True, fancybox=True, framealpha=0.8, loc='upper left')
-        
-        # Annotate key points
-        for i in range(len(overs)):
-            # Annotate at regular intervals to avoid crowding
-            if i % 3 == 0 or i == len(overs)-1:  
-                ax.annotate(f"{team1_scores[i]}", (overs[i], team1_scores[i]),
-                            textcoords="offset points", xytext=(0,10), ha='center',
-                            fontweight='bold', fontsize=9)
-                ax.annotate(f"{team2_scores[i]}", (overs[i], team2_scores[i]),
-                            textcoords="offset points", xytext=(0,-15), ha='center',
-                            fontweight='bold', fontsize=9)
-        
-        canvas = FigureCanvasTkAgg(fig, graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        chart = self.create_progress_chart(graph_frame)
         
         # Add analysis section
         analysis_frame = ttk.LabelFrame(self.progress_tab, text="Match Analysis", padding=10)
@@ -2225,65 +2261,122 @@ Result: {header["status"]}
         right_stats = tk.Frame(analysis_frame)
         right_stats.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        # Calculate key stats
-        innings1 = self.match_data["scoreCard"][0]
-        innings2 = self.match_data["scoreCard"][1]
-        
-        # Run rate progression
-        rr_progression = []
-        for i in range(len(progress_data)):
-            over = progress_data[i]["over"]
-            team1_rr = round(progress_data[i]["team1Score"] / over, 2) if over > 0 else 0
-            team2_rr = round(progress_data[i]["team2Score"] / over, 2) if over > 0 else 0
-            rr_progression.append((over, team1_rr, team2_rr))
-        
-        # Find powerplay scores (first 10 overs)
-        powerplay_idx = next((i for i, entry in enumerate(progress_data) if entry["over"] >= 10), 0)
-        powerplay1 = progress_data[powerplay_idx]["team1Score"] if powerplay_idx < len(progress_data) else 0
-        powerplay2 = progress_data[powerplay_idx]["team2Score"] if powerplay_idx < len(progress_data) else 0
+        # Left column stats
+        phase_vars = {}
+        for phase, title in [("powerplay", "Powerplay Score (1-10 overs)"),
+                             ("middle", "Middle Overs (11-40)"),
+                             ("death", "Death Overs (41-50)")]:
+            tk.Label(left_stats, text=title, font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
+            phase_vars[phase] = (tk.StringVar(), tk.StringVar())
+            tk.Label(left_stats, textvariable=phase_vars[phase][0]).pack(anchor="w")
+            tk.Label(left_stats, textvariable=phase_vars[phase][1]).pack(anchor="w", pady=(0, 10))
         
-        # Find middle overs scores (11-40)
-        middle_idx = next((i for i, entry in enumerate(progress_data) if entry["over"] >= 40), len(progress_data) - 1)
-        middle1 = progress_data[middle_idx]["team1Score"] - powerplay1 if middle_idx < len(progress_data) else 0
-        middle2 = progress_data[middle_idx]["team2Score"] - powerplay2 if middle_idx < len(progress_data) else 0
+        # Right column stats
+        tk.Label(right_stats, text=f"Key Moments", font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
         
-        # Death overs (41-50)
-        death1 = innings1["runs"] - progress_data[middle_idx]["team1Score"] if middle_idx < len(progress_data) else 0
-        death2 = innings2["runs"] - progress_data[middle_idx]["team2Score"] if middle_idx < len(progress_data) else 0
+        lead2_var = tk.StringVar()
+        lead1_var = tk.StringVar()
+        tk.Label(right_stats, textvariable=lead2_var).pack(anchor="w")
+        tk.Label(right_stats, textvariable=lead1_var).pack(anchor="w", pady=(0, 10))
         
-        # Left column stats
-        tk.Label(left_stats, text=f"Powerplay Score (1-10 overs)", font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
-        tk.Label(left_stats, text=f"{team1_name}: {powerplay1} runs").pack(anchor="w")
-        tk.Label(left_stats, text=f"{team2_name}: {powerplay2} runs").pack(anchor="w", pady=(0, 10))
+        highest_over_card = self.create_progress_stat_card(right_stats, "Highest Scoring Over", "")
         
-        tk.Label(left_stats, text=f"Middle Overs (11-40)", font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
-        tk.Label(left_stats, text=f"{team1_name}: {middle1} runs").pack(anchor="w")
-        tk.Label(left_stats, text=f"{team2_name}: {middle2} runs").pack(anchor="w", pady=(0, 10))
+        def update_progress(changes=None):
+            if changes is not None and not (changes.full or changes.structure or changes.progress):
+                return
+            
+            innings1 = self.match_data.innings[0]
+            innings2 = self.match_data.innings[1]
+            team1_name = innings1.team
+            team2_name = innings2.team
+            curve1 = self.progress_curve(innings1)
+            curve2 = self.progress_curve(innings2)
+            
+            self.draw_progress_chart(chart, curve1.overs, curve1.scores, curve2.overs, curve2.scores,
+                                     team1_name, team2_name)
+            
+            # Runs in each phase of both innings
+            phases1 = curve1.phase_runs()
+            phases2 = curve2.phase_runs()
+            for phase in phase_vars:
+                phase_vars[phase][0].set(f"{team1_name}: {phases1[phase]} runs")
+                phase_vars[phase][1].set(f"{team2_name}: {phases2[phase]} runs")
+            
+            # Find key moments (biggest run differences at the end of an over both sides have reached)
+            overs = np.arange(1, int(min(curve1.last_over, curve2.last_over)) + 1)
+            if len(overs):
+                run_diffs = curve2.score_at(overs) - curve1.score_at(overs)
+                max_idx = int(np.argmax(run_diffs))
+                min_idx = int(np.argmin(run_diffs))
+                lead2_var.set(f"Biggest lead for {team2_name}: {run_diffs[max_idx]:.0f} runs (over {overs[max_idx]})")
+                lead1_var.set(f"Biggest lead for {team1_name}: {-run_diffs[min_idx]:.0f} runs (over {overs[min_idx]})")
+            else:
+                lead2_var.set(f"Biggest lead for {team2_name}: --")
+                lead1_var.set(f"Biggest lead for {team1_name}: --")
+            
+            # Find over with highest scoring
+            lines = []
+            for name, over_runs in [(team1_name, curve1.over_runs()), (team2_name, curve2.over_runs())]:
+                if len(over_runs):
+                    best = int(np.argmax(over_runs))
+                    lines.append(f"{name}: {over_runs[best]} runs (over {best + 1})")
+                else:
+                    lines.append(f"{name}: --")
+            highest_over_card.value_label.config(text="\n".join(lines))
         
-        tk.Label(left_stats, text=f"Death Overs (41-50)", font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
-        tk.Label(left_stats, text=f"{team1_name}: {death1} runs").pack(anchor="w")
-        tk.Label(left_stats, text=f"{team2_name}: {death2} runs").pack(anchor="w")
+        self.tab_updaters[self.progress_tab] = update_progress
+    
+    def progress_curve(self, innings):
+        """Score against overs for an innings: the ball-by-ball timeline if it has any overs, else the poll samples"""
+        if len(self.timeline.worm(innings.innings_id)):
+            return self.timeline.curve(innings.innings_id)
+        return self.score_history.curve(innings.innings_id)
+    
+    def create_progress_chart(self, parent):
+        """Create the run progress figure"""
+        # Create a larger figure for better visibility
+        chart = ChartPanel(parent, figsize=(12, 7))
+        ax = chart.axes[0]
         
-        # Right column stats
-        tk.Label(right_stats, text=f"Key Moments", font=("Arial", 10, "bold")).pack(anchor="w", pady=(5, 0))
+        # Improve axis labels and title
+        ax.set_xlabel('Overs', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Score', fontsize=12, fontweight='bold')
+        ax.set_title('Run Progress Throughout the Match', fontsize=14, fontweight='bold', pad=15)
         
-        # Find key moments (biggest run differences)
-        run_diffs = [(i, team2_scores[i] - team1_scores[i]) for i in range(len(overs))]
-        max_diff = max(run_diffs, key=lambda x: x[1])
-        min_diff = min(run_diffs, key=lambda x: x[1])
+        # Add grid for better readability
+        ax.grid(True, linestyle='--', alpha=0.7)
+        return chart
+    
+    def draw_progress_chart(self, chart, team1_overs, team1_scores, team2_overs, team2_scores, team1_name, team2_name):
+        """Draw both teams' score progressions with shading and annotations"""
+        ax = chart.axes[0]
         
-        tk.Label(right_stats, text=f"Biggest lead for {team2_name}: {max_diff[1]} runs (over {overs[max_diff[0]]})").pack(anchor="w")
-        tk.Label(right_stats, text=f"Biggest lead for {team1_name}: {-min_diff[1]} runs (over {overs[min_diff[0]]})").pack(anchor="w", pady=(0, 10))
+        # Plot with improved styling
+        chart.line(0, "team1", team1_overs, team1_scores, marker='o', markersize=6, linestyle='-', linewidth=3,
+                   label=team1_name, color='#113955')  # Using the primary color
+        chart.line(0, "team2", team2_overs, team2_scores, marker='s', markersize=6, linestyle='-', linewidth=3,
+                   label=team2_name, color='#8c1c13')  # Using the secondary color
         
-        # Find over with highest scoring
-        over_scores1 = [team1_scores[i] - team1_scores[i-1] if i > 0 else team1_scores[0] for i in range(len(team1_scores))]
-        over_scores2 = [team2_scores[i] - team2_scores[i-1] if i > 0 else team2_scores[0] for i in range(len(team2_scores))]
+        # Add background shading
+        chart.overlay(0, "fill", [
+            ax.fill_between(team1_overs, team1_scores, alpha=0.1, color='#113955'),
+            ax.fill_between(team2_overs, team2_scores, alpha=0.1, color='#8c1c13')
+        ])
         
-        max_over1_idx = max(range(len(over_scores1)), key=lambda i: over_scores1[i])
-        max_over2_idx = max(range(len(over_scores2)), key=lambda i: over_scores2[i])
+        # Improve legend
+        ax.legend(fontsize=11, frameon=True, fancybox=True, framealpha=0.8, loc='upper left')
         
-        self.create_progress_stat_card(right_stats, "Highest Scoring Over", 
-            f"{team1_name}: {over_scores1[max_over1_idx]} runs (over {overs[max_over1_idx]})\n{team2_name}: {over_scores2[max_over2_idx]} runs (over {overs[max_over2_idx]})")
+        # Annotate about a dozen points per team to avoid crowding, skipping overs with no score
+        annotations = []
+        for overs, scores, offset in [(team1_overs, team1_scores, 10), (team2_overs, team2_scores, -15)]:
+            step = max(3, len(overs) // 12)
+            for i in range(len(overs)):
+                if (i % step == 0 or i == len(overs)-1) and not np.isnan(scores[i]):
+                    annotations.append(ax.annotate(f"{scores[i]:.0f}", (overs[i], scores[i]),
+                                                   textcoords="offset points", xytext=(0,offset), ha='center',
+                                                   fontweight='bold', fontsize=9))
+        chart.overlay(0, "annotations", annotations)
+        chart.draw()
     
     def create_progress_stat_card(self, parent, title, value):
         """Create a styled stat card for the progress tab"""
@@ -2298,8 +2391,11 @@ Result: {header["status"]}
         value_label = tk.Label(card, text=value, font=("Arial", 10), bg='white', justify=tk.LEFT)
         value_label.pack(anchor='w')
         
+        # Keep the value label reachable so the card can be updated in place
+        card.value_label = value_label
+        
         return card
-    
+
     def export_data(self):
         """Export data to JSON file"""
         if not self.match_data:
@@ -2322,7 +2418,7 @@ Result: {header["status"]}
                 
             # Save data to file
             with open(file_path, 'w') as f:
-                json.dump(self.match_data, f, indent=2)
+                json.dump(self.match_data.to_dict(), f, indent=2)
                 
             # Show success message
             self.show_toast_notification(f"Data exported successfully to {file_path}")
@@ -2331,7 +2427,17 @@ Result: {header["status"]}
             messagebox.showerror("Export Error", f"Failed to export data: {str(e)}")
     
     def show_toast_notification(self, message):
-        """Show a temporary toast notification"""
+        """Show a temporary toast notification, after any toasts already showing or waiting"""
+        if message in self.toast_queue:
+            return
+        self.toast_queue.append(message)
+        if len(self.toast_queue) == 1:
+            self.render.invalidate("toast", self._show_toast)
+    
+    def _show_toast(self):
+        """Create a toast for the first queued message and schedule its removal"""
+        message = self.toast_queue[0]
+        
         # Create toast frame
         toast = tk.Frame(self.root, bg="#333333", padx=10, pady=10)
         
@@ -2347,15 +2453,18 @@ Result: {header["status"]}
         )
         msg_label.pack()
         
-        # Position at bottom center
-        self.root.update_idletasks()
-        width = toast.winfo_reqwidth()
-        root_width = self.root.winfo_width()
-        x = (root_width - width) // 2
-        toast.place(x=x, y=self.root.winfo_height() - 100)
+        # Position at bottom center, anchored so it needn't be measured first
+        toast.place(relx=0.5, rely=1.0, y=-100, anchor="n")
         
-        # Schedule removal
-        self.root.after(5000, lambda: toast.destroy())
+        # Schedule removal, then the next toast
+        self.render.invalidate_after(5000, toast, lambda: self._remove_toast(toast))
+    
+    def _remove_toast(self, toast):
+        """Remove the toast on screen and show the next queued one"""
+        toast.destroy()
+        self.toast_queue.pop(0)
+        if self.toast_queue:
+            self._show_toast()
     
     def show_detailed_analysis(self):
         """Show detailed analysis in a new window"""
@@ -2403,33 +2512,23 @@ Result: {header["status"]}
         notebook.add(perf_tab, text="Performance Metrics")
         
         # Generate basic head to head stats
-        team1_name = self.match_data["scoreCard"][0]["team"]
-        team2_name = self.match_data["scoreCard"][1]["team"]
+        stats = stats_for(self.match_data)
+        innings1, innings2 = stats.innings[0], stats.innings[1]
+        team1_name = innings1.team
+        team2_name = innings2.team
         
         h2h_frame = ttk.LabelFrame(h2h_tab, text=f"{team1_name} vs {team2_name}", padding=10)
         h2h_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create comparison metrics
+        # Create comparison metrics (a team's bowling economy comes from the other team's innings)
         metrics = [
-            ("Total Runs", self.match_data["scoreCard"][0]["runs"], self.match_data["scoreCard"][1]["runs"]),
-            ("Wickets Lost", self.match_data["scoreCard"][0]["wickets"], self.match_data["scoreCard"][1]["wickets"]),
-            ("Overs Played", self.match_data["scoreCard"][0]["overs"], self.match_data["scoreCard"][1]["overs"]),
-            ("Run Rate", round(self.match_data["scoreCard"][0]["runs"] / float(self.match_data["scoreCard"][0]["overs"]), 2),
-                        round(self.match_data["scoreCard"][1]["runs"] / float(self.match_data["scoreCard"][1]["overs"]), 2)),
-            ("Total Boundaries", sum(b["fours"] for b in self.match_data["scoreCard"][0]["batsmen"]) + 
-                                 sum(b["sixes"] for b in self.match_data["scoreCard"][0]["batsmen"]),
-                                 sum(b["fours"] for b in self.match_data["scoreCard"][1]["batsmen"]) + 
-                                 sum(b["sixes"] for b in self.match_data["scoreCard"][1]["batsmen"])),
-            ("Batting Strike Rate", 
-                round(100 * self.match_data["scoreCard"][0]["runs"] / 
-                      sum(b["balls"] for b in self.match_data["scoreCard"][0]["batsmen"]), 2),
-                round(100 * self.match_data["scoreCard"][1]["runs"] / 
-                      sum(b["balls"] for b in self.match_data["scoreCard"][1]["batsmen"]), 2)),
-            ("Bowling Economy", 
-                round(self.match_data["scoreCard"][1]["runs"] / 
-                      sum(float(b["overs"]) for b in self.match_data["scoreCard"][1]["bowlers"]), 2),
-                round(self.match_data["scoreCard"][0]["runs"] / 
-                      sum(float(b["overs"]) for b in self.match_data["scoreCard"][0]["bowlers"]), 2))
+            ("Total Runs", innings1.runs, innings2.runs),
+            ("Wickets Lost", innings1.wickets, innings2.wickets),
+            ("Overs Played", innings1.overs, innings2.overs),
+            ("Run Rate", innings1.run_rate, innings2.run_rate),
+            ("Total Boundaries", innings1.boundaries, innings2.boundaries),
+            ("Batting Strike Rate", innings1.strike_rate, innings2.strike_rate),
+            ("Bowling Economy", innings2.economy, innings1.economy)
         ]
         
         # Create comparison table
@@ -2457,34 +2556,20 @@ Result: {header["status"]}
                 ttk.Separator(h2h_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
         
         # Performance metrics tab
-        # Create radar chart comparing key performance metrics
-        fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
+        # Pack radar chart in performance tab
+        radar_frame = tk.Frame(perf_tab)
+        radar_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create radar chart comparing key performance metrics (freed with the window)
+        radar_chart = ChartPanel(radar_frame, figsize=(6, 6), subplot_kw=dict(polar=True), padx=10, pady=10)
+        ax = radar_chart.axes[0]
         
         # Define performance categories
         categories = ['Batting\nScore', 'Run\nRate', 'Batting\nS/R', 'Boundaries', 'Bowling\nEconomy', 'Wicket\nTaking']
         
-        # Normalize metrics for radar chart (0-1 scale)
-        team1_metrics = [
-            self.match_data["scoreCard"][0]["runs"] / max(self.match_data["scoreCard"][0]["runs"], self.match_data["scoreCard"][1]["runs"]),
-            (self.match_data["scoreCard"][0]["runs"] / float(self.match_data["scoreCard"][0]["overs"])) / 10,  # Normalize run rate (assume max 10)
-            (100 * self.match_data["scoreCard"][0]["runs"] / sum(b["balls"] for b in self.match_data["scoreCard"][0]["batsmen"])) / 150,  # Normalize SR (assume max 150)
-            sum(b["fours"] + b["sixes"] for b in self.match_data["scoreCard"][0]["batsmen"]) / 30,  # Normalize boundaries (assume max 30)
-            1 - (self.match_data["scoreCard"][1]["runs"] / sum(float(b["overs"]) for b in self.match_data["scoreCard"][1]["bowlers"])) / 10,  # Lower economy is better
-            sum(b["wickets"] for b in self.match_data["scoreCard"][1]["bowlers"]) / 10  # Normalize wickets (assume max 10)
-        ]
-        
-        team2_metrics = [
-            self.match_data["scoreCard"][1]["runs"] / max(self.match_data["scoreCard"][0]["runs"], self.match_data["scoreCard"][1]["runs"]),
-            (self.match_data["scoreCard"][1]["runs"] / float(self.match_data["scoreCard"][1]["overs"])) / 10,
-            (100 * self.match_data["scoreCard"][1]["runs"] / sum(b["balls"] for b in self.match_data["scoreCard"][1]["batsmen"])) / 150,
-            sum(b["fours"] + b["sixes"] for b in self.match_data["scoreCard"][1]["batsmen"]) / 30,
-            1 - (self.match_data["scoreCard"][0]["runs"] / sum(float(b["overs"]) for b in self.match_data["scoreCard"][0]["bowlers"])) / 10,
-            sum(b["wickets"] for b in self.match_data["scoreCard"][0]["bowlers"]) / 10
-        ]
-        
-        # Cap values between 0 and 1
-        team1_metrics = [max(0, min(1, m)) for m in team1_metrics]
-        team2_metrics = [max(0, min(1, m)) for m in team2_metrics]
+        # Metrics normalized to a 0-1 scale for the radar chart (copied, the polygons are closed below)
+        team1_metrics = list(stats.radar[0])
+        team2_metrics = list(stats.radar[1])
         
         # Number of categories
         N = len(categories)
@@ -2517,23 +2602,16 @@ Result: {header["status"]}
         ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
         
         # Add title
-        plt.title('Team Performance Comparison', size=14, y=1.1)
+        ax.set_title('Team Performance Comparison', size=14, y=1.1)
         
-        # Pack radar chart in performance tab
-        radar_frame = tk.Frame(perf_tab)
-        radar_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Rename the variable to avoid conflict with the scrolling canvas
-        figure_canvas = FigureCanvasTkAgg(fig, radar_frame)
-        figure_canvas.draw()
-        figure_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        radar_chart.canvas.draw()
         
         # Add text analysis
         text_frame = ttk.LabelFrame(perf_tab, text="Performance Insights", padding=10)
         text_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Build analysis text based on metrics
-        winner = team1_name if self.match_data["matchHeader"]["status"].startswith(team1_name) else team2_name
+        winner = team1_name if self.match_data.header.status.startswith(team1_name) else team2_name
         
         analysis_text = f"""
 Match Analysis: {team1_name} vs {team2_name}
@@ -2595,8 +2673,10 @@ This analysis is based on key performance metrics normalized across both teams.
         )
         dropdown_label.pack(side=tk.LEFT, padx=(0, 10))
         
-        # Predefined match IDs
-        match_ids = ["112469", "112462", "112455", "112420", "112402"]
+        # Live matches from the last match list, then predefined match IDs
+        match_ids = [str(match["id"]) for match in self.live_matches]
+        match_ids += [match_id for match_id in ["112469", "112462", "112455", "112420", "112402"]
+                      if match_id not in match_ids]
         
         # Add current ID if not in list
         if self.match_id not in match_ids:
@@ -2666,6 +2746,8 @@ This analysis is based on key performance metrics normalized across both teams.
             # Check if ID is valid and different
             if new_id and new_id != self.match_id:
                 self.match_id = new_id
+                # Anything still being fetched is for the old match - drop it
+                self.fetcher.new_generation()
                 # Update the match ID button text in the sidebar
                 for widget in self.root.winfo_children():
                     if isinstance(widget, tk.Frame) and widget.winfo_width() == 200:  # Sidebar
@@ -2702,7 +2784,178 @@ This analysis is based on key performance metrics normalized across both teams.
         id_dropdown.focus_set()
         # Wait for the dialog to be closed
         dialog.wait_window()
+
+
+class MatchMonitor:
+    """Tiled overview of many live matches, polled together on one shared request budget"""
+    
+    TILE_COLUMNS = 4
+    
+    def __init__(self, root, match_ids, api=None, cache=None, refresh_interval=60, max_workers=4):
+        self.root = root
+        self.root.title("Cricket Match Monitor")
+        self.root.geometry("1600x900")
+        self.root.configure(bg="#f0f0f0")
+        self.refresh_interval = refresh_interval
+        
+        # One client, budget and response cache shared by the tiles and any drill-down windows
+        self.api = api if api else CricbuzzClient()
+        self.response_cache = cache if cache else ResponseCache()
+        self.scheduler = PollScheduler(self.api, CricketDashboard.process_api_data, interval=refresh_interval,
+                                       max_workers=max_workers, cache=self.response_cache)
+        
+        # Header with the match count, last poll result and remaining budget
+        header_frame = tk.Frame(self.root, bg="#113955", height=60)
+        header_frame.pack(fill=tk.X, side=tk.TOP)
+        tk.Label(header_frame, text="Live Match Monitor", font=("Arial", 16, "bold"),
+                 bg="#113955", fg="white").pack(side=tk.LEFT, padx=20, pady=10)
+        self.budget_var = tk.StringVar()
+        tk.Label(header_frame, textvariable=self.budget_var, bg="#113955", fg="white").pack(side=tk.RIGHT, padx=10)
+        self.status_var = tk.StringVar(value="Status: Starting")
+        tk.Label(header_frame, textvariable=self.status_var, bg="#113955", fg="white").pack(side=tk.RIGHT, padx=10)
+        
+        self.grid_frame = tk.Frame(self.root, bg="#f0f0f0", padx=10, pady=10)
+        self.grid_frame.pack(fill=tk.BOTH, expand=True)
+        for column in range(self.TILE_COLUMNS):
+            self.grid_frame.columnconfigure(column, weight=1, uniform="tile")
+        
+        self.tiles = {}  # Match ID -> tile widgets and variables
+        for match_id in match_ids:
+            self.add_match(match_id)
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.tick_job = None
+        self._tick()
+    
+    def add_match(self, match_id):
+        """Add a tile for a match and start polling it"""
+        if match_id in self.tiles:
+            return
+        
+        index = len(self.tiles)
+        tile = tk.Frame(self.grid_frame, bg="white", relief=tk.RIDGE, bd=1, padx=10, pady=8, cursor="hand2")
+        tile.grid(row=index // self.TILE_COLUMNS, column=index % self.TILE_COLUMNS, sticky="nsew", padx=5, pady=5)
+        
+        title_var = tk.StringVar(value=f"Match {match_id}")
+        innings_var = tk.StringVar(value="Waiting for scorecard...")
+        status_var = tk.StringVar()
+        tk.Label(tile, textvariable=title_var, font=("Arial", 11, "bold"), bg="white", anchor="w").pack(fill=tk.X)
+        tk.Label(tile, textvariable=innings_var, font=("Consolas", 10), bg="white", anchor="w",
+                 justify=tk.LEFT).pack(fill=tk.X, pady=(4, 4))
+        tk.Label(tile, textvariable=status_var, font=("Arial", 9), bg="white", fg="#666666", anchor="w",
+                 wraplength=320, justify=tk.LEFT).pack(fill=tk.X)
+        
+        # Clicking anywhere on the tile opens the full single-match dashboard
+        for widget in [tile] + tile.winfo_children():
+            widget.bind("<Button-1>", lambda event, match_id=match_id: self.drill_down(match_id))
+        
+        self.tiles[match_id] = {"frame": tile, "title": title_var, "innings": innings_var, "status": status_var}
+        
+        # Show the last saved scorecard until the first poll answers
+        entry = self.response_cache.get("hscard", match_id)
+        if entry:
+            try:
+                self.update_tile(match_id, CricketDashboard.process_api_data(entry["payload"]))
+                status_var.set(status_var.get() + " (cached)")
+            except Exception as e:
+                print(f"Ignoring unreadable cached scorecard: {str(e)}")
+        self.scheduler.follow(match_id)
+    
+    def update_tile(self, match_id, match):
+        """Show a processed snapshot on a match's tile"""
+        tile = self.tiles[match_id]
+        header = match.header
+        teams = " vs ".join(team.short_name or team.name for team in header.teams)
+        tile["title"].set(f"{teams} - {header.description}" if teams else f"Match {match_id}")
+        lines = [f"{inning.team[:16]:<16} {inning.runs:>3}/{inning.wickets:<2} ({inning.overs} ov)"
+                 for inning in match.innings]
+        tile["innings"].set("\n".join(lines) if lines else "Yet to start")
+        tile["status"].set(header.status)
+    
+    def _tick(self):
+        """Hand due polls to the scheduler and show the results that came back"""
+        for result in self.scheduler.tick():
+            tile = self.tiles.get(result.match_id)
+            if tile is None:
+                continue
+            if result.match is not None:
+                self.update_tile(result.match_id, result.match)
+            elif result.error:
+                tile["status"].set(f"{result.error} - showing last known score")
+        
+        polled = datetime.now().strftime("%H:%M:%S")
+        self.status_var.set(f"Status: {len(self.tiles)} matches, every {self.scheduler.poll_interval():.0f}s "
+                            f"(checked {polled})")
+        self.budget_var.set(f"API budget: {self.api.budget.remaining()}/{self.api.budget.day.capacity}")
+        self.tick_job = self.root.after(500, self._tick)
+    
+    def drill_down(self, match_id):
+        """Open the single-match tabs for a tile in their own window"""
+        window = tk.Toplevel(self.root)
+        
+        # The window polls this match itself while it is open
+        self.scheduler.pause(match_id)
+        
+        def on_destroy(event):
+            if event.widget is window:
+                dashboard.stop()
+                self.scheduler.resume(match_id)
+        
+        window.bind("<Destroy>", on_destroy)
+        dashboard = CricketDashboard(window, match_id=match_id, api=self.api, cache=self.response_cache,
+                                     refresh_interval=self.refresh_interval)
+    
+    def on_close(self):
+        """Stop polling and close the window"""
+        if self.tick_job:
+            self.root.after_cancel(self.tick_job)
+        self.scheduler.close()
+        self.api.close()
+        self.root.destroy()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cricket Match Dashboard")
+    parser.add_argument("--match-id", help="open this match instead of the selection screen")
+    parser.add_argument("--select", action="store_true",
+                        help="show the selection screen instead of reopening the last session's match")
+    parser.add_argument("--record", metavar="DIR", help="save every API response to DIR for offline replay")
+    parser.add_argument("--replay", metavar="DIR", help="serve recorded responses from DIR instead of the API")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed-up factor (default 1)")
+    parser.add_argument("--refresh", type=float, help="auto-refresh interval in seconds")
+    parser.add_argument("--monitor", nargs="*", metavar="MATCH_ID",
+                        help="show a tiled monitor of these matches (every live match if none are given)")
+    args = parser.parse_args()
+    
+    api = None
+    cache = None
+    if args.replay:
+        api = ReplayClient(args.replay, speed=args.speed)
+        # Keep replayed responses out of the real response cache
+        cache = ResponseCache(tempfile.mkdtemp(prefix="dashboard-replay-"))
+    elif args.record:
+        api = CricbuzzClient(recorder=SnapshotRecorder(args.record))
+    
+    # Without match IDs the monitor follows every live match, looked up before any window opens
+    match_ids = args.monitor
+    if match_ids is not None and not match_ids:
+        api = api if api else CricbuzzClient()
+        try:
+            response = api.live_matches()
+            if response.status_code != 200:
+                parser.exit(1, f"Couldn't load the live matches to monitor: API error ({response.status_code})\n")
+            match_ids = live_match_ids(response.json())
+        except (QuotaExhausted, requests.RequestException, ValueError) as e:
+            parser.exit(1, f"Couldn't load the live matches to monitor: {str(e)}\n")
+        if not match_ids:
+            parser.exit(1, "No live matches to monitor - pass match IDs to --monitor\n")
+    
     root = tk.Tk()
-    app = CricketDashboard(root)
+    if match_ids is not None:
+        app = MatchMonitor(root, match_ids, api=api, cache=cache,
+                           refresh_interval=args.refresh if args.refresh else 60)
+    else:
+        app = CricketDashboard(root, match_id=args.match_id, api=api, cache=cache,
+                               refresh_interval=args.refresh if args.refresh else 60, restore=not args.select,
+                               persist_session=True)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import queue
+
+
+class FetchExecutor:
+    """Runs fetches on a bounded worker pool and hands their results to the UI thread through one queue
+
+    A job is func(*args) run on a worker, returning a callback (or None) that drain()
+    later runs on the UI thread, so workers never touch widgets. Jobs are tagged with
+    the generation current when they were submitted: starting a new generation (the
+    dashboard does this when it switches matches) cancels the older jobs still queued
+    and drops the results of those already running, so a slow response for the old
+    match can't overwrite the new one.
+
+    submit(), new_generation() and drain() are called on the UI thread only; workers
+    just put results on the queue.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.results = queue.Queue()
+        self.generation = 0
+        self.dropped = 0     # Results thrown away because their generation was over
+        self._pending = {}   # Job key -> (generation, future) of the job running for it
+
+    def new_generation(self):
+        """Supersede every job submitted so far"""
+        self.generation += 1
+        for _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        return self.generation
+
+    def busy(self, key):
+        """Whether a job for key is running in the current generation"""
+        return key in self._pending
+
+    def submit(self, key, func, *args):
+        """Run func(*args) on the pool unless a job for key is already running; returns whether it was submitted"""
+        if key in self._pending:
+            return False
+        generation = self.generation
+
+        def run():
+            callback = None
+            try:
+                callback = func(*args)
+            finally:
+                # Always report back, so the key is released even if func failed
+                self.results.put((generation, key, callback))
+
+        self._pending[key] = (generation, self.pool.submit(run))
+        return True
+
+    def post(self, callback):
+        """Queue a callback for the UI thread from any thread, whatever the generation"""
+        self.results.put((None, None, callback))
+
+    def drain(self):
+        """Run the callbacks of finished jobs that are still current (on the UI thread); returns how many ran"""
+        ran = 0
+        while True:
+            try:
+                generation, key, callback = self.results.get_nowait()
+            except queue.Empty:
+                return ran
+            if generation is not None:
+                pending = self._pending.get(key)
+                if pending is not None and pending[0] == generation:
+                    del self._pending[key]
+                if generation != self.generation:
+                    self.dropped += 1
+                    continue
+            if callback is not None:
+                callback()
+                ran += 1
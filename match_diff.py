@@ -0,0 +1,120 @@
+INNINGS_SUMMARY_FIELDS = ("innings_id", "team_id", "team", "balls", "runs", "wickets")
+
+
+class MatchChanges:
+    """Change set between two processed match snapshots"""
+
+    def __init__(self, full=False):
+        self.full = full          # No previous snapshot (or a different match) - everything changed
+        self.header = False       # Anything in the match header
+        self.teams = False        # The list of teams
+        self.structure = False    # Number of innings
+        self.progress = False     # New overs in the delivery timeline (set by the dashboard)
+        self.innings = set()      # Innings whose totals changed
+        self.batsmen = {}         # Innings index -> names of batsmen added, changed or removed
+        self.bowlers = {}         # Innings index -> names of bowlers added, changed or removed
+
+    def __bool__(self):
+        return bool(self.full or self.header or self.teams or self.structure or self.progress
+                    or self.innings or self.batsmen or self.bowlers)
+
+    def __repr__(self):
+        if self.full:
+            return "MatchChanges(full=True)"
+        return (f"MatchChanges(header={self.header}, teams={self.teams}, structure={self.structure}, "
+                f"progress={self.progress}, innings={sorted(self.innings)}, "
+                f"batsmen={self.batsmen}, bowlers={self.bowlers})")
+
+    def merge(self, other):
+        """Fold a later change set into this one"""
+        self.full = self.full or other.full
+        self.header = self.header or other.header
+        self.teams = self.teams or other.teams
+        self.structure = self.structure or other.structure
+        self.progress = self.progress or other.progress
+        self.innings |= other.innings
+        for idx, names in other.batsmen.items():
+            self.batsmen.setdefault(idx, set()).update(names)
+        for idx, names in other.bowlers.items():
+            self.bowlers.setdefault(idx, set()).update(names)
+        return self
+
+    def batting_changed(self, innings_idx):
+        """Whether the batting card of an innings needs redrawing"""
+        return self.full or self.structure or innings_idx in self.batsmen
+
+    def bowling_changed(self, innings_idx):
+        """Whether the bowling card of an innings needs redrawing"""
+        return self.full or self.structure or innings_idx in self.bowlers
+
+    def scorecard_changed(self):
+        """Whether any team total, batsman or bowler changed"""
+        return bool(self.full or self.header or self.structure or self.innings or self.batsmen or self.bowlers)
+
+
+def _diff_players(old_players, new_players):
+    """Names of players that were added, removed, changed or moved in the order"""
+    old_index = {player.name: (i, player) for i, player in enumerate(old_players)}
+    changed = set()
+    for i, player in enumerate(new_players):
+        previous = old_index.pop(player.name, None)
+        if previous is None or previous != (i, player):
+            changed.add(player.name)
+    # Whatever is left no longer appears in the new card
+    changed.update(old_index)
+    return changed
+
+
+def diff_match_data(old, new):
+    """Compare two processed snapshots and return a MatchChanges"""
+    if old is None or old.header.match_id != new.header.match_id:
+        return MatchChanges(full=True)
+
+    changes = MatchChanges()
+    changes.header = old.header != new.header
+    changes.teams = old.header.teams != new.header.teams
+
+    old_innings = old.innings
+    new_innings = new.innings
+    changes.structure = len(old_innings) != len(new_innings)
+
+    for idx in range(max(len(old_innings), len(new_innings))):
+        old_inning = old_innings[idx] if idx < len(old_innings) else None
+        new_inning = new_innings[idx] if idx < len(new_innings) else None
+
+        if any(getattr(old_inning, field, None) != getattr(new_inning, field, None)
+               for field in INNINGS_SUMMARY_FIELDS):
+            changes.innings.add(idx)
+
+        batsmen = _diff_players(getattr(old_inning, "batsmen", ()), getattr(new_inning, "batsmen", ()))
+        if batsmen:
+            changes.batsmen[idx] = batsmen
+
+        bowlers = _diff_players(getattr(old_inning, "bowlers", ()), getattr(new_inning, "bowlers", ()))
+        if bowlers:
+            changes.bowlers[idx] = bowlers
+
+    return changes
+
+
+def diff_match_list(current, new):
+    """Key a refreshed selection-screen match list by match ID against the list shown
+
+    Returns the new list with the current dict kept for every match that hasn't changed
+    (so its card isn't refilled), and the IDs of the matches added, updated and removed.
+    """
+    current_by_id = {match["id"]: match for match in current or ()}
+    merged = []
+    added = set()
+    updated = set()
+    for match in new:
+        previous = current_by_id.pop(match["id"], None)
+        if previous is None:
+            added.add(match["id"])
+        elif previous == match:
+            match = previous
+        else:
+            updated.add(match["id"])
+        merged.append(match)
+    # Whatever is left has dropped off the list
+    return merged, added, updated, set(current_by_id)
@@ -0,0 +1,75 @@
+import re
+from bisect import bisect_left
+
+# Match fields that are searched, with the weight of a hit in each
+SEARCH_FIELDS = {
+    "team1": 3,
+    "team2": 3,
+    "series": 2,
+    "format": 2,
+    "venue": 1,
+    "city": 1,
+    "description": 1,
+    "type": 1
+}
+
+# A query term that is a whole word scores this many times more than one that only starts a word
+EXACT_BONUS = 2
+
+WORD = re.compile(r"\w+")
+
+
+def words(text):
+    """Lower-case words in a field or query"""
+    return WORD.findall(str(text).lower())
+
+
+class MatchIndex:
+    """Inverted index over the words of a parsed match list, searched by word prefix
+
+    Each word maps to the matches it appears in, weighted by the best field it appears
+    in, and the sorted word list finds every word a query term starts by bisection - so
+    "ind" finds India and Indore without scanning the matches.
+    """
+
+    def __init__(self, matches):
+        self.postings = {}  # Word -> {match ID: field weight}
+        for match in matches:
+            for field, weight in SEARCH_FIELDS.items():
+                for word in words(match.get(field, "")):
+                    hits = self.postings.setdefault(word, {})
+                    hits[match["id"]] = max(weight, hits.get(match["id"], 0))
+        self.words = sorted(self.postings)
+
+    def _words_starting(self, term):
+        i = bisect_left(self.words, term)
+        while i < len(self.words) and self.words[i].startswith(term):
+            yield self.words[i]
+            i += 1
+
+    def search(self, query):
+        """Match ID -> score for the matches with a word starting with every query term (None for no terms)"""
+        scores = None
+        for term in words(query):
+            term_scores = {}
+            for word in self._words_starting(term):
+                bonus = EXACT_BONUS if word == term else 1
+                for match_id, weight in self.postings[word].items():
+                    term_scores[match_id] = max(term_scores.get(match_id, 0), weight * bonus)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {match_id: scores[match_id] + score for match_id, score in term_scores.items()
+                          if match_id in scores}
+            if not scores:
+                return {}
+        return scores
+
+    def filter(self, matches, query):
+        """The matches that answer a query, best first (list order breaks ties); all of them for an empty query"""
+        scores = self.search(query)
+        if scores is None:
+            return matches
+        found = [match for match in matches if match["id"] in scores]
+        found.sort(key=lambda match: -scores[match["id"]])
+        return found
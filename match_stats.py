@@ -0,0 +1,253 @@
+from collections import OrderedDict
+
+from scorecard import balls_to_overs
+
+
+def rank(values, descending=True):
+    """Positions that sort a column, keeping the original order for ties"""
+    return sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+
+
+class column:
+    """A per-player column worked out on first read, then stored on the instance
+
+    Like functools.cached_property, without the lock it takes around every build (which
+    costs more than building most of these lists).
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.build(instance)
+        return value
+
+
+class InningsStats:
+    """Derived batting and bowling figures for one innings, one list per field
+
+    The innings totals are added up when the stats are built. The per-player columns
+    are plain lists worked out from the cards the first time something reads them, so
+    a refresh only pays for the tabs it draws. NumPy columns were tried here, but at
+    about 11 rows a side its per-call overhead made each refresh twice as slow as the
+    inline code it replaced (see python benchmark.py stats).
+    """
+
+    def __init__(self, inning):
+        self.inning = inning
+        self.team = inning.team
+        self.runs = inning.runs
+        self.wickets = inning.wickets
+        self.overs = inning.overs
+        self.run_rate = round(6 * self.runs / inning.balls, 2) if inning.balls else 0
+
+        # Batting totals
+        self.batting_runs = self.balls_faced = self.fours = self.sixes = 0
+        for batsman in inning.batsmen:
+            self.batting_runs += batsman.runs
+            self.balls_faced += batsman.balls
+            self.fours += batsman.fours
+            self.sixes += batsman.sixes
+        self.boundaries = self.fours + self.sixes
+        self.boundary_runs = self.fours * 4 + self.sixes * 6
+        self.non_boundary_runs = self.batting_runs - self.boundary_runs
+        self.strike_rate = round(100 * self.runs / self.balls_faced, 2) if self.balls_faced else 0
+
+        # Bowling totals, and runs conceded per over by the side bowling in this innings
+        self.bowler_balls = self.wickets_taken = 0
+        for bowler in inning.bowlers:
+            self.bowler_balls += bowler.balls
+            self.wickets_taken += bowler.wickets
+        self.economy = round(6 * self.runs / self.bowler_balls, 2) if self.bowler_balls else 0
+
+    # Batting columns, one row per batsman in batting order (names are already interned by
+    # process_api_data)
+
+    @column
+    def batsman_names(self):
+        return [batsman.name for batsman in self.inning.batsmen]
+
+    @column
+    def bat_runs(self):
+        return [batsman.runs for batsman in self.inning.batsmen]
+
+    @column
+    def bat_balls(self):
+        return [batsman.balls for batsman in self.inning.batsmen]
+
+    @column
+    def bat_fours(self):
+        return [batsman.fours for batsman in self.inning.batsmen]
+
+    @column
+    def bat_sixes(self):
+        return [batsman.sixes for batsman in self.inning.batsmen]
+
+    @column
+    def bat_boundary_runs(self):
+        return [batsman.fours * 4 + batsman.sixes * 6 for batsman in self.inning.batsmen]
+
+    @column
+    def strike_rates(self):
+        return [round(100 * batsman.runs / batsman.balls, 1) if batsman.balls else 0.0
+                for batsman in self.inning.batsmen]
+
+    @column
+    def boundary_pcts(self):
+        return [round(100 * boundary_runs / runs, 1) if runs else 0.0
+                for boundary_runs, runs in zip(self.bat_boundary_runs, self.bat_runs)]
+
+    @column
+    def batting_columns(self):
+        """Columns the batting analysis chart can show"""
+        return {
+            "runs": self.bat_runs,
+            "balls": self.bat_balls,
+            "strike_rate": self.strike_rates,
+            "boundary_pct": self.boundary_pcts
+        }
+
+    # Bowling columns, one row per bowler
+
+    @column
+    def bowler_names(self):
+        return [bowler.name for bowler in self.inning.bowlers]
+
+    @column
+    def bowl_balls(self):
+        return [bowler.balls for bowler in self.inning.bowlers]
+
+    @column
+    def bowl_overs(self):
+        """Overs per bowler in cricket notation"""
+        return [balls_to_overs(bowler.balls) for bowler in self.inning.bowlers]
+
+    @column
+    def bowl_maidens(self):
+        return [bowler.maidens for bowler in self.inning.bowlers]
+
+    @column
+    def bowl_runs(self):
+        return [bowler.runs for bowler in self.inning.bowlers]
+
+    @column
+    def bowl_wickets(self):
+        return [bowler.wickets for bowler in self.inning.bowlers]
+
+    @column
+    def economies(self):
+        return [round(6 * bowler.runs / bowler.balls, 2) if bowler.balls else 0.0
+                for bowler in self.inning.bowlers]
+
+    # Position of each player's first entry, for lookups by name
+
+    @column
+    def _batsman_index(self):
+        index = {}
+        for i, batsman in enumerate(self.inning.batsmen):
+            index.setdefault(batsman.name, i)
+        return index
+
+    @column
+    def _bowler_index(self):
+        index = {}
+        for i, bowler in enumerate(self.inning.bowlers):
+            index.setdefault(bowler.name, i)
+        return index
+
+    @column
+    def batsmen(self):
+        """Batting card as a list of dicts"""
+        return [self._batsman_dict(i) for i in range(len(self.inning.batsmen))]
+
+    @column
+    def bowlers(self):
+        """Bowling card as a list of dicts"""
+        return [self._bowler_dict(i) for i in range(len(self.inning.bowlers))]
+
+    def batsman(self, name):
+        """Batting figures of a player as a dict, or None if they didn't bat"""
+        i = self._batsman_index.get(name)
+        return None if i is None else self._batsman_dict(i)
+
+    def bowler(self, name):
+        """Bowling figures of a player as a dict, or None if they didn't bowl"""
+        i = self._bowler_index.get(name)
+        return None if i is None else self._bowler_dict(i)
+
+    def _batsman_dict(self, i):
+        # Straight from the card line, so looking up one player doesn't build every column
+        batsman = self.inning.batsmen[i]
+        runs, balls = batsman.runs, batsman.balls
+        boundary_runs = batsman.fours * 4 + batsman.sixes * 6
+        return {"name": batsman.name, "runs": runs, "balls": balls, "fours": batsman.fours, "sixes": batsman.sixes,
+                "strike_rate": round(100 * runs / balls, 1) if balls else 0.0, "boundary_runs": boundary_runs,
+                "boundary_pct": round(100 * boundary_runs / runs, 1) if runs else 0.0}
+
+    def _bowler_dict(self, i):
+        bowler = self.inning.bowlers[i]
+        runs, balls = bowler.runs, bowler.balls
+        return {"name": bowler.name, "overs": bowler.overs, "maidens": bowler.maidens, "runs": runs,
+                "wickets": bowler.wickets, "economy": round(6 * runs / balls, 2) if balls else 0.0}
+
+
+class MatchStats:
+    """Every metric the dashboard derives from one processed snapshot, computed once"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.innings = [InningsStats(inning) for inning in snapshot.innings]
+
+        # Run distribution across the whole match (extras estimated as 5% of each total)
+        self.boundary_runs = sum(innings.boundary_runs for innings in self.innings)
+        self.non_boundary_runs = sum(innings.non_boundary_runs for innings in self.innings)
+        self.extras = sum(round(innings.runs * 0.05) for innings in self.innings)
+
+        self.radar = [self._radar(0), self._radar(1)] if len(self.innings) >= 2 else None
+
+    def _radar(self, team_idx):
+        """Team performance normalised to 0-1 for the radar chart"""
+        batting = self.innings[team_idx]
+        bowling = self.innings[1 - team_idx]  # The other side's innings is when this team bowled
+        top_score = max(self.innings[0].runs, self.innings[1].runs)
+        metrics = [
+            batting.runs / top_score if top_score else 0,
+            batting.run_rate / 10,  # Normalize run rate (assume max 10)
+            batting.strike_rate / 150,  # Normalize SR (assume max 150)
+            batting.boundaries / 30,  # Normalize boundaries (assume max 30)
+            1 - bowling.economy / 10,  # Lower economy is better
+            bowling.wickets_taken / 10  # Normalize wickets (assume max 10)
+        ]
+        return [max(0, min(1, m)) for m in metrics]
+
+    def players(self, team_idx):
+        """Names of everyone who batted or bowled for a team, sorted"""
+        players = set(self.innings[team_idx]._batsman_index)
+        players.update(self.innings[1 - team_idx]._bowler_index)
+        return sorted(players)
+
+
+# Stats for the most recent snapshots. Keyed by id(), and holding the snapshot so the id
+# can't be reused while the entry exists
+_recent_stats = OrderedDict()
+RECENT_STATS_SIZE = 4
+
+
+def stats_for(snapshot):
+    """MatchStats for a processed snapshot, derived at most once per snapshot"""
+    entry = _recent_stats.get(id(snapshot))
+    if entry is not None and entry.snapshot is snapshot:
+        _recent_stats.move_to_end(id(snapshot))
+        return entry
+
+    stats = MatchStats(snapshot)
+    _recent_stats[id(snapshot)] = stats
+    while len(_recent_stats) > RECENT_STATS_SIZE:
+        _recent_stats.popitem(last=False)
+    return stats
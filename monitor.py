@@ -0,0 +1,136 @@
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def live_match_ids(payload):
+    """IDs of the in-progress matches in a live match list response"""
+    match_ids = []
+    for match_type in payload.get("typeMatches", []):
+        for series in match_type.get("seriesMatches", []):
+            for match in series.get("seriesAdWrapper", {}).get("matches", []):
+                info = match.get("matchInfo", {})
+                if info.get("state") == "In Progress" and info.get("matchId"):
+                    match_ids.append(str(info["matchId"]))
+    return match_ids
+
+
+class PollResult:
+    """Outcome of one scheduled scorecard poll"""
+
+    def __init__(self, match_id, match=None, unchanged=False, error=None):
+        self.match_id = match_id
+        self.match = match          # Processed snapshot, when the scorecard changed
+        self.unchanged = unchanged  # 304 or identical body
+        self.error = error          # Message, when the poll failed
+
+
+class PollScheduler:
+    """Polls the scorecards of many matches through one bounded worker pool and a shared budget
+
+    tick() is meant to be called from the UI thread: it submits the matches that are
+    due and returns the results that arrived since the previous tick, so widgets are
+    only ever touched on that thread.
+    """
+
+    def __init__(self, api, process, interval=60, max_workers=4, cache=None, clock=time.monotonic):
+        self.api = api
+        self.process = process  # api_data -> processed snapshot, run on the worker
+        self.interval = interval
+        self.max_workers = max_workers
+        self.cache = cache      # Optional ResponseCache the raw responses are saved to
+        self.clock = clock
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="monitor")
+        self.results = queue.Queue()
+
+        self._due = {}           # Match ID -> clock time of its next poll
+        self._in_flight = set()
+        self._paused = set()     # Matches polled elsewhere for now (e.g. an open drill-down window)
+        self._have_data = set()  # Matches with a snapshot, which can be polled conditionally
+
+        # Validators of this scheduler's own responses. Drill-down windows poll the same matches
+        # through the same client, and a 304 to them must not leave a tile here stale
+        self.validators = {}
+
+    @property
+    def match_ids(self):
+        return list(self._due)
+
+    def follow(self, match_id):
+        """Start polling a match, beginning with the next tick"""
+        self._due.setdefault(match_id, self.clock())
+
+    def unfollow(self, match_id):
+        self._due.pop(match_id, None)
+        self._paused.discard(match_id)
+        self._have_data.discard(match_id)
+
+    def pause(self, match_id):
+        self._paused.add(match_id)
+
+    def resume(self, match_id):
+        self._paused.discard(match_id)
+
+    def poll_interval(self):
+        """Seconds between polls of each match
+
+        At least the configured interval, stretched as the daily budget runs low, and
+        never more requests per minute across all matches than the minute budget refills.
+        """
+        interval = self.api.budget.stretch_interval(self.interval)
+        return max(interval, len(self._due) / self.api.budget.minute.rate)
+
+    def tick(self):
+        """Submit due polls and return the PollResults that have arrived since the last tick"""
+        results = []
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight.discard(result.match_id)
+            if result.match is not None:
+                self._have_data.add(result.match_id)
+            if result.match_id in self._due:
+                results.append(result)
+
+        # Longest-waiting matches first, as long as there are free workers and budget
+        now = self.clock()
+        interval = self.poll_interval()
+        for match_id, due in sorted(self._due.items(), key=lambda item: item[1]):
+            if due > now or len(self._in_flight) >= self.max_workers:
+                break
+            if match_id in self._in_flight or match_id in self._paused:
+                continue
+            if self.api.budget.wait_time() > 0:
+                break
+            self._in_flight.add(match_id)
+            self._due[match_id] = now + interval
+            self.pool.submit(self._poll, match_id, match_id in self._have_data)
+        return results
+
+    def _poll(self, match_id, conditional):
+        """Fetch and process one scorecard (runs on a worker)"""
+        try:
+            response = self.api.scorecard(match_id, conditional=conditional, validators=self.validators)
+            if response.unchanged:
+                result = PollResult(match_id, unchanged=True)
+            elif response.status_code != 200:
+                result = PollResult(match_id, error=f"API error: {response.status_code}")
+            else:
+                api_data = response.json()
+                result = PollResult(match_id, match=self.process(api_data))
+                if self.cache is not None:
+                    self.cache.put("hscard", match_id, api_data)
+        except (requests.RequestException, ValueError) as e:
+            result = PollResult(match_id, error=str(e))
+        except Exception as e:
+            # A malformed scorecard must not take the worker's result with it
+            result = PollResult(match_id, error=f"Failed to process scorecard: {str(e)}")
+        self.results.put(result)
+
+    def close(self):
+        """Stop the workers (polls already running finish in the background)"""
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,110 @@
+import os
+import time
+
+from rate_limiter import LOW_BUDGET_FRACTION, TokenBucket
+
+# How many of the top live matches on the selection screen are prefetched, and how many
+# requests an hour prefetching may spend (override with environment variables)
+PREFETCH_MATCHES = int(os.environ.get("CRICKET_DASHBOARD_PREFETCH_MATCHES", 3))
+PREFETCH_PER_HOUR = int(os.environ.get("CRICKET_DASHBOARD_PREFETCH_PER_HOUR", 30))
+
+# Seconds a prefetched scorecard is good for; watched matches are fetched again as they expire
+PREFETCH_TTL = 180
+
+
+class ScorecardPrefetcher:
+    """Fetches the scorecards of the top live matches in the background, so opening one renders at once
+
+    fetch(match_id) runs on a worker through the FetchExecutor and returns the processed
+    scorecard (or None). Results are kept for ttl seconds and taken by the dashboard
+    when the match is opened. Prefetching is speculative, so it has its own quota of
+    per_hour requests on top of the shared budget, and stops altogether once the daily
+    budget is running low - the polls of the match actually open come first.
+    """
+
+    def __init__(self, after, cancel, fetcher, fetch, budget, matches=PREFETCH_MATCHES,
+                 per_hour=PREFETCH_PER_HOUR, ttl=PREFETCH_TTL, clock=time.monotonic):
+        self._after = after    # root.after
+        self._cancel = cancel  # root.after_cancel
+        self.fetcher = fetcher
+        self.fetch = fetch
+        self.budget = budget
+        self.matches = matches
+        self.ttl = ttl
+        self.clock = clock
+        self.quota = TokenBucket(per_hour, 60 * 60, clock) if per_hour > 0 else None
+
+        self.entries = {}      # Match ID -> (processed scorecard, fetched at)
+        self.match_ids = []    # Matches being kept warm, best first
+        self._job = None
+
+        # Counters
+        self.requests = 0
+        self.hits = 0
+        self.skipped = 0       # Prefetches held back by the quota or a low budget
+
+    def watch(self, match_ids):
+        """Keep the first matches of a list prefetched, starting now, until stop()"""
+        self.match_ids = [str(match_id) for match_id in match_ids][:self.matches]
+        self.stop()
+        self._run()
+
+    def stop(self):
+        """Stop prefetching (entries already fetched are kept until they expire)"""
+        if self._job is not None:
+            self._cancel(self._job)
+            self._job = None
+
+    def take(self, match_id):
+        """(processed scorecard, age in seconds) for a match prefetched within the TTL, or None"""
+        entry = self.entries.pop(str(match_id), None)
+        if entry is None:
+            return None
+        age = self.clock() - entry[1]
+        if age >= self.ttl:
+            return None
+        self.hits += 1
+        return entry[0], age
+
+    def _run(self):
+        self._job = None
+        now = self.clock()
+        self.entries = {match_id: entry for match_id, entry in self.entries.items() if now - entry[1] < self.ttl}
+
+        for match_id in self.match_ids:
+            if match_id in self.entries or self.fetcher.busy(("prefetch", match_id)):
+                continue
+            if not self._allowed():
+                self.skipped += 1
+                break
+            self.fetcher.submit(("prefetch", match_id), self._prefetch, match_id)
+            self.requests += 1
+
+        # Come back when the oldest entry expires, or after a TTL if nothing was fetched
+        due = min((entry[1] + self.ttl for entry in self.entries.values()), default=now + self.ttl)
+        if self.match_ids:
+            self._job = self._after(max(1000, int((due - now) * 1000)), self._run)
+
+    def _allowed(self):
+        """Whether prefetching may spend a request now"""
+        if self.quota is None:
+            return False
+        if self.budget.remaining() < self.budget.day.capacity * LOW_BUDGET_FRACTION:
+            return False
+        return self.quota.take()
+
+    def _prefetch(self, match_id):
+        """Fetch one scorecard (runs on a worker); returns the UI callback that stores it"""
+        try:
+            data = self.fetch(match_id)
+        except Exception as e:
+            # A failed prefetch only means the match opens the slow way
+            print(f"Prefetch of match {match_id} failed: {str(e)}")
+            return None
+        if data is None:
+            return None
+        fetched = self.clock()
+        return lambda: self._store(match_id, data, fetched)
+
+    def _store(self, match_id, data, fetched):
+        self.entries[match_id] = (data, fetched)
@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+
+import requests
+
+# Client-side request budget for the RapidAPI plan (override with environment variables)
+PER_MINUTE = int(os.environ.get("RAPIDAPI_PER_MINUTE", 30))
+PER_DAY = int(os.environ.get("RAPIDAPI_PER_DAY", 500))
+
+# Polling starts to slow down once less than this share of the daily budget is left
+LOW_BUDGET_FRACTION = 0.5
+
+
+class QuotaExhausted(requests.RequestException):
+    """Raised instead of sending a request that the budget does not allow"""
+
+
+class TokenBucket:
+    """Classic token bucket: holds up to capacity tokens, refilled evenly over period seconds"""
+
+    def __init__(self, capacity, period, clock=time.monotonic):
+        self.capacity = capacity
+        self.rate = capacity / period  # Tokens per second
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self):
+        """Whole tokens currently in the bucket"""
+        self._refill()
+        return int(self.tokens)
+
+    def wait_time(self):
+        """Seconds until one token is available"""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def take(self):
+        """Remove one token, returning False if the bucket is empty"""
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def limit(self, tokens):
+        """Cap the bucket at a count reported by the server"""
+        self._refill()
+        self.tokens = min(self.tokens, float(tokens))
+
+
+class RequestBudget:
+    """Per-minute and per-day token buckets shared by every API call"""
+
+    def __init__(self, per_minute=PER_MINUTE, per_day=PER_DAY, clock=time.monotonic):
+        self.minute = TokenBucket(per_minute, 60, clock)
+        self.day = TokenBucket(per_day, 24 * 60 * 60, clock)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Spend one request from both budgets or raise QuotaExhausted"""
+        with self._lock:
+            if self.day.available() < 1:
+                raise QuotaExhausted(f"Daily API budget used up, next request in {self.day.wait_time():.0f}s")
+            if not self.minute.take():
+                raise QuotaExhausted(f"Per-minute API budget used up, next request in {self.minute.wait_time():.0f}s")
+            self.day.take()
+
+    def remaining(self):
+        """Requests left in the daily budget"""
+        with self._lock:
+            return self.day.available()
+
+    def wait_time(self):
+        """Seconds until both budgets allow another request"""
+        with self._lock:
+            return max(self.minute.wait_time(), self.day.wait_time())
+
+    def sync(self, response):
+        """Trust the quota headers RapidAPI sends back, and back off after a 429"""
+        remaining = response.headers.get("X-RateLimit-Requests-Remaining")
+        with self._lock:
+            if remaining is not None and remaining.isdigit():
+                self.day.limit(int(remaining))
+            if response.status_code == 429:
+                self.minute.limit(0)
+
+    def stretch_interval(self, interval, max_interval=900):
+        """Lengthen a polling interval as the daily budget runs low (intervals past max_interval are kept)"""
+        with self._lock:
+            fraction = self.day.available() / self.day.capacity
+            wait = max(self.minute.wait_time(), self.day.wait_time())
+        if fraction < LOW_BUDGET_FRACTION:
+            interval = max(interval, min(max_interval, interval * LOW_BUDGET_FRACTION / max(fraction, 0.01)))
+        return max(interval, wait)
@@ -0,0 +1,115 @@
+import re
+
+# Match states recognised in the scorecard's status text, checked in this order. A match is only
+# complete on result phrasing - "India won the toss and opted to bat" is a live match
+STATE_PATTERNS = [
+    ("complete", re.compile(r"\bwon by\b|won the super over|match drawn|match tied|no result|abandoned")),
+    ("rain", re.compile(r"\brain\b|wet outfield|bad light|\bdelayed\b")),
+    ("stumps", re.compile(r"\bstumps\b")),
+    ("break", re.compile(r"\blunch\b|\btea\b|\bdinner\b")),
+    ("innings_break", re.compile(r"innings break"))
+]
+
+# Polling interval while play is stopped, as a multiple of the configured interval (with the
+# default 60s: 3 minutes at an innings break, 30 at stumps). Live matches use the configured
+# interval, and complete matches aren't polled at all. Being relative, a short --refresh or a
+# sped-up replay slows down at a break in proportion
+STATE_INTERVALS = {
+    "innings_break": 3,
+    "break": 5,
+    "rain": 5,
+    "stumps": 30
+}
+
+# During play, each poll that finds nothing new stretches the interval by this factor, up to QUIET_MAX_FACTOR
+QUIET_GROWTH = 1.5
+QUIET_MAX_FACTOR = 4
+
+# Longest wait after failed polls, as a multiple of the configured interval (the interval
+# doubles with each failure)
+MAX_BACKOFF = 5
+
+
+def match_state(status):
+    """Match state for a scorecard status such as "Stumps - Day 2" or "India won by 5 wickets" """
+    status = (status or "").lower()
+    for state, pattern in STATE_PATTERNS:
+        if pattern.search(status):
+            return state
+    return "live"
+
+
+class RefreshTimer:
+    """The dashboard's single auto-refresh timer
+
+    Every way of arming it - starting, a poll's result coming back, a manual refresh -
+    cancels the pending timer first, so at most one poll is ever scheduled. The next
+    poll is armed when the previous one reports back through record(), which is also
+    when the interval adapts to the match state, quiet polls and failures.
+    """
+
+    def __init__(self, after, cancel, poll, interval=60, budget=None):
+        self._after = after    # root.after
+        self._cancel = cancel  # root.after_cancel
+        self.poll = poll
+        self.base_interval = interval
+        self.budget = budget   # Optional RequestBudget that stretches the interval as it runs low
+
+        self.enabled = False
+        self.state = "live"
+        self.quiet_polls = 0   # Polls in a row that found nothing new
+        self.failures = 0      # Polls in a row that failed
+        self._job = None
+
+    @property
+    def pending(self):
+        """Whether a poll is scheduled"""
+        return self._job is not None
+
+    def interval(self):
+        """Seconds until the next poll, or None while the match is complete"""
+        if self.state == "complete":
+            return None
+        interval = self.base_interval * STATE_INTERVALS.get(self.state, 1)
+        if self.failures:
+            interval = max(interval, self.base_interval * min(2 ** self.failures, MAX_BACKOFF))
+        elif self.state == "live":
+            interval *= min(QUIET_MAX_FACTOR, QUIET_GROWTH ** self.quiet_polls)
+        if self.budget is not None:
+            interval = self.budget.stretch_interval(interval)
+        return interval
+
+    def start(self):
+        self.enabled = True
+        self.schedule()
+
+    def stop(self):
+        self.enabled = False
+        self._disarm()
+
+    def schedule(self):
+        """(Re)arm the timer for one poll after the current interval"""
+        self._disarm()
+        interval = self.interval()
+        if self.enabled and interval is not None:
+            self._job = self._after(int(interval * 1000), self._fire)
+
+    def record(self, changed=False, failed=False, state=None):
+        """Take in a poll's outcome and arm the next poll"""
+        if state is not None:
+            self.state = state
+        self.failures = self.failures + 1 if failed else 0
+        if changed:
+            self.quiet_polls = 0
+        elif not failed:
+            self.quiet_polls += 1
+        self.schedule()
+
+    def _disarm(self):
+        if self._job is not None:
+            self._cancel(self._job)
+            self._job = None
+
+    def _fire(self):
+        self._job = None
+        self.poll()
@@ -0,0 +1,99 @@
+import statistics
+import time
+from collections import deque
+
+
+class RenderScheduler:
+    """Batches UI updates into frames, at most fps of them a second
+
+    invalidate(key, update) queues update for the next frame. Invalidating a key that
+    is already queued replaces its update and moves it to the back of the frame, so a
+    widget or chart invalidated several times between frames is redrawn once, after
+    anything it was invalidated after. A frame is only scheduled while updates are
+    waiting, and never sooner than one frame period after the previous one.
+    """
+
+    def __init__(self, after, cancel, fps=30, clock=time.perf_counter, history=300):
+        self._after = after    # root.after
+        self._cancel = cancel  # root.after_cancel
+        self.period = 1 / fps
+        self.clock = clock
+
+        self._pending = {}     # Key -> update, in the order they run
+        self._job = None
+        self._timers = set()   # Pending invalidate_after jobs
+        self._last_frame = None
+
+        # Counters and the durations of the latest frames (ms)
+        self.frames = 0
+        self.updates = 0
+        self.collapsed = 0     # Invalidations folded into one already queued
+        self.frame_times = deque(maxlen=history)
+
+    def invalidate(self, key, update):
+        """Run update in the next frame, replacing any update already queued under key"""
+        if self._pending.pop(key, None) is not None:
+            self.collapsed += 1
+        self._pending[key] = update
+        if self._job is None:
+            wait = 0 if self._last_frame is None else self._last_frame + self.period - self.clock()
+            self._job = self._after(max(0, int(wait * 1000)), self._frame)
+
+    def invalidate_after(self, ms, key, update):
+        """Invalidate key once ms have passed (for blinks and other timed changes); returns the job"""
+        def due():
+            self._timers.discard(job)
+            self.invalidate(key, update)
+
+        job = self._after(ms, due)
+        self._timers.add(job)
+        return job
+
+    def cancel(self, job):
+        """Cancel a job returned by invalidate_after"""
+        self._timers.discard(job)
+        self._cancel(job)
+
+    def discard(self, key):
+        """Drop a queued update"""
+        self._pending.pop(key, None)
+
+    def flush(self):
+        """Run the queued updates now instead of in the next frame"""
+        if self._job is not None:
+            self._cancel(self._job)
+            self._frame()
+
+    def close(self):
+        """Drop every queued update, and cancel the next frame and every invalidate_after job"""
+        self._pending.clear()
+        if self._job is not None:
+            self._cancel(self._job)
+            self._job = None
+        for job in self._timers:
+            self._cancel(job)
+        self._timers.clear()
+
+    def _frame(self):
+        self._job = None
+        start = self._last_frame = self.clock()
+        pending, self._pending = self._pending, {}
+        for key, update in pending.items():
+            try:
+                update()
+            except Exception as e:
+                # One broken update must not hold back the rest of the frame
+                print(f"UI update {key!r} failed: {str(e)}")
+
+        self.frames += 1
+        self.updates += len(pending)
+        self.frame_times.append((self.clock() - start) * 1000)
+
+    def stats(self):
+        """Frame counters and the median, p95 and max duration (ms) of the latest frames"""
+        times = sorted(self.frame_times)
+        stats = {"frames": self.frames, "updates": self.updates, "collapsed": self.collapsed}
+        if times:
+            stats.update(median_ms=statistics.median(times), p95_ms=times[int(0.95 * (len(times) - 1))],
+                         max_ms=times[-1])
+        return stats
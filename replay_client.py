@@ -0,0 +1,140 @@
+import json
+import os
+import time
+
+from rate_limiter import RequestBudget
+
+# Recordings are laid out as <directory>/<endpoint>/<key>/<offset>.json, where key is the
+# match ID for scorecards or "all" for the match lists, and offset is the number of seconds
+# after the start of the recording at which the snapshot was taken.
+LIST_KEY = "all"
+
+
+class ReplayResponse:
+    """Just enough of requests.Response for the dashboard's fetch code"""
+
+    def __init__(self, status_code, content=b"", unchanged=False):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+        self.unchanged = unchanged
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ReplayClient:
+    """Drop-in replacement for CricbuzzClient that serves recorded responses from a directory
+
+    Each endpoint returns the latest snapshot whose offset has been reached, so a
+    recording plays back like a live match. speed=60 plays a minute of recording
+    every second.
+    """
+
+    def __init__(self, directory, speed=1.0, clock=time.monotonic):
+        self.directory = directory
+        self.speed = speed
+        self.clock = clock
+        self.started = clock()
+
+        # Replays cost nothing, so the budget never runs out
+        self.budget = RequestBudget(per_minute=10 ** 6, per_day=10 ** 6)
+
+        self._timelines = {}  # (endpoint, key) -> sorted [(offset, path)]
+        self._served = {}     # (endpoint, key) -> path of the snapshot served last, for callers without their own
+
+    def elapsed(self):
+        """Seconds of the recording played so far"""
+        return (self.clock() - self.started) * self.speed
+
+    def duration(self):
+        """Offset of the last snapshot across all recorded endpoints"""
+        last = 0.0
+        for endpoint in os.listdir(self.directory):
+            endpoint_dir = os.path.join(self.directory, endpoint)
+            if os.path.isdir(endpoint_dir):
+                for key in os.listdir(endpoint_dir):
+                    timeline = self._timeline(endpoint, key)
+                    if timeline:
+                        last = max(last, timeline[-1][0])
+        return last
+
+    def _timeline(self, endpoint, key):
+        """Snapshots recorded for an endpoint and key, oldest first"""
+        timeline = self._timelines.get((endpoint, key))
+        if timeline is None:
+            key_dir = os.path.join(self.directory, endpoint, str(key))
+            timeline = []
+            if os.path.isdir(key_dir):
+                for name in os.listdir(key_dir):
+                    if name.endswith(".json"):
+                        try:
+                            timeline.append((float(name[:-5]), os.path.join(key_dir, name)))
+                        except ValueError:
+                            continue
+            timeline.sort()
+            self._timelines[(endpoint, key)] = timeline
+        return timeline
+
+    def get(self, endpoint, key=LIST_KEY, conditional=False, validators=None):
+        """Serve the current snapshot for an endpoint, or a 404 if nothing was recorded
+
+        validators works as in CricbuzzClient.get: a caller's own record of what it was
+        served, so a conditional request is only "unchanged" for that caller.
+        """
+        timeline = self._timeline(endpoint, str(key))
+        if not timeline:
+            return ReplayResponse(404)
+
+        # Latest snapshot at or before the playback position (the first one before it starts)
+        elapsed = self.elapsed()
+        path = timeline[0][1]
+        for offset, snapshot_path in timeline:
+            if offset > elapsed:
+                break
+            path = snapshot_path
+
+        served = self._served if validators is None else validators
+        unchanged = conditional and served.get((endpoint, str(key))) == path
+        served[(endpoint, str(key))] = path
+        if unchanged:
+            return ReplayResponse(304, unchanged=True)
+
+        with open(path, "rb") as f:
+            return ReplayResponse(200, f.read())
+
+    def live_matches(self):
+        """Replay the list of live matches"""
+        return self.get("live")
+
+    def recent_matches(self):
+        """Replay the list of recent matches"""
+        return self.get("recent")
+
+    def scorecard(self, match_id, conditional=False, validators=None):
+        """Replay the scorecard for a match"""
+        return self.get("hscard", match_id, conditional=conditional, validators=validators)
+
+    def commentary(self, match_id, conditional=False, validators=None):
+        """Replay the commentary for a match"""
+        return self.get("comm", match_id, conditional=conditional, validators=validators)
+
+    def close(self):
+        """Nothing to release"""
+
+
+class SnapshotRecorder:
+    """Writes API responses in the layout ReplayClient reads"""
+
+    def __init__(self, directory, clock=time.monotonic):
+        self.directory = directory
+        self.clock = clock
+        self.started = clock()
+
+    def record(self, endpoint, key, content):
+        """Save a response body as the snapshot for the current offset"""
+        key_dir = os.path.join(self.directory, endpoint, str(key))
+        os.makedirs(key_dir, exist_ok=True)
+        offset = self.clock() - self.started
+        with open(os.path.join(key_dir, f"{offset:.1f}.json"), "wb") as f:
+            f.write(content)
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "CRICKET_DASHBOARD_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "cricket-dashboard")
+)
+
+# Seconds an entry counts as fresh enough to skip the network, per endpoint.
+# Stale entries are still served as a fallback when the API is unavailable.
+DEFAULT_TTLS = {
+    "live": 60,
+    "recent": 300,
+    "hscard": 30
+}
+
+
+class ResponseCache:
+    """Disk-backed cache of API responses keyed by endpoint and match ID, with LRU eviction"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttls=None, max_bytes=50 * 1024 * 1024):
+        self.directory = directory
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = {}  # File name -> [size in bytes, last access time]
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name.endswith(".tmp"):
+                    # Left behind by a write that never finished
+                    os.remove(path)
+                elif name.endswith(".json"):
+                    stat = os.stat(path)
+                    self._index[name] = [stat.st_size, stat.st_mtime]
+        except OSError as e:
+            print(f"Response cache disabled: {str(e)}")
+            self.directory = None
+
+    def _file_name(self, endpoint, key):
+        """File name for an entry, safe on every platform"""
+        raw = f"{endpoint}-{key}"
+        return "".join(c if c.isalnum() or c in "-_" else "_" for c in raw) + ".json"
+
+    def get(self, endpoint, key):
+        """Return the cached entry (payload, stored_at, age, fresh) or None"""
+        if self.directory is None:
+            return None
+
+        name = self._file_name(endpoint, key)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if name not in self._index:
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._discard(name)
+                return None
+
+            # Record the access; the mtime keeps the LRU order across restarts
+            now = time.time()
+            self._index[name][1] = now
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+
+        entry["age"] = now - entry["stored_at"]
+        entry["fresh"] = entry["age"] < self.ttls.get(endpoint, 0)
+        return entry
+
+    def put(self, endpoint, key, payload):
+        """Store a response payload, replacing the file atomically"""
+        if self.directory is None:
+            return
+
+        name = self._file_name(endpoint, key)
+        data = json.dumps({
+            "endpoint": endpoint,
+            "key": str(key),
+            "stored_at": time.time(),
+            "payload": payload
+        }).encode("utf-8")
+
+        with self._lock:
+            # Write to a temporary file in the same directory, then rename over the old entry
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, os.path.join(self.directory, name))
+            except OSError as e:
+                print(f"Failed to cache {endpoint} response: {str(e)}")
+                try:
+                    os.remove(tmp_path)
+                except (OSError, UnboundLocalError):
+                    pass
+                return
+
+            self._index[name] = [len(data), time.time()]
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        total = sum(size for size, _ in self._index.values())
+        for name, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._discard(name)
+            total -= size
+
+    def _discard(self, name):
+        """Delete an entry from disk and from the index"""
+        self._index.pop(name, None)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
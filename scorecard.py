@@ -0,0 +1,153 @@
+import sys
+from dataclasses import dataclass
+
+
+def overs_to_balls(overs):
+    """Convert overs as the API writes them (4.2, "4.2" or "4.2*") to a count of legal balls"""
+    if isinstance(overs, str):
+        overs = overs.replace("*", "").strip()
+        whole, _, part = overs.partition(".")
+        return int(whole or 0) * 6 + int(part or 0)
+    if isinstance(overs, (int, float)):
+        whole = int(overs)
+        return whole * 6 + int(round((overs - whole) * 10))
+    return 0
+
+
+def balls_to_overs(balls):
+    """Convert a count of balls back to cricket notation, e.g. 26 -> 4.2"""
+    return balls // 6 + balls % 6 / 10
+
+
+def intern_name(value):
+    """Intern a player or team name so every snapshot shares one copy of it"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass
+class Team:
+    """A side in the match"""
+    __slots__ = ("id", "name", "short_name")
+    id: int
+    name: str
+    short_name: str
+
+    def to_dict(self):
+        return {"id": self.id, "name": self.name, "sName": self.short_name, "imgUrl": ""}
+
+
+@dataclass
+class MatchHeader:
+    """Match details that don't depend on the innings"""
+    __slots__ = ("match_id", "description", "match_type", "series_name", "series_id", "status", "match_date",
+                 "venue", "city", "country", "toss_winner", "toss_decision", "teams")
+    match_id: int
+    description: str
+    match_type: str
+    series_name: str
+    series_id: int
+    status: str
+    match_date: str
+    venue: str
+    city: str
+    country: str
+    toss_winner: str
+    toss_decision: str
+    teams: tuple
+
+    def to_dict(self):
+        return {
+            "matchId": self.match_id,
+            "matchDescription": self.description,
+            "matchFormat": self.match_type,
+            "matchType": self.match_type,
+            "complete": True,
+            "domestic": False,
+            "teams": [team.to_dict() for team in self.teams],
+            "seriesName": self.series_name,
+            "seriesId": self.series_id,
+            "status": self.status,
+            "venue": {"id": 0, "name": self.venue, "location": self.city, "country": self.country},
+            "matchDate": self.match_date,
+            "tossResults": {"tossWinnerId": 0, "tossWinnerName": self.toss_winner, "decision": self.toss_decision}
+        }
+
+
+@dataclass
+class BatterLine:
+    """One batsman's line on the batting card"""
+    __slots__ = ("name", "runs", "balls", "fours", "sixes")
+    name: str
+    runs: int
+    balls: int
+    fours: int
+    sixes: int
+
+    def to_dict(self):
+        return {"name": self.name, "runs": self.runs, "balls": self.balls, "fours": self.fours, "sixes": self.sixes}
+
+
+@dataclass
+class BowlerLine:
+    """One bowler's line on the bowling card, with overs kept as a ball count"""
+    __slots__ = ("name", "balls", "maidens", "runs", "wickets")
+    name: str
+    balls: int
+    maidens: int
+    runs: int
+    wickets: int
+
+    @property
+    def overs(self):
+        """Overs bowled in cricket notation (4.2 is four overs and two balls)"""
+        return balls_to_overs(self.balls)
+
+    def to_dict(self):
+        return {"name": self.name, "overs": self.overs, "maidens": self.maidens, "runs": self.runs,
+                "wickets": self.wickets}
+
+
+@dataclass
+class Innings:
+    """One innings: the batting side's total and both cards"""
+    __slots__ = ("innings_id", "team_id", "team", "balls", "runs", "wickets", "batsmen", "bowlers")
+    innings_id: int
+    team_id: int
+    team: str
+    balls: int
+    runs: int
+    wickets: int
+    batsmen: tuple
+    bowlers: tuple
+
+    @property
+    def overs(self):
+        """Overs faced in cricket notation"""
+        return balls_to_overs(self.balls)
+
+    def to_dict(self):
+        return {
+            "inningsId": self.innings_id,
+            "teamId": self.team_id,
+            "team": self.team,
+            "overs": self.overs,
+            "runs": self.runs,
+            "wickets": self.wickets,
+            "batsmen": [batsman.to_dict() for batsman in self.batsmen],
+            "bowlers": [bowler.to_dict() for bowler in self.bowlers]
+        }
+
+
+@dataclass
+class Match:
+    """A processed scorecard snapshot"""
+    __slots__ = ("header", "innings")
+    header: MatchHeader
+    innings: tuple
+
+    def to_dict(self):
+        """The snapshot as plain JSON-compatible dicts, in the dashboard's original export layout"""
+        return {
+            "matchHeader": self.header.to_dict(),
+            "scoreCard": [inning.to_dict() for inning in self.innings]
+        }
@@ -0,0 +1,29 @@
+import itertools
+
+
+class FakeTk:
+    """root.after and root.after_cancel on a simulated millisecond clock"""
+
+    def __init__(self):
+        self.now = 0
+        self.jobs = {}  # Job ID -> (due, callback)
+        self._ids = itertools.count()
+
+    def after(self, ms, callback):
+        job = f"after#{next(self._ids)}"
+        self.jobs[job] = (self.now + ms, callback)
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_until(self, end):
+        """Run the callbacks due up to end, in order, then move the clock to end"""
+        while self.jobs:
+            job, (due, callback) = min(self.jobs.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.jobs[job]
+            self.now = due
+            callback()
+        self.now = end
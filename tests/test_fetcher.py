@@ -0,0 +1,102 @@
+from concurrent.futures import Future
+
+from fetcher import FetchExecutor
+
+
+class ManualPool:
+    """A pool whose jobs run only when the test says so"""
+
+    def __init__(self):
+        self.jobs = []  # (future, func) in submission order
+
+    def submit(self, func):
+        future = Future()
+        self.jobs.append((future, func))
+        return future
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for future, func in jobs:
+            if future.set_running_or_notify_cancel():
+                func()
+                future.set_result(None)
+
+
+def test_results_reach_the_ui_thread_only_through_drain():
+    pool = ManualPool()
+    fetcher = FetchExecutor(pool)
+    shown = []
+    fetcher.submit("scorecard", lambda: lambda: shown.append("card"))
+    pool.run_all()
+    assert shown == []
+    assert fetcher.drain() == 1
+    assert shown == ["card"]
+    assert not fetcher.busy("scorecard")
+
+
+def test_a_key_runs_one_job_at_a_time():
+    pool = ManualPool()
+    fetcher = FetchExecutor(pool)
+    assert fetcher.submit("scorecard", lambda: None)
+    assert fetcher.busy("scorecard")
+    assert not fetcher.submit("scorecard", lambda: None)
+    assert fetcher.submit("commentary", lambda: None)
+
+    pool.run_all()
+    fetcher.drain()
+    assert fetcher.submit("scorecard", lambda: None)
+
+
+def test_new_generation_drops_results_of_running_jobs():
+    pool = ManualPool()
+    fetcher = FetchExecutor(pool)
+    shown = []
+    fetcher.submit("scorecard", lambda: lambda: shown.append("old match"))
+    _, run_old = pool.jobs.pop()
+
+    fetcher.new_generation()
+    fetcher.submit("scorecard", lambda: lambda: shown.append("new match"))
+    # The old match's response arrives after the switch
+    run_old()
+    pool.run_all()
+    fetcher.drain()
+    assert shown == ["new match"]
+    assert fetcher.dropped == 1
+    assert not fetcher.busy("scorecard")
+
+
+def test_new_generation_cancels_queued_jobs():
+    pool = ManualPool()
+    fetcher = FetchExecutor(pool)
+    ran = []
+    fetcher.submit("scorecard", lambda: ran.append("old"))
+    fetcher.new_generation()
+    pool.run_all()
+    assert ran == []
+    assert not fetcher.busy("scorecard")
+
+
+def test_failed_job_releases_its_key():
+    pool = ManualPool()
+    fetcher = FetchExecutor(pool)
+
+    def fail():
+        raise ValueError("bad response")
+
+    fetcher.submit("scorecard", fail)
+    _, func = pool.jobs.pop()
+    try:
+        func()
+    except ValueError:
+        pass
+    assert fetcher.drain() == 0
+    assert not fetcher.busy("scorecard")
+
+
+def test_posted_callbacks_survive_a_new_generation():
+    fetcher = FetchExecutor(ManualPool())
+    shown = []
+    fetcher.post(lambda: shown.append("status"))
+    fetcher.new_generation()
+    assert fetcher.drain() == 1
+    assert shown == ["status"]
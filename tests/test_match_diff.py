@@ -0,0 +1,97 @@
+from dataclasses import replace
+
+from match_diff import MatchChanges, diff_match_data, diff_match_list
+from scorecard import BatterLine, BowlerLine, Innings, Match, MatchHeader, Team
+
+TEAMS = (Team(1, "India", "IND"), Team(2, "Australia", "AUS"))
+
+
+def make_match(match_id=1, status="India opt to bat", innings=()):
+    header = MatchHeader(match_id, "1st T20I", "T20", "Series", 10, status, "2026-10-17", "Ground", "City",
+                         "Country", "India", "Batting", TEAMS)
+    return Match(header, tuple(innings))
+
+
+def make_innings(runs=20, batsmen=None, bowlers=None):
+    batsmen = batsmen or (BatterLine("Rohit", runs, 12, 2, 1), BatterLine("Gill", 0, 1, 0, 0))
+    bowlers = bowlers or (BowlerLine("Starc", 13, 0, runs, 0),)
+    return Innings(1, 1, "India", 13, runs, 0, tuple(batsmen), tuple(bowlers))
+
+
+def test_first_snapshot_or_another_match_is_a_full_change():
+    match = make_match(innings=[make_innings()])
+    assert diff_match_data(None, match).full
+    assert diff_match_data(match, make_match(match_id=2)).full
+
+
+def test_identical_snapshots_have_no_changes():
+    assert not diff_match_data(make_match(innings=[make_innings()]), make_match(innings=[make_innings()]))
+
+
+def test_a_run_marks_only_the_lines_involved():
+    old = make_match(innings=[make_innings(runs=20)])
+    inning = make_innings(runs=21)
+    new = make_match(innings=[replace(inning, batsmen=(inning.batsmen[0], old.innings[0].batsmen[1]))])
+
+    changes = diff_match_data(old, new)
+    assert changes.innings == {0}
+    assert changes.batsmen == {0: {"Rohit"}}
+    assert changes.bowlers == {0: {"Starc"}}
+    assert not changes.header and not changes.structure
+    assert changes.batting_changed(0) and not changes.batting_changed(1)
+
+
+def test_reordered_added_and_removed_players_are_changed():
+    rohit, gill = BatterLine("Rohit", 20, 12, 2, 1), BatterLine("Gill", 0, 1, 0, 0)
+    kohli = BatterLine("Kohli", 0, 0, 0, 0)
+    old = make_match(innings=[make_innings(batsmen=(rohit, gill))])
+
+    new = make_match(innings=[make_innings(batsmen=(gill, rohit))])
+    assert diff_match_data(old, new).batsmen == {0: {"Rohit", "Gill"}}
+
+    new = make_match(innings=[make_innings(batsmen=(rohit, kohli))])
+    assert diff_match_data(old, new).batsmen == {0: {"Gill", "Kohli"}}
+
+
+def test_new_innings_changes_the_structure():
+    old = make_match(innings=[make_innings()])
+    changes = diff_match_data(old, make_match(innings=[make_innings(), make_innings(runs=0)]))
+    assert changes.structure
+    assert 1 in changes.innings
+    assert changes.bowling_changed(0)
+
+
+def test_status_change_is_a_header_change_only():
+    old = make_match(innings=[make_innings()])
+    changes = diff_match_data(old, make_match(status="India won by 5 runs", innings=[make_innings()]))
+    assert changes.header and not changes.teams
+    assert changes.scorecard_changed()
+    assert not changes.batsmen and not changes.innings
+
+
+def test_merged_changes_keep_everything_either_saw():
+    first = MatchChanges()
+    first.batsmen = {0: {"Rohit"}}
+    second = MatchChanges()
+    second.batsmen = {0: {"Gill"}}
+    second.progress = True
+    merged = first.merge(second)
+    assert merged.batsmen == {0: {"Rohit", "Gill"}}
+    assert merged.progress
+
+
+def test_match_list_keeps_unchanged_dicts_and_reports_the_rest():
+    shown = [{"id": 1, "status": "Live"}, {"id": 2, "status": "Live"}, {"id": 3, "status": "Live"}]
+    refreshed = [{"id": 1, "status": "Live"}, {"id": 2, "status": "Stumps"}, {"id": 4, "status": "Live"}]
+
+    merged, added, updated, removed = diff_match_list(shown, refreshed)
+    assert merged[0] is shown[0]
+    assert merged[1] is refreshed[1]
+    assert [match["id"] for match in merged] == [1, 2, 4]
+    assert (added, updated, removed) == ({4}, {2}, {3})
+
+
+def test_match_list_with_nothing_shown_is_all_new():
+    merged, added, updated, removed = diff_match_list(None, [{"id": 1}])
+    assert added == {1}
+    assert not updated and not removed
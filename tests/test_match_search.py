@@ -0,0 +1,50 @@
+from match_search import MatchIndex
+
+MATCHES = [
+    {"id": 1, "team1": "India", "team2": "Australia", "series": "Border-Gavaskar Trophy", "format": "TEST",
+     "venue": "Wankhede Stadium", "city": "Mumbai"},
+    {"id": 2, "team1": "England", "team2": "Pakistan", "series": "Pakistan tour of England", "format": "ODI",
+     "venue": "Lord's", "city": "London"},
+    {"id": 3, "team1": "Sri Lanka", "team2": "New Zealand", "series": "Indian Oil Cup", "format": "T20",
+     "venue": "Holkar Stadium", "city": "Indore"},
+]
+
+
+def ids(matches):
+    return [match["id"] for match in matches]
+
+
+def test_empty_query_keeps_every_match_in_order():
+    index = MatchIndex(MATCHES)
+    assert index.filter(MATCHES, "") is MATCHES
+    assert index.filter(MATCHES, "  -- ") is MATCHES
+
+
+def test_terms_match_word_prefixes_in_any_case():
+    index = MatchIndex(MATCHES)
+    assert ids(index.filter(MATCHES, "IND")) == [1, 3]
+    assert ids(index.filter(MATCHES, "zeal")) == [3]
+    assert ids(index.filter(MATCHES, "xyz")) == []
+
+
+def test_every_term_must_match():
+    index = MatchIndex(MATCHES)
+    assert ids(index.filter(MATCHES, "england odi")) == [2]
+    assert ids(index.filter(MATCHES, "england test")) == []
+
+
+def test_team_hits_rank_above_venue_hits():
+    # Pakistan is a team in match 2 and only a venue in match 4
+    matches = [{"id": 4, "team1": "A", "team2": "B", "venue": "Pakistan Ground"}] + MATCHES
+    index = MatchIndex(matches)
+    assert ids(index.filter(matches, "pak")) == [2, 4]
+
+
+def test_whole_word_beats_a_prefix():
+    matches = [
+        {"id": 1, "team1": "Indians", "team2": "Kings"},
+        {"id": 2, "team1": "India", "team2": "Nepal"},
+    ]
+    index = MatchIndex(matches)
+    assert ids(index.filter(matches, "india")) == [2, 1]
+    assert ids(index.filter(matches, "ind")) == [1, 2]  # A tie keeps the list order
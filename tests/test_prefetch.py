@@ -0,0 +1,80 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from api_client import CricbuzzClient
+from dashboard import CricketDashboard
+from fetcher import FetchExecutor
+from rate_limiter import RequestBudget
+from response_cache import ResponseCache
+from timeline import DeliveryTimeline
+
+SCORECARD = json.dumps({"scoreCard": [], "matchHeader": {"matchId": 1, "status": "India won the toss"}}).encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Serves one scorecard with an ETag, answering 304 to requests that send it back"""
+
+    def __init__(self):
+        self.sent = []  # (url, headers) of every request
+
+    def get(self, url, headers, timeout):
+        self.sent.append((url, headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        if url.endswith("/hscard"):
+            return FakeResponse(200, SCORECARD, {"ETag": '"v1"'})
+        return FakeResponse(404)
+
+
+class Var:
+    def set(self, value):
+        self.value = value
+
+
+def make_dashboard(tmp_path):
+    """A dashboard without widgets, fetching through a fake session on one worker"""
+    dashboard = CricketDashboard.__new__(CricketDashboard)
+    dashboard.api = CricbuzzClient(budget=RequestBudget(per_minute=100, per_day=100))
+    dashboard.api.session = FakeSession()
+    dashboard.validators = {}
+    dashboard.response_cache = ResponseCache(str(tmp_path))
+    dashboard.fetcher = FetchExecutor(ThreadPoolExecutor(max_workers=1))
+    dashboard.match_id = "1"
+    dashboard.cached_data = dashboard.cached_match_id = None
+    dashboard.timeline = DeliveryTimeline()
+    dashboard.status_var = dashboard.last_updated_var = Var()
+    dashboard.apply_match_data = lambda data: None
+    dashboard.start_loading_animation = lambda: None
+    return dashboard
+
+
+def scorecard_requests(dashboard):
+    return [headers for url, headers in dashboard.api.session.sent if url.endswith("/hscard")]
+
+
+def test_first_poll_after_opening_a_prefetched_match_is_conditional(tmp_path):
+    dashboard = make_dashboard(tmp_path)
+    prefetched = dashboard._prefetch_scorecard("1")
+    dashboard._show_prefetched_scorecard(prefetched, 5)
+
+    dashboard.fetch_data()
+    dashboard.fetcher.pool.shutdown(wait=True)
+    first, second = scorecard_requests(dashboard)
+    assert "If-None-Match" not in first
+    assert second["If-None-Match"] == '"v1"'
+
+
+def test_prefetch_that_is_never_shown_leaves_the_validators_alone(tmp_path):
+    dashboard = make_dashboard(tmp_path)
+    dashboard._prefetch_scorecard("1")
+    assert dashboard.validators == {}
@@ -0,0 +1,82 @@
+import pytest
+
+from rate_limiter import QuotaExhausted, RequestBudget, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Response:
+    def __init__(self, status_code=200, remaining=None):
+        self.status_code = status_code
+        self.headers = {} if remaining is None else {"X-RateLimit-Requests-Remaining": str(remaining)}
+
+
+def test_bucket_refills_evenly_up_to_capacity():
+    clock = Clock()
+    bucket = TokenBucket(6, 60, clock)
+    assert all(bucket.take() for _ in range(6))
+    assert not bucket.take()
+    assert bucket.wait_time() == pytest.approx(10)
+
+    clock.now = 25
+    assert bucket.available() == 2
+    clock.now = 3600
+    assert bucket.available() == 6
+
+
+def test_budget_refuses_past_the_minute_limit_without_spending_the_day():
+    clock = Clock()
+    budget = RequestBudget(per_minute=3, per_day=100, clock=clock)
+    for _ in range(3):
+        budget.acquire()
+    with pytest.raises(QuotaExhausted, match="Per-minute"):
+        budget.acquire()
+    assert budget.remaining() == 97
+
+    clock.now = 20
+    budget.acquire()
+
+
+def test_budget_refuses_once_the_day_is_spent():
+    budget = RequestBudget(per_minute=100, per_day=2, clock=Clock())
+    budget.acquire()
+    budget.acquire()
+    with pytest.raises(QuotaExhausted, match="Daily"):
+        budget.acquire()
+
+
+def test_quota_exhausted_is_a_request_exception():
+    # Callers that handle network errors also handle a refused request
+    import requests
+    assert issubclass(QuotaExhausted, requests.RequestException)
+
+
+def test_sync_trusts_the_server_count_and_backs_off_after_a_429():
+    budget = RequestBudget(per_minute=30, per_day=500, clock=Clock())
+    budget.sync(Response(remaining=40))
+    assert budget.remaining() == 40
+
+    budget.sync(Response(remaining=400))  # The server count never raises the budget
+    assert budget.remaining() == 40
+
+    budget.sync(Response(status_code=429))
+    with pytest.raises(QuotaExhausted):
+        budget.acquire()
+
+
+def test_interval_stretches_as_the_day_runs_low():
+    clock = Clock()
+    budget = RequestBudget(per_minute=10 ** 6, per_day=100, clock=clock)
+    assert budget.stretch_interval(60) == 60
+
+    budget.sync(Response(remaining=25))
+    assert budget.stretch_interval(60) == pytest.approx(120, rel=0.01)
+
+    budget.sync(Response(remaining=0))
+    assert budget.stretch_interval(60) >= 864  # At least until the next request is allowed
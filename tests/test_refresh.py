@@ -0,0 +1,147 @@
+import pytest
+
+from fake_tk import FakeTk
+from refresh import MAX_BACKOFF, STATE_INTERVALS, RefreshTimer, match_state
+
+
+def make_timer(interval=60, changed=True):
+    """A timer whose polls report back at once, and the times (ms) they ran at"""
+    tk_fake = FakeTk()
+    polls = []
+
+    def poll():
+        polls.append(tk_fake.now)
+        timer.record(changed=changed)
+
+    timer = RefreshTimer(tk_fake.after, tk_fake.after_cancel, poll, interval)
+    return tk_fake, timer, polls
+
+
+def test_one_poll_per_interval():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    tk_fake.run_until(600 * 1000)
+    assert polls == [60 * 1000 * i for i in range(1, 11)]
+    assert len(tk_fake.jobs) == 1
+
+
+def test_toggling_never_stacks_timers():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    for _ in range(5):
+        timer.stop()
+        assert not tk_fake.jobs
+        timer.start()
+        assert len(tk_fake.jobs) == 1
+    timer.start()  # Starting an enabled timer re-arms it rather than adding a second one
+    assert len(tk_fake.jobs) == 1
+
+    tk_fake.run_until(300 * 1000)
+    assert polls == [60 * 1000 * i for i in range(1, 6)]
+
+
+def test_stopped_timer_does_not_poll():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    timer.stop()
+    tk_fake.run_until(600 * 1000)
+    assert polls == []
+
+    # A poll already in flight when auto-refresh was turned off does not re-arm it
+    timer.record(changed=True)
+    assert not tk_fake.jobs
+
+
+def test_manual_refresh_replaces_the_pending_poll():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    tk_fake.run_until(30 * 1000)
+
+    # A manual refresh reports back through record() like any poll
+    timer.record(changed=True)
+    assert len(tk_fake.jobs) == 1
+    tk_fake.run_until(200 * 1000)
+    assert polls == [90 * 1000, 150 * 1000]
+
+
+def test_budget_exhausted_reschedule_keeps_one_job():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    for _ in range(3):
+        timer.schedule()
+    assert len(tk_fake.jobs) == 1
+    tk_fake.run_until(120 * 1000)
+    assert polls == [60 * 1000, 120 * 1000]
+
+
+def test_at_most_one_pending_job_throughout():
+    tk_fake, timer, polls = make_timer()
+    timer.start()
+    for second in range(1, 3600):
+        if second % 97 == 0:
+            timer.stop()
+        elif second % 89 == 0:
+            timer.start()
+        elif second % 41 == 0:
+            timer.record(changed=True)
+        tk_fake.run_until(second * 1000)
+        assert len(tk_fake.jobs) <= 1
+        assert timer.pending == bool(tk_fake.jobs)
+
+
+@pytest.mark.parametrize("status, state", [
+    ("Day 1: Session 2", "live"),
+    ("Innings Break", "innings_break"),
+    ("Day 2: Lunch Break", "break"),
+    ("Day 1: Tea Break", "break"),
+    ("Rain stops play", "rain"),
+    ("Day 1: Stumps", "stumps"),
+    ("India won the toss and opted to bat", "live"),
+    ("Australia won the toss and opted to bowl - Rain stops play", "rain"),
+    ("India won by 6 wickets", "complete"),
+    ("England won by an innings and 12 runs", "complete"),
+    ("Match drawn", "complete"),
+    ("Match tied (India won the Super Over)", "complete"),
+    ("No result due to rain", "complete"),
+    ("Match abandoned due to rain", "complete"),
+    ("", "live")
+])
+def test_match_state(status, state):
+    assert match_state(status) == state
+
+
+def test_interval_follows_match_state():
+    tk_fake, timer, polls = make_timer()
+    for state, factor in STATE_INTERVALS.items():
+        timer.record(changed=True, state=state)
+        assert timer.interval() == 60 * factor
+
+    timer.start()
+    timer.record(changed=True, state="complete")
+    assert timer.interval() is None
+    assert not tk_fake.jobs
+
+
+def test_state_intervals_scale_with_a_short_interval():
+    # e.g. --replay --speed 60 --refresh 1: a break must not stall the replay for real minutes
+    tk_fake, timer, polls = make_timer(interval=1)
+    timer.record(changed=True, state="stumps")
+    assert timer.interval() == STATE_INTERVALS["stumps"]
+    timer.record(failed=True, state="live")
+    timer.record(failed=True)
+    assert timer.interval() == 4
+
+
+def test_quiet_polls_and_failures_slow_polling():
+    tk_fake, timer, polls = make_timer(changed=False)
+    timer.start()
+    tk_fake.run_until(3600 * 1000)
+    gaps = [later - earlier for earlier, later in zip(polls, polls[1:])]
+    assert gaps == sorted(gaps)
+    assert max(gaps) == 4 * 60 * 1000
+
+    timer.record(changed=True)
+    assert timer.interval() == 60
+    for failures in range(1, 6):
+        timer.record(failed=True)
+        assert timer.interval() == 60 * min(2 ** failures, MAX_BACKOFF)
@@ -0,0 +1,47 @@
+from fake_tk import FakeTk
+from render_scheduler import RenderScheduler
+
+
+def make_scheduler():
+    tk_fake = FakeTk()
+    render = RenderScheduler(tk_fake.after, tk_fake.after_cancel, fps=30, clock=lambda: tk_fake.now / 1000)
+    return tk_fake, render
+
+
+def test_updates_invalidated_between_frames_run_once():
+    tk_fake, render = make_scheduler()
+    runs = []
+    for i in range(3):
+        render.invalidate("chart", lambda i=i: runs.append(i))
+    tk_fake.run_until(1000)
+    assert runs == [2]
+    assert render.collapsed == 2
+
+
+def test_close_cancels_timed_updates():
+    tk_fake, render = make_scheduler()
+    runs = []
+
+    def animate():
+        runs.append(tk_fake.now)
+        render.invalidate_after(50, "loading", animate)
+
+    render.invalidate("loading", animate)
+    render.invalidate_after(300, "flash", lambda: runs.append("flash"))
+    tk_fake.run_until(120)
+    render.close()
+    ticks = len(runs)
+    tk_fake.run_until(10 * 1000)
+    assert len(runs) == ticks
+    assert "flash" not in runs
+    assert not tk_fake.jobs
+
+
+def test_cancelled_timed_update_never_runs():
+    tk_fake, render = make_scheduler()
+    runs = []
+    job = render.invalidate_after(100, "flash", lambda: runs.append("flash"))
+    render.cancel(job)
+    tk_fake.run_until(1000)
+    assert runs == []
+    assert not tk_fake.jobs
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+import response_cache
+from response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_entry_is_fresh_until_its_endpoint_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), ttls={"hscard": 30})
+    cache.put("hscard", 1, {"runs": 10})
+
+    clock[0] += 29
+    entry = cache.get("hscard", 1)
+    assert entry["payload"] == {"runs": 10}
+    assert entry["fresh"]
+
+    clock[0] += 2
+    entry = cache.get("hscard", 1)
+    assert entry["age"] == 31
+    assert not entry["fresh"]  # Stale entries are still served
+
+
+def test_unknown_endpoint_is_never_fresh(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("other", 1, {})
+    assert not cache.get("other", 1)["fresh"]
+    assert cache.get("other", 2) is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("hscard", 1, {"pad": "x" * 100})
+    cache.max_bytes = 2.5 * cache._index["hscard-1.json"][0]
+    clock[0] += 1
+    cache.put("hscard", 2, {"pad": "x" * 100})
+    clock[0] += 1
+    cache.get("hscard", 1)  # Now 2 is the least recently used
+    clock[0] += 1
+    cache.put("hscard", 3, {"pad": "x" * 100})
+
+    assert cache.get("hscard", 2) is None
+    assert not os.path.exists(tmp_path / "hscard-2.json")
+    assert cache.get("hscard", 1) is not None
+    assert cache.get("hscard", 3) is not None
+
+
+def test_lru_order_survives_a_restart(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("hscard", 1, {})
+    cache.put("hscard", 2, {})
+    # Reads stamp the file's mtime, which a new cache indexes by
+    clock[0] = os.path.getmtime(tmp_path / "hscard-2.json") + 60
+    cache.get("hscard", 1)
+
+    reopened = ResponseCache(str(tmp_path))
+    order = sorted(reopened._index, key=lambda name: reopened._index[name][1])
+    assert order == ["hscard-2.json", "hscard-1.json"]
+
+
+def test_put_replaces_the_file_without_leaving_temporaries(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("live", "all", {"v": 1})
+    cache.put("live", "all", {"v": 2})
+    assert os.listdir(tmp_path) == ["live-all.json"]
+    assert cache.get("live", "all")["payload"] == {"v": 2}
+
+
+def test_failed_write_keeps_the_previous_entry(tmp_path, clock, monkeypatch):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("live", "all", {"v": 1})
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(response_cache.os, "replace", fail)
+    cache.put("live", "all", {"v": 2})
+    monkeypatch.undo()
+
+    assert os.listdir(tmp_path) == ["live-all.json"]
+    assert cache.get("live", "all")["payload"] == {"v": 1}
+
+
+def test_unfinished_writes_and_corrupt_entries_are_dropped(tmp_path, clock):
+    (tmp_path / "abc.tmp").write_text("{")
+    cache = ResponseCache(str(tmp_path))
+    assert not (tmp_path / "abc.tmp").exists()
+
+    cache.put("hscard", 1, {})
+    (tmp_path / "hscard-1.json").write_text("{not json")
+    assert cache.get("hscard", 1) is None
+    assert not (tmp_path / "hscard-1.json").exists()
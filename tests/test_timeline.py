@@ -0,0 +1,89 @@
+import numpy as np
+
+from timeline import DeliveryTimeline, lttb, parse_commentary, parse_delivery
+
+
+def separator(innings_id, over_num, summary, score=None):
+    return {"overSeparator": {"inningsId": innings_id, "overNum": over_num, "o_summary": summary, "score": score}}
+
+
+def test_delivery_tokens():
+    assert parse_delivery("4") == (4, False, True)
+    assert parse_delivery("W") == (0, True, True)
+    assert parse_delivery("Wd") == (1, False, False)
+    assert parse_delivery("5Wd") == (5, False, False)
+    assert parse_delivery("1Lb") == (1, False, True)
+    assert parse_delivery("Nb") == (1, False, False)
+    assert parse_delivery("") is None
+    assert parse_delivery("x") is None
+
+
+def test_commentary_keeps_completed_overs_in_order():
+    data = {"commentaryList": [
+        {"commText": "FOUR!"},
+        separator(1, 2, "1 0 4 0 0 W", 12),
+        separator(1, 0.6, "1 1 1 1 1 1", 6),
+        separator(1, 0.6, "1 1 1 1 1 1", 6),  # Sent twice
+        separator(2, 1, "Wd 0 0 0 0 0 0", 1),
+    ]}
+    overs = parse_commentary(data)
+    assert [(innings_id, over) for innings_id, over, _, _ in overs] == [(1, 1), (1, 2), (2, 1)]
+    assert overs[1] == (1, 2, 12, [(1, False, True), (0, False, True), (4, False, True), (0, False, True),
+                                  (0, False, True), (0, True, True)])
+    assert parse_commentary({}) == []
+
+
+def test_extend_fills_the_per_over_columns():
+    timeline = DeliveryTimeline()
+    added = timeline.extend(parse_commentary({"commentaryList": [
+        separator(1, 1, "1 1 1 1 1 1", 6),
+        separator(1, 2, "4 W Wd 0 0 0 0", 11),
+    ]}))
+    assert added == len(timeline) == 13
+    assert list(timeline.over_runs(1)) == [6, 5]
+    assert list(timeline.over_wickets(1)) == [0, 1]
+    assert list(timeline.worm(1)) == [6, 11]
+    assert timeline.legal.values.sum() == 12
+
+
+def test_extend_skips_overs_already_stored():
+    timeline = DeliveryTimeline()
+    overs = parse_commentary({"commentaryList": [separator(1, 1, "1 1 1 1 1 1", 6)]})
+    timeline.extend(overs)
+    assert timeline.extend(overs) == 0
+    assert len(timeline) == 6
+
+
+def test_missed_overs_leave_a_gap_and_scores_carry_on():
+    timeline = DeliveryTimeline()
+    timeline.extend([(1, 1, 6, [(6, False, True)]), (1, 3, 20, [(2, False, True)]), (1, 4, None, [(4, False, True)])])
+    worm = timeline.worm(1)
+    assert worm[0] == 6 and np.isnan(worm[1])
+    assert list(worm[2:]) == [20, 24]
+    assert list(timeline.over_runs(1)) == [6, 0, 2, 4]
+    assert len(timeline.over_runs(2)) == 0
+
+
+def test_lttb_keeps_the_endpoints_and_the_threshold_count():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50)
+    kept_x, kept_y = lttb(x, y, 100)
+    assert len(kept_x) == len(kept_y) == 100
+    assert kept_x[0] == 0 and kept_x[-1] == 999
+    assert np.all(np.diff(kept_x) > 0)
+    assert np.array_equal(kept_y, y[kept_x.astype(int)])
+
+
+def test_lttb_keeps_a_spike():
+    x = np.arange(500, dtype=np.float64)
+    y = np.zeros(500)
+    y[237] = 50
+    kept_x, kept_y = lttb(x, y, 20)
+    assert 237 in kept_x
+    assert kept_y.max() == 50
+
+
+def test_lttb_leaves_short_series_alone():
+    x = np.arange(10, dtype=np.float64)
+    assert lttb(x, x, 10)[0] is x
+    assert lttb(x, x, 2)[0] is x
@@ -0,0 +1,299 @@
+import re
+
+import numpy as np
+
+from scorecard import overs_to_balls
+
+# One delivery in an over summary such as "1 0 4 Wd W 6": runs, an optional extra and W for a wicket
+DELIVERY = re.compile(r"(\d*)(Wd|Nb|Lb|B)?(W)?$")
+
+# Extras that cost a run on their own and don't count as one of the over's six balls
+ILLEGAL_EXTRAS = ("Wd", "Nb")
+
+# Phases of a limited-overs innings as [first over, last over) slices of the per-over columns
+PHASES = {
+    "powerplay": (0, 10),
+    "middle": (10, 40),
+    "death": (40, None)
+}
+
+# Samples kept per innings when progress comes from scorecard polls (a day of polling every 20s)
+SERIES_CAPACITY = 4096
+
+# Most points drawn per innings on the progress chart
+PROGRESS_POINTS = 300
+
+
+def parse_delivery(token):
+    """(runs, wicket, legal) for one over-summary token, or None if it isn't a delivery"""
+    match = DELIVERY.match(token)
+    if match is None or not token:
+        return None
+    digits, extra, wicket = match.groups()
+    runs = int(digits) if digits else 1 if extra in ILLEGAL_EXTRAS else 0
+    return runs, bool(wicket), extra not in ILLEGAL_EXTRAS
+
+
+def parse_commentary(api_data):
+    """Completed overs in a commentary response as sorted (innings ID, over, score, deliveries) tuples
+
+    Cricbuzz marks the end of each over with an overSeparator carrying the over's
+    ball-by-ball summary and the innings score, so only finished overs are returned.
+    """
+    overs = {}
+    for item in api_data.get("commentaryList", []):
+        separator = item.get("overSeparator")
+        if not separator:
+            continue
+        innings_id = separator.get("inningsId", item.get("inningsId", 0))
+        over = -(-overs_to_balls(separator.get("overNum", 0)) // 6)  # 19.6 and 20 are both the 20th over
+        deliveries = [d for d in map(parse_delivery, separator.get("o_summary", "").split()) if d]
+        overs[(innings_id, over)] = (innings_id, over, separator.get("score"), deliveries)
+    return [overs[key] for key in sorted(overs)]
+
+
+class Column:
+    """A NumPy array that grows by doubling, so appends are amortised O(1)"""
+
+    def __init__(self, dtype, fill=0, capacity=64):
+        self.fill = fill
+        self.size = 0
+        self._data = np.full(capacity, fill, dtype=dtype)
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, size):
+        if size > len(self._data):
+            data = np.full(max(size, 2 * len(self._data)), self.fill, dtype=self._data.dtype)
+            data[:self.size] = self._data[:self.size]
+            self._data = data
+
+    def append(self, value):
+        self._reserve(self.size + 1)
+        self._data[self.size] = value
+        self.size += 1
+
+    def set(self, index, value):
+        """Set an element, growing the column (with the fill value) to reach it"""
+        self._reserve(index + 1)
+        self._data[index] = value
+        self.size = max(self.size, index + 1)
+
+    @property
+    def values(self):
+        """The stored elements (a view - copy it before keeping it)"""
+        return self._data[:self.size]
+
+
+class DeliveryTimeline:
+    """Append-only ball-by-ball record of a match, with per-over columns for each innings"""
+
+    def __init__(self, match_id=None):
+        self.match_id = match_id
+
+        # One row per delivery
+        self.innings = Column(np.int8)
+        self.over = Column(np.int16)
+        self.runs = Column(np.int16)
+        self.wicket = Column(np.bool_)
+        self.legal = Column(np.bool_)
+
+        # Innings ID -> one row per over (index 0 is the first over). Overs the feed never
+        # showed us keep a score of NaN so charts leave a gap instead of dropping to zero
+        self._over_runs = {}
+        self._over_wickets = {}
+        self._over_score = {}
+
+        self.last = None  # (innings ID, over) of the newest over stored
+
+    def __len__(self):
+        return len(self.runs)
+
+    def extend(self, overs):
+        """Append the deliveries of overs newer than the last one stored; returns how many were added"""
+        added = 0
+        for innings_id, over, score, deliveries in overs:
+            if self.last is not None and (innings_id, over) <= self.last:
+                continue
+            self.last = (innings_id, over)
+
+            for runs, wicket, legal in deliveries:
+                self.innings.append(innings_id)
+                self.over.append(over)
+                self.runs.append(runs)
+                self.wicket.append(wicket)
+                self.legal.append(legal)
+            added += len(deliveries)
+
+            if innings_id not in self._over_runs:
+                self._over_runs[innings_id] = Column(np.int32)
+                self._over_wickets[innings_id] = Column(np.int16)
+                self._over_score[innings_id] = Column(np.float64, fill=np.nan)
+            runs = sum(d[0] for d in deliveries)
+            self._over_runs[innings_id].set(over - 1, runs)
+            self._over_wickets[innings_id].set(over - 1, sum(d[1] for d in deliveries))
+
+            # Without a score from the feed, carry on from the previous over's
+            scores = self._over_score[innings_id]
+            if score is None and 1 < over <= len(scores) + 1:
+                score = scores.values[over - 2] + runs
+            if score is not None:
+                scores.set(over - 1, score)
+        return added
+
+    def over_runs(self, innings_id):
+        """Runs scored in each over of an innings"""
+        column = self._over_runs.get(innings_id)
+        return column.values if column is not None else np.zeros(0, dtype=np.int32)
+
+    def over_wickets(self, innings_id):
+        """Wickets that fell in each over of an innings"""
+        column = self._over_wickets.get(innings_id)
+        return column.values if column is not None else np.zeros(0, dtype=np.int16)
+
+    def worm(self, innings_id):
+        """Innings score at the end of each over (NaN for overs that weren't seen)"""
+        column = self._over_score.get(innings_id)
+        return column.values if column is not None else np.zeros(0)
+
+    def curve(self, innings_id):
+        """The innings' worm as a ProgressCurve, one point at the end of each over"""
+        worm = self.worm(innings_id)
+        return ProgressCurve(np.arange(1, len(worm) + 1, dtype=np.float64), worm.copy())
+
+
+def lttb(x, y, threshold):
+    """Downsample a series to threshold points with Largest-Triangle-Three-Buckets
+
+    Keeps the first and last points, and from each bucket in between the point that
+    forms the largest triangle with the point kept before it and the average of the
+    next bucket, so peaks and collapses survive the downsampling.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    every = (n - 2) / (threshold - 2)
+    kept = np.zeros(threshold, dtype=np.int64)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        kept[i + 1] = a
+    kept[-1] = n - 1
+    return x[kept], y[kept]
+
+
+class ProgressCurve:
+    """An innings' score against overs, with the phase and per-over figures the progress tab shows"""
+
+    def __init__(self, overs, scores):
+        self.overs = overs
+        self.scores = scores
+
+        # Interpolation points, starting from 0 for 0 and skipping overs with no score
+        known = ~np.isnan(scores)
+        self._x = np.concatenate(([0.0], overs[known]))
+        self._y = np.concatenate(([0.0], scores[known]))
+
+    def __len__(self):
+        return len(self.overs)
+
+    @property
+    def last_over(self):
+        """Overs completed at the latest known score"""
+        return float(self._x[-1])
+
+    def score_at(self, overs):
+        """Score at the given over(s), interpolated between known points"""
+        return np.interp(overs, self._x, self._y)
+
+    def phase_runs(self):
+        """Runs scored in each phase of the innings so far, keyed like PHASES"""
+        last = self.last_over
+        runs = {}
+        for phase, (start, end) in PHASES.items():
+            end = last if end is None else min(end, last)
+            runs[phase] = int(round(self.score_at(end) - self.score_at(min(start, end))))
+        return runs
+
+    def over_runs(self):
+        """Runs scored in each completed over (estimated between samples that aren't on over boundaries)"""
+        return np.rint(np.diff(self.score_at(np.arange(int(self.last_over) + 1)))).astype(np.int64)
+
+
+class ScoreSeries:
+    """Ring buffer of (timestamp, balls, runs, wickets) samples of one innings, oldest overwritten first"""
+
+    def __init__(self, capacity=SERIES_CAPACITY):
+        self.timestamps = np.zeros(capacity)
+        self.balls = np.zeros(capacity, dtype=np.int32)
+        self.runs = np.zeros(capacity, dtype=np.int32)
+        self.wickets = np.zeros(capacity, dtype=np.int8)
+        self.start = 0  # Index of the oldest sample
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, timestamp, balls, runs, wickets):
+        """Add a sample, returning False if the score hasn't moved since the last one"""
+        capacity = len(self.timestamps)
+        if self.size:
+            last = (self.start + self.size - 1) % capacity
+            if (self.balls[last], self.runs[last], self.wickets[last]) == (balls, runs, wickets):
+                return False
+
+        i = (self.start + self.size) % capacity
+        if self.size == capacity:
+            self.start = (self.start + 1) % capacity
+        else:
+            self.size += 1
+        self.timestamps[i] = timestamp
+        self.balls[i] = balls
+        self.runs[i] = runs
+        self.wickets[i] = wickets
+        return True
+
+    def ordered(self, column):
+        """A column's samples oldest first"""
+        if self.start + self.size <= len(column):
+            return column[self.start:self.start + self.size]
+        return np.concatenate((column[self.start:], column[:(self.start + self.size) % len(column)]))
+
+    def curve(self, max_points=PROGRESS_POINTS):
+        """Score against overs as a ProgressCurve, downsampled to at most max_points"""
+        overs, scores = lttb(self.ordered(self.balls) / 6, self.ordered(self.runs).astype(np.float64), max_points)
+        return ProgressCurve(overs, scores)
+
+
+class ScoreHistory:
+    """Sampled score series for every innings of one match, built from scorecard polls"""
+
+    def __init__(self, match_id=None, capacity=SERIES_CAPACITY):
+        self.match_id = match_id
+        self.capacity = capacity
+        self.series = {}  # Innings ID -> ScoreSeries
+
+    def record(self, match, timestamp):
+        """Sample every innings of a processed snapshot; returns True if any score moved"""
+        added = False
+        for inning in match.innings:
+            series = self.series.get(inning.innings_id)
+            if series is None:
+                series = self.series[inning.innings_id] = ScoreSeries(self.capacity)
+            added = series.append(timestamp, inning.balls, inning.runs, inning.wickets) or added
+        return added
+
+    def curve(self, innings_id, max_points=PROGRESS_POINTS):
+        """ProgressCurve for an innings (empty if it was never sampled)"""
+        series = self.series.get(innings_id)
+        if series is None:
+            return ProgressCurve(np.zeros(0), np.zeros(0))
+        return series.curve(max_points)